@@ -0,0 +1,92 @@
+"""Speed of the breadth-first path search engine.
+
+Compares the current frontier, a deque with the set of the paths waiting in it, against the
+previous one, a list consumed with 'pop(0)' and deduplicated rebuilding a set of the whole
+frontier on every step, without pruning the branches that can not reach the target. Both
+engines explore the same random graph with 10000 nodes for a fixed number of iterations, so
+the frontier keeps growing.
+
+Run it from the root of the repository:
+    python benchmarks/bench_find_paths.py
+"""
+
+import random
+import time
+import warnings
+
+from pywgraph import Path, PathExplorerPlus, WeightedDirectedGraph
+
+N_NODES = 10_000
+OUT_DEGREE = 3
+ITERATIONS = [1_000, 5_000, 20_000]
+
+
+class _ListFrontierGraph(WeightedDirectedGraph):
+    """Graph whose path search uses the previous list based frontier."""
+
+    def _find_paths(
+        self,
+        start,
+        end,
+        general_max_visitations=1,
+        specific_max_visitations={},
+        max_iter=1_000,
+        max_paths=None,
+        max_weight=None,
+    ):
+        explorers = [PathExplorerPlus(Path([start]), self.group.identity)]
+        all_paths = []
+        it = 1
+        while explorers and (it < max_iter) and (max_paths is None or len(all_paths) < max_paths):
+            discovered_path, discovered_explorers, _ = self._iter_aux(
+                explorers.pop(0),
+                end,
+                general_max_visitations,
+                specific_max_visitations,
+                max_weight,
+            )
+            all_paths.extend(discovered_path)
+            explorers.extend(list(set(discovered_explorers) - set(explorers)))
+            it += 1
+        return all_paths
+
+
+def _random_tuples() -> list[tuple[str, str, float]]:
+    rng = random.Random(0)
+    tuples = []
+    for i in range(N_NODES):
+        for j in rng.sample(range(N_NODES), OUT_DEGREE):
+            if i != j:
+                tuples.append((f"node_{i}", f"node_{j}", rng.uniform(0.5, 2.0)))
+    return tuples
+
+
+def _seconds(graph: WeightedDirectedGraph, max_iter: int) -> tuple[float, int]:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        start_time = time.perf_counter()
+        paths = graph.find_paths("node_0", "node_1", max_iter=max_iter)
+        return time.perf_counter() - start_time, len(paths)
+
+
+def main() -> None:
+    tuples = _random_tuples()
+    graph = WeightedDirectedGraph.from_tuples(tuples)
+    list_graph = _ListFrontierGraph.from_tuples(tuples)
+
+    print(f"Random graph with {N_NODES} nodes and {len(tuples)} edges\n")
+    print(
+        f"{'iterations':>10} | {'list (s)':>10} | {'deque (s)':>10} | {'speedup':>8} | "
+        f"{'pruned':>8}"
+    )
+    for max_iter in ITERATIONS:
+        list_seconds, _ = _seconds(list_graph, max_iter)
+        deque_seconds, _ = _seconds(graph, max_iter)
+        print(
+            f"{max_iter:>10} | {list_seconds:>10.3f} | {deque_seconds:>10.3f} | "
+            f"{list_seconds / deque_seconds:>7.1f}x | {graph.last_search_stats.pruned:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Memory footprint of the edge and path objects.
+
+Compares the current slotted classes against equivalent classes that keep their attributes
+in an instance '__dict__', which is the previous layout (before '__slots__' were added).
+
+Run it from the root of the repository:
+    python benchmarks/bench_memory.py
+"""
+
+import tracemalloc
+from typing import Any, Callable
+
+from pywgraph import CommonGroups, Path, PathExplorerPlus, WeightedDirectedEdge
+
+N_OBJECTS = 100_000
+_group = CommonGroups.RealMultiplicative
+
+
+class _DictWeightedDirectedEdge:
+    def __init__(self, start: str, end: str, weight: Any, group: Any) -> None:
+        self._start = start
+        self._end = end
+        self._weight = weight
+        self._group = group
+
+
+class _DictPath(list):
+    pass
+
+
+class _DictPathExplorerPlus:
+    def __init__(self, path: Any, weight: Any, visitations: dict[str, int]) -> None:
+        self._path = path
+        self._weight = weight
+        self._visitations = visitations
+
+
+def _bytes_per_object(factory: Callable[[int], Any]) -> float:
+    """Returns the memory allocated per object, excluding the objects shared by all of them."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory(i) for i in range(N_OBJECTS)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (after - before) / N_OBJECTS
+
+
+def main() -> None:
+    names = [f"node_{i}" for i in range(N_OBJECTS + 1)]
+    weights = [float(i) for i in range(N_OBJECTS)]
+    visitations = {"node_0": 1}
+    path = Path(names[:3])
+
+    cases = [
+        (
+            "WeightedDirectedEdge",
+            lambda i: _DictWeightedDirectedEdge(names[i], names[i + 1], weights[i], _group),
+            lambda i: WeightedDirectedEdge(names[i], names[i + 1], weights[i], _group),
+        ),
+        (
+            "Path (3 nodes)",
+            lambda i: _DictPath(names[i : i + 3]),
+            lambda i: Path(names[i : i + 3]),
+        ),
+        (
+            "PathExplorerPlus",
+            lambda i: _DictPathExplorerPlus(path, weights[i], visitations),
+            lambda i: PathExplorerPlus(path, weights[i], visitations),
+        ),
+    ]
+
+    print(f"{'Object':<22}{'__dict__ (B)':>14}{'__slots__ (B)':>15}{'Saving':>9}")
+    for name, dict_factory, slots_factory in cases:
+        dict_bytes = _bytes_per_object(dict_factory)
+        slots_bytes = _bytes_per_object(slots_factory)
+        saving = 1 - slots_bytes / dict_bytes
+        print(f"{name:<22}{dict_bytes:>14.1f}{slots_bytes:>15.1f}{saving:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
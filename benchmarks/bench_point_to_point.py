@@ -0,0 +1,74 @@
+"""Nodes settled by point to point shortest path queries.
+
+Compares 'Dijkstra', which stops once the end node is settled, with 'BidirectionalDijkstra'
+and with 'AStar' using 8 landmarks on a road-like graph: a square grid whose edges go both
+ways with random weights. They answer the same random queries and the table shows the nodes
+settled and the time per query. The time to compute the landmarks is not included.
+
+Run it from the root of the repository:
+    python benchmarks/bench_point_to_point.py
+"""
+
+import random
+import time
+
+from pywgraph import (
+    AStar,
+    BidirectionalDijkstra,
+    CommonGroups,
+    Dijkstra,
+    LandmarkHeuristic,
+    WeightedDirectedGraph,
+)
+
+GRID_SIZES = [50, 100, 200]
+QUERIES = 50
+LANDMARKS = 8
+
+
+def _grid(size: int) -> WeightedDirectedGraph:
+    rng = random.Random(0)
+    tuples = []
+    for i in range(size):
+        for j in range(size):
+            for di, dj in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+                if 0 <= i + di < size and 0 <= j + dj < size:
+                    tuples.append((f"{i},{j}", f"{i + di},{j + dj}", rng.uniform(1.0, 2.0)))
+    return WeightedDirectedGraph.from_tuples(tuples, CommonGroups.RealAdditive)
+
+
+def main() -> None:
+    print(
+        f"{'grid':>8} | {'nodes settled (dijkstra / bidir. / A*)':>38} | "
+        f"{'ms per query (dijkstra / bidir. / A*)':>37}"
+    )
+    for size in GRID_SIZES:
+        graph = _grid(size)
+        finders = [
+            BidirectionalDijkstra(graph),
+            AStar(graph, LandmarkHeuristic(graph, LANDMARKS)),
+        ]
+        rng = random.Random(1)
+        nodes = sorted(graph.nodes)
+        settled = [0, 0, 0]
+        seconds = [0.0, 0.0, 0.0]
+        for _ in range(QUERIES):
+            start, end = rng.sample(nodes, 2)
+            start_time = time.perf_counter()
+            dijkstra = Dijkstra(graph, start)
+            dijkstra.shortest_path(start, end)
+            seconds[0] += time.perf_counter() - start_time
+            settled[0] += sum(1 for row in dijkstra.table.values() if row)
+            for position, finder in enumerate(finders, 1):
+                start_time = time.perf_counter()
+                finder.shortest_path(start, end)
+                seconds[position] += time.perf_counter() - start_time
+                settled[position] += finder.last_settled
+
+        settled_columns = " / ".join(f"{total // QUERIES:>10}" for total in settled)
+        seconds_columns = " / ".join(f"{1000 * total / QUERIES:>9.1f}" for total in seconds)
+        print(f"{size:>4}x{size:<3} | {settled_columns} | {seconds_columns}")
+
+
+if __name__ == "__main__":
+    main()
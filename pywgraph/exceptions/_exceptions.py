@@ -7,8 +7,11 @@ class NodeNotFound(Exception):
 class NodeAlreadyExists(Exception):
     """Exception raised when a node already exists in a graph."""
 
-    def __init__(self, node: str) -> None:
-        super().__init__(f"Node {node} already exists in the graph.")
+    def __init__(self, node: str | set[str]) -> None:
+        if isinstance(node, set):
+            super().__init__(f"Nodes {node} already exist in the graph.")
+        else:
+            super().__init__(f"Node {node} already exists in the graph.")
 
 class EdgeAlreadyExists(Exception):
     """Exception raised when an edge already exists in a graph."""
@@ -16,7 +19,36 @@ class EdgeAlreadyExists(Exception):
     def __init__(self, start: str, end: str) -> None:
         super().__init__(f"Edge {start} -> {end} already exists in the graph.")
 
+class EdgesAlreadyExist(EdgeAlreadyExists):
+    """Exception raised when several edges already exist in a graph or are given twice
+    with different weights."""
+
+    def __init__(self, edges: set[tuple[str, str]]) -> None:
+        self.edges = edges
+        Exception.__init__(self, f"Edges {edges} already exist in the graph.")
+
 class EdgeNotFound(Exception):
     """Exception raised when an edge is not found in a graph."""
     def __init__(self, start: str, end: str) -> None:
-        super().__init__(f"Edge {start} -> {end} not found in the graph.")
\ No newline at end of file
+        super().__init__(f"Edge {start} -> {end} not found in the graph.")
+
+class EdgesNotFound(EdgeNotFound):
+    """Exception raised when several edges are not found in a graph."""
+
+    def __init__(self, edges: set[tuple[str, str]]) -> None:
+        self.edges = edges
+        Exception.__init__(self, f"Edges {edges} not found in the graph.")
+
+class PathNotFound(Exception):
+    """Exception raised when there is no path between two nodes of a graph."""
+
+    def __init__(self, start: str, end: str) -> None:
+        super().__init__(f"There is no path from {start} to {end} in the graph.")
+
+class NegativeCycleFound(Exception):
+    """Exception raised when shortest paths are not defined because the graph has a cycle whose
+    weight is below the identity of the group. The cycle is kept in the 'cycle' attribute."""
+
+    def __init__(self, cycle) -> None:
+        self.cycle = cycle
+        super().__init__(f"The graph has a cycle whose weight is below the identity: {cycle}.")
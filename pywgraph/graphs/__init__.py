@@ -1,5 +1,8 @@
 from ._edge import *
 from ._graph import *
+from ._frozen import *
 from ._paths import *
+from ._node_index import *
+from ._views import *
 
 __all__ = [s for s in dir() if not s.startswith("_")]
@@ -7,11 +7,14 @@ _real_multiplicative_group = CommonGroups.RealMultiplicative
 
 class DirectedEdge:
 
+    __slots__ = ("_start", "_end", "_hash")
+
     def __init__(self, start: str, end: str) -> None:
         if start == end:
             raise ValueError("Start and end vertices must be different")
         self._start = start
         self._end = end
+        self._hash: int | None = None
 
     @property
     def start(self) -> str:
@@ -26,11 +29,13 @@ class DirectedEdge:
         return DirectedEdge(self._end, self._start)
 
     def __hash__(self) -> int:
-        return hash((self._start, self._end))
+        if self._hash is None:
+            self._hash = hash((self._start, self._end))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, DirectedEdge):
-            return self._start == other.start and self._end == other.end
+            return self._start == other._start and self._end == other._end
         return False
 
     def __iter__(self):
@@ -43,6 +48,8 @@ class DirectedEdge:
 
 class WeightedDirectedEdge(DirectedEdge):
 
+    __slots__ = ("_weight", "_group", "_weight_hash")
+
     def __init__(
         self,
         start: str,
@@ -54,6 +61,7 @@ class WeightedDirectedEdge(DirectedEdge):
 
         self._weight = weight
         self._group = group
+        self._weight_hash: int | None = None
 
     @property
     def weight(self) -> T:  # type: ignore
@@ -78,14 +86,16 @@ class WeightedDirectedEdge(DirectedEdge):
         yield self._weight
 
     def __hash__(self) -> int:
-        return hash((self._start, self._end)) ^ self.group._hash_function(self._weight)
+        if self._hash is None:
+            self._hash = hash((self._start, self._end)) ^ self._get_weight_hash()
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, WeightedDirectedEdge):
-            weight_equality = self.group._hash_function(
-                self._weight
-            ) == self.group._hash_function(other._weight)
-            return super().__eq__(other) and weight_equality
+            return (
+                super().__eq__(other)
+                and self._get_weight_hash() == other._get_weight_hash()
+            )
         return False
 
     def __repr__(self) -> str:
@@ -101,6 +111,13 @@ class WeightedDirectedEdge(DirectedEdge):
         )
         return f"{super_repr}: {first_line}\n{indented_following_lines}"
 
+    def _get_weight_hash(self) -> int:
+        """Returns the hash of the weight under the group hash function, computed only once.
+        Weights are not expected to be modified after the edge is created."""
+        if self._weight_hash is None:
+            self._weight_hash = self._group._hash_function(self._weight)
+        return self._weight_hash
+
 
 if __name__ == "__main__":
     edge = WeightedDirectedEdge("A", "B", 6)
@@ -0,0 +1,311 @@
+import numpy as np
+from typing import Iterable, Sequence
+from ..groups import Group, CommonGroups
+from ..exceptions import NodeNotFound, EdgeNotFound  # type: ignore
+from ._edge import WeightedDirectedEdge  # type: ignore
+from ._graph import (  # type: ignore
+    _WeightedDirectedGraphBase,
+    _weights_to_list,
+    _rows_from_sorted,
+    WeightedDirectedGraph,
+)
+from ._node_index import NodeIndex  # type: ignore
+from ._storage import _save_csr, _load_csr  # type: ignore
+
+__all__ = ["FrozenWeightedDirectedGraph"]
+
+_real_multiplicative_group = CommonGroups.RealMultiplicative
+
+
+def _weights_to_array(weights: Sequence["Group.element"]) -> np.ndarray:
+    """Packs the weights into a read only array. Real weights are stored as a numeric array,
+    vector weights of a common shape as a 2 dimensional array and any other kind of weight
+    in an object array."""
+    if all(isinstance(weight, (int, float)) for weight in weights):
+        array = np.asarray(weights) if weights else np.empty(0, dtype=np.float64)
+    elif weights and all(isinstance(weight, np.ndarray) for weight in weights) and len(
+        {weight.shape for weight in weights}
+    ) == 1:
+        array = np.stack(weights)
+    else:
+        array = np.empty(len(weights), dtype=object)
+        array[:] = list(weights)
+    array.flags.writeable = False
+    return array
+
+
+class FrozenWeightedDirectedGraph(_WeightedDirectedGraphBase):
+    """Read only, array backed version of a WeightedDirectedGraph. The topology is stored in
+    compressed sparse row (CSR) format: the children of the node with id 'i' are the ids
+    'indices[indptr[i]:indptr[i+1]]' and the weights of those edges are the same slice of
+    'weights'. The ids are the ones of a NodeIndex built from the nodes in their sorted order.
+
+    It is meant to be built once with 'WeightedDirectedGraph.freeze' and then queried many times."""
+
+    def __init__(
+        self,
+        nodes: Sequence[str],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        group: Group = _real_multiplicative_group,
+    ) -> None:
+        """Parameters
+        ----------
+        nodes : Sequence[str]
+            The node names. The position of each name is its id.
+        indptr : np.ndarray
+            Array of length len(nodes) + 1 with the start of each node row in 'indices'.
+        indices : np.ndarray
+            The ids of the children of each node, sorted inside each row.
+        weights : np.ndarray
+            The weights of the edges, aligned with 'indices'.
+        group : Group, optional
+            The group where the weights of the graph belongs to. The default is the real multiplicative group.
+        """
+        self._index = NodeIndex(nodes)
+        self._nodes = frozenset(self._index)
+        self._group = group
+
+        self._indptr = np.asarray(indptr, dtype=np.int64)
+        self._indices = np.asarray(indices, dtype=np.int32)
+        self._weights = weights
+
+        # Reverse topology. 'reverse_edges' points to the position of each reversed edge in the
+        # forward arrays, so the weights are not duplicated.
+        sources = np.repeat(np.arange(len(self._index), dtype=np.int32), np.diff(self._indptr))
+        self._reverse_edges = np.argsort(self._indices, kind="stable")
+        self._reverse_indices = sources[self._reverse_edges]
+        self._reverse_indptr = np.zeros(len(self._index) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(self._indices, minlength=len(self._index)),
+            out=self._reverse_indptr[1:],
+        )
+        self._lock_arrays()
+
+    def _lock_arrays(self) -> None:
+        for array in (
+            self._indptr,
+            self._indices,
+            self._reverse_edges,
+            self._reverse_indices,
+            self._reverse_indptr,
+        ):
+            array.flags.writeable = False
+
+    # region Properties
+    @property
+    def edges(self) -> frozenset[WeightedDirectedEdge]:
+        """Returns the edges of the graph. The edge objects are built on every call."""
+        names = self._index._names
+        sources = np.repeat(np.arange(len(names)), np.diff(self._indptr)).tolist()
+        return frozenset(
+            WeightedDirectedEdge(names[start], names[end], weight, self.group)
+            for start, end, weight in zip(
+                sources, self._indices.tolist(), _weights_to_list(self._weights)
+            )
+        )
+
+    @property
+    def is_well_defined(self) -> bool:
+        return True
+
+    @property
+    def indptr(self) -> np.ndarray:
+        return self._indptr
+
+    @property
+    def indices(self) -> np.ndarray:
+        return self._indices
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weights
+
+    @property
+    def node_names(self) -> list[str]:
+        """Returns the node names ordered by their id."""
+        return list(self._index)
+
+    @property
+    def node_index(self) -> NodeIndex:
+        """Returns the index that maps the node names to the ids used in the arrays."""
+        return self._index
+
+    # region Node methods
+    def node_id(self, node: str) -> int:
+        """Returns the id of a node."""
+        return self._index.id(node)
+
+    def node_name(self, node_id: int) -> str:
+        """Returns the name of the node with the given id."""
+        return self._index.name(node_id)
+
+    # region Edge methods
+    def has_edge(self, start: str, end: str) -> bool:
+        """Checks if the graph has an edge going from start to end."""
+        ids = self._index._ids
+        if start not in ids or end not in ids:
+            return False
+        return self._edge_position(ids[start], ids[end]) != -1
+
+    def get_edge(self, start: str, end: str) -> WeightedDirectedEdge:
+        """Returns the edge going from start to end."""
+        return WeightedDirectedEdge(start, end, self.weight(start, end), self.group)
+
+    def weight(self, start: str, end: str) -> "Group.element":
+        """Returns the weight of the edge going from start to end."""
+        bad_nodes = {start, end} - self._nodes
+        if bad_nodes:
+            raise NodeNotFound(bad_nodes)
+        ids = self._index._ids
+        position = self._edge_position(ids[start], ids[end])
+        if position == -1:
+            raise EdgeNotFound(start, end)
+        return _weights_to_list(self._weights[position : position + 1])[0]
+
+    # region Conversion methods
+    def thaw(self) -> WeightedDirectedGraph:
+        """Returns a mutable WeightedDirectedGraph with the same nodes and edges. The adjacency
+        maps are built from the arrays without creating the edge objects."""
+        number_of_nodes = len(self._index)
+        sources = np.repeat(np.arange(number_of_nodes), np.diff(self._indptr))
+        children = _rows_from_sorted(sources, self._indices, self._weights, number_of_nodes)
+        parents = _rows_from_sorted(
+            self._indices[self._reverse_edges],
+            self._reverse_indices,
+            self._weights[self._reverse_edges],
+            number_of_nodes,
+        )
+        return WeightedDirectedGraph._from_adjacency(
+            NodeIndex(self._index), children, parents, self.group
+        )
+
+    @classmethod
+    def from_graph(cls, graph: WeightedDirectedGraph) -> "FrozenWeightedDirectedGraph":
+        """Builds the frozen version of a well defined WeightedDirectedGraph."""
+        if not graph.is_well_defined:
+            raise ValueError("Only well defined graphs can be frozen.")
+
+        names = sorted(graph.nodes)
+        graph_ids = graph._index._ids
+        # Ids of the graph index (which may contain deleted nodes) to frozen ids
+        frozen_ids = {graph_ids[node]: i for i, node in enumerate(names)}
+        indptr = np.zeros(len(names) + 1, dtype=np.int64)
+        indices: list[int] = []
+        weights: list["Group.element"] = []
+        for i, node in enumerate(names):
+            row = sorted(
+                (frozen_ids[child], weight)
+                for child, weight in graph._successors(graph_ids[node])
+            )
+            indices.extend(child_id for child_id, _ in row)
+            weights.extend(weight for _, weight in row)
+            indptr[i + 1] = len(indices)
+
+        return cls(
+            names,
+            indptr,
+            np.asarray(indices, dtype=np.int32),
+            _weights_to_array(weights),
+            graph.group,
+        )
+
+    # region Persistence methods
+    def save(self, path: str) -> None:
+        """Saves the graph to a binary file with its node table, its CSR arrays (including the
+        reverse topology) and its weights. Weights that can not be stored as a numeric array
+        are pickled. The group is stored by name."""
+        _save_csr(
+            path,
+            list(self._index),
+            {
+                "indptr": self._indptr,
+                "indices": self._indices,
+                "reverse_edges": self._reverse_edges,
+                "reverse_indices": self._reverse_indices,
+                "reverse_indptr": self._reverse_indptr,
+            },
+            self._weights,
+            self.group,
+        )
+
+    @classmethod
+    def load(
+        cls, path: str, mmap: bool = True, group: Group | None = None
+    ) -> "FrozenWeightedDirectedGraph":
+        """Loads a graph saved with 'save'.
+
+        Parameters
+        ----------
+        path : str
+            The file to load.
+        mmap : bool, optional
+            If True (default), the arrays are read only memory maps of the file, so loading is
+            almost instant and the pages are shared between processes loading the same file.
+        group : Group, optional
+            The group of the graph. Only needed when it is not one of the predefined groups,
+            its name must match the name of the stored group.
+        """
+        nodes, arrays, weights, group = _load_csr(path, mmap, group)
+        graph = cls.__new__(cls)
+        graph._index = NodeIndex(nodes)
+        graph._nodes = frozenset(graph._index)
+        graph._group = group
+        graph._indptr = arrays["indptr"]
+        graph._indices = arrays["indices"]
+        graph._weights = weights
+        graph._reverse_edges = arrays["reverse_edges"]
+        graph._reverse_indices = arrays["reverse_indices"]
+        graph._reverse_indptr = arrays["reverse_indptr"]
+        graph._lock_arrays()
+        return graph
+
+    # region Dunder methods
+    def __repr__(self) -> str:
+        return (
+            f"FrozenWeightedDirectedGraph(nodes={len(self)}, "
+            f"edges={len(self._indices)}, group={self.group})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenWeightedDirectedGraph):
+            return self.nodes == other.nodes and self.edges == other.edges
+        return False
+
+    # region Auxiliary methods
+    def _edge_position(self, start_id: int, end_id: int) -> int:
+        """Returns the position of the edge in the forward arrays or -1 if it does not exist."""
+        row_start, row_end = self._indptr[start_id], self._indptr[start_id + 1]
+        position = row_start + np.searchsorted(
+            self._indices[row_start:row_end], end_id
+        )
+        if position < row_end and self._indices[position] == end_id:
+            return int(position)
+        return -1
+
+    def _hop_weights(self, paths: list[list[int]]) -> list["Group.element"]:
+        positions = [
+            self._edge_position(start, end)
+            for path in paths
+            for start, end in zip(path, path[1:])
+        ]
+        if -1 in positions:
+            raise ValueError("The given path is not a valid path in the graph.")
+        return _weights_to_list(self._weights[positions])
+
+    def _successors(self, node: int) -> Iterable[tuple[int, "Group.element"]]:
+        row_start, row_end = self._indptr[node], self._indptr[node + 1]
+        return zip(
+            self._indices[row_start:row_end].tolist(),
+            _weights_to_list(self._weights[row_start:row_end]),
+        )
+
+    def _predecessors(self, node: int) -> Iterable[tuple[int, "Group.element"]]:
+        row_start, row_end = self._reverse_indptr[node], self._reverse_indptr[node + 1]
+        return zip(
+            self._reverse_indices[row_start:row_end].tolist(),
+            _weights_to_list(
+                self._weights[self._reverse_edges[row_start:row_end]]
+            ),
+        )
@@ -1,13 +1,28 @@
+import csv
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Sequence
 from functools import reduce  # type: ignore
+import numpy as np
 from numpy import inf
-from math import factorial
+from heapq import heappush, heappop
+from math import exp, factorial, log
 from warnings import warn  # type: ignore
 from ..groups import Group, CommonGroups
-from ..exceptions import NodeNotFound, NodeAlreadyExists, EdgeAlreadyExists, EdgeNotFound  # type: ignore
+from ..exceptions import (  # type: ignore
+    NodeNotFound,
+    NodeAlreadyExists,
+    EdgeAlreadyExists,
+    EdgeNotFound,
+    EdgesAlreadyExist,
+    EdgesNotFound,
+)
 from .._wrappers import deprecation_warning, behavior_change_warning  # type: ignore
-from ._edge import WeightedDirectedEdge  # type: ignore
+from ._edge import DirectedEdge, WeightedDirectedEdge  # type: ignore
 from ._paths import PathExplorerPlus, Path, Cycle  # type: ignore
+from ._node_index import NodeIndex  # type: ignore
 
+__all__ = ["SearchStats", "WeightedDirectedGraph"]
 
 _real_multiplicative_group = CommonGroups.RealMultiplicative
 
@@ -20,7 +35,872 @@ def _check_nodes_in_edges(
     return edge_nodes <= nodes
 
 
-class WeightedDirectedGraph:
+def _build_adjacency(
+    nodes: set[str],
+    edges: set[WeightedDirectedEdge],
+    index: NodeIndex,
+) -> tuple[dict[int, dict[int, "Group.element"]], dict[int, dict[int, "Group.element"]]]:
+    """Returns the forward and reverse adjacency maps of the given nodes and edges, interning
+    the nodes in the index. This is, two dictionaries of the form {node_id: {neighbor_id: weight}}."""
+    add = index.add
+    children: dict[int, dict[int, "Group.element"]] = {add(node): {} for node in nodes}
+    parents: dict[int, dict[int, "Group.element"]] = {node_id: {} for node_id in children}
+    for edge in edges:
+        start, end = add(edge.start), add(edge.end)
+        children.setdefault(start, {})[end] = edge._weight
+        children.setdefault(end, {})
+        parents.setdefault(end, {})[start] = edge._weight
+        parents.setdefault(start, {})
+    return children, parents
+
+
+def _strongly_connected_components(adjacency: dict[int, list[int]]) -> list[set[int]]:
+    """Returns the strongly connected components of the graph given by the adjacency lists,
+    with Tarjan's algorithm written iteratively so deep graphs do not reach the recursion
+    limit. Only the nodes that are keys of the adjacency are considered."""
+    order: dict[int, int] = {}
+    lowlink: dict[int, int] = {}
+    on_stack: set[int] = set()
+    stack: list[int] = []
+    components: list[set[int]] = []
+    for root in adjacency:
+        if root in order:
+            continue
+        order[root] = lowlink[root] = len(order)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(adjacency[root]))]
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in adjacency:
+                    continue
+                if neighbor not in order:
+                    order[neighbor] = lowlink[neighbor] = len(order)
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(adjacency[neighbor])))
+                    break
+                if neighbor in on_stack:
+                    lowlink[node] = min(lowlink[node], order[neighbor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == order[node]:
+                    component = set()
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.add(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def _weights_to_list(weights: np.ndarray) -> list["Group.element"]:
+    """Converts an array of weights to a list of weights. Rows of 2 dimensional arrays are
+    vector weights and are kept as arrays."""
+    if weights.ndim > 1:
+        return list(weights)
+    return weights.tolist()
+
+
+def _rows_from_sorted(
+    node_ids: np.ndarray,
+    neighbor_ids: np.ndarray,
+    weights: np.ndarray,
+    number_of_nodes: int,
+) -> dict[int, dict[int, "Group.element"]]:
+    """Builds the adjacency rows {node_id: {neighbor_id: weight}} of edges sorted by node id."""
+    bounds = np.zeros(number_of_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(node_ids, minlength=number_of_nodes), out=bounds[1:])
+    bounds_list = bounds.tolist()
+    neighbors = neighbor_ids.tolist()
+    weights_list = _weights_to_list(weights)
+    return {
+        node: dict(
+            zip(
+                neighbors[bounds_list[node] : bounds_list[node + 1]],
+                weights_list[bounds_list[node] : bounds_list[node + 1]],
+            )
+        )
+        for node in range(number_of_nodes)
+    }
+
+
+def _reduce_hop_weights(
+    group: Group,
+    hop_weights: list["Group.element"],
+    hop_counts: list[int],
+) -> list["Group.element"]:
+    """Reduces consecutive runs of weights with the group operation, the i-th run having
+    'hop_counts[i]' weights. Each count must be positive."""
+    if not hop_counts:
+        return []
+
+    if group.ufunc is not None:
+        offsets = np.zeros(len(hop_counts), dtype=np.int64)
+        np.cumsum(hop_counts[:-1], out=offsets[1:])
+        reduced = group.ufunc.reduceat(
+            np.asarray(hop_weights, dtype=np.float64), offsets, axis=0
+        )
+        return reduced.tolist() if reduced.ndim == 1 else list(reduced)
+
+    reduced_weights = []
+    position = 0
+    for count in hop_counts:
+        reduced_weights.append(
+            reduce(group.operation, hop_weights[position : position + count], group.identity)
+        )
+        position += count
+    return reduced_weights
+
+
+def _exceeds_bound(
+    group: Group, weight: "Group.element", bound: "Group.element", max_weight
+) -> bool:
+    """Checks if every completion of a partial path of the given weight exceeds max_weight,
+    given a lower bound of the weight of the completions. The bounds only hold for weights not
+    below the identity, and a small tolerance absorbs the rounding of the bounds."""
+    if group.le(weight, group.identity):
+        return False
+    limit = max_weight + 1e-9 * max(abs(max_weight), 1.0)
+    return group.le(limit, group(weight, bound))
+
+
+class SearchStats(NamedTuple):
+    """Counters of a path search. 'expanded' is the number of partial paths expanded and
+    'pruned' the number of branches discarded because they could not reach the target."""
+
+    expanded: int
+    pruned: int
+
+
+class _WeightedDirectedGraphBase:
+    """Query methods shared by the mutable and the frozen weighted directed graphs. Subclasses
+    must set the '_nodes', '_index' and '_group' attributes and implement the '_successors',
+    '_predecessors' and '_hop_weights' methods. The algorithms run on the node ids of '_index'
+    and only translate them to node names in the returned values.
+
+    Mutable subclasses must increase '_version' on every change, so the cached results of
+    previous versions are discarded."""
+
+    _nodes: set[str] | frozenset[str]
+    _index: NodeIndex
+    _group: Group
+    _version: int = 0
+    # (version, {(query, target_id): result}) with the per target results of that version
+    _target_cache: tuple[int, dict[tuple, Any]] | None = None
+    _last_search_stats: SearchStats | None = None
+
+    # region Properties
+    @property
+    def nodes(self) -> set[str]:
+        return self._nodes
+
+    @property
+    def group(self) -> Group:
+        return self._group
+
+    @property
+    def last_search_stats(self) -> SearchStats | None:
+        """Returns the counters of the last search made by 'find_paths' or 'get_node_cycles',
+        None if no search has been made yet."""
+        return self._last_search_stats
+
+    @property
+    def cycles(self) -> set[Cycle]:
+        """Returns all cycles in the graph."""
+        return set(self.iter_cycles())
+
+    # region Node methods
+    def children(self, node: str) -> set[str]:
+        """Returns the children of a node."""
+        if node not in self._nodes:
+            raise NodeNotFound(node)
+        names = self._index._names
+        return {names[child] for child, _ in self._successors(self._index._ids[node])}
+
+    def parents(self, node: str) -> set[str]:
+        """Returns the parents of a node."""
+        if node not in self._nodes:
+            raise NodeNotFound(node)
+        names = self._index._names
+        return {names[parent] for parent, _ in self._predecessors(self._index._ids[node])}
+
+    def children_with_weight(self, node: str) -> set[tuple[str, "Group.element"]]:
+        """Returns a set of tuples with the children of a node and their weights."""
+        if node not in self._nodes:
+            raise NodeNotFound(node)
+        names = self._index._names
+        return {
+            (names[child], weight)
+            for child, weight in self._successors(self._index._ids[node])
+        }
+
+    # region Paths methods
+    def find_paths(
+        self,
+        start: str,
+        end: str,
+        general_max_visitations: int = 1,
+        specific_max_visitations: dict[str, int] = {},
+        max_iter: int | None = None,
+        max_paths: int | None = None,
+        max_weight=None,
+    ) -> list[Path]:
+        """Finds all the paths between two nodes in the graph.
+
+        Parameters
+        ----------
+        start : str
+            The start node.
+        end : str
+            The end node.
+        general_max_visitations : int, optional
+            A positive integer that controls the maximum number that a node can be visited
+            throughout the search. The default is 1.
+        specific_max_visitations : dict[str, int], optional
+            A dictionary of node names and their maximum number of visits that the node can
+            be visited throughout the search. This overwrites the general_max_visitations parameter
+            for the specify nodes. The default is {}.
+        max_iter : int, optional
+            A positive integer that controls the maximum number of iterations that the searching algorithm
+            can perform. If the algorithm reach this number, a warning will be raised. The default is
+            the factorial of the number of nodes of the graph.
+        max_paths : int, optional
+            A positive integer that controls the maximum number of paths that the searching algorithm
+            will look for. The default is None, which means that the algorithm will look for all the paths.
+        max_weight : Group.element, optional
+            Paths are not extended once their weight is strictly greater than this value in the
+            order of the group. The group must have a total order. The default is None, no limit.
+
+        Returns
+        -------
+        list[Path]
+            A list of Path objects containing all the found paths, shortest first. If no paths are
+            found, an empty list is returned. Use 'iter_paths' to get the paths one by one.
+
+        More information about the method
+        ---------------------------------
+            The most basic way of using this method is just passing the start and end nodes. In this situation,
+            the algorithm will look for all the paths between the start and end nodes not allowing node repetition.
+            This means that if start and end nodes are the same (you are looking for a cycle), the algorithm will return an empty list
+            because it will need to visit the same node twice.
+
+            If you want to look for cycles that contains node 'A', start and end node should be set to 'A'
+            and the `specific_max_visitations` parameter should be at least `{'A': 2}`, so the algorithm
+            is allowed to visit node 'A' twice.
+
+            Given a graph that connect nodes 'A' and 'B' in both directions and 'B' and 'C' also
+            in both directions. We have the following examples:
+
+            Example 1: `start = 'A', end = 'B', general_max_visitations = 2`
+                In this scenario the return paths will be `['A','B'], ['A','B','A','B], ['A','B','C','B']`.
+            Example 2: `start = 'A', end = 'A', general_max_visitations = 2`
+                In this scenario the return paths will be `['A'], ['A','B','A'], ['A','B','C','B','A']`.
+                Notice that the null cycle that runs through 'A' is return as `['A']`.
+        """
+
+        if max_iter is None:
+            max_iter = factorial(len(self))
+        bad_nodes = {start, end} - self._nodes
+        if bad_nodes:
+            raise NodeNotFound(bad_nodes)
+
+        ids = self._index._ids
+        found_paths = self._find_paths(
+            ids[start],
+            ids[end],
+            general_max_visitations,
+            self._to_id_visitations(specific_max_visitations),
+            max_iter,
+            max_paths,
+            max_weight,
+        )
+        return [self._to_path(path) for path in found_paths]
+
+    def iter_paths(
+        self,
+        start: str,
+        end: str,
+        general_max_visitations: int = 1,
+        specific_max_visitations: dict[str, int] = {},
+        max_weight=None,
+    ) -> Iterator[tuple[Path, "Group.element"]]:
+        """Lazily yields the paths between two nodes together with their weights. The paths are
+        the same ones returned by 'find_paths' with the same parameters, but the search is depth
+        first: each path is yielded as soon as it is found and the memory used is proportional
+        to the length of the longest explored path. The graph must not be modified while the
+        paths are being consumed.
+
+        Parameters
+        ----------
+        start : str
+            The start node.
+        end : str
+            The end node.
+        general_max_visitations : int, optional
+            A positive integer that controls the maximum number that a node can be visited
+            throughout the search. The default is 1.
+        specific_max_visitations : dict[str, int], optional
+            A dictionary of node names and their maximum number of visits. This overwrites the
+            general_max_visitations parameter for the specify nodes. The default is {}.
+        max_weight : Group.element, optional
+            Paths are not extended once their weight is strictly greater than this value in the
+            order of the group. The group must have a total order. The default is None, no limit.
+
+        Example
+        -------
+        for path, weight in graph.iter_paths('A', 'C'):
+            print(path, weight)
+        """
+        bad_nodes = {start, end} - self._nodes
+        if bad_nodes:
+            raise NodeNotFound(bad_nodes)
+
+        ids = self._index._ids
+        found_paths = self._iter_paths(
+            ids[start],
+            ids[end],
+            general_max_visitations,
+            self._to_id_visitations(specific_max_visitations),
+            max_weight,
+        )
+        return ((self._to_path(path), weight) for path, weight in found_paths)
+
+    def get_node_cycles(self, node: str, max_cycles: int | None = None) -> list[Cycle]:
+        """Returns a list of Cycle objects containing all the simple cycles that contain the given node."""
+        if node not in self._nodes:
+            raise NodeNotFound(node)
+        found_cycles = self._find_cycles(self._index._ids[node], max_cycles)
+        return [Cycle(self._to_path(cycle)) for cycle in found_cycles]
+
+    def iter_cycles(self, max_length: int | None = None) -> Iterator[Cycle]:
+        """Yields all the simple cycles of the graph, each one exactly once. The null cycle of
+        every node comes first and then the cycles found with Johnson's algorithm, which runs
+        on each strongly connected component and takes O((V+E)(C+1)) time for C cycles.
+
+        Parameters
+        ----------
+        max_length : int | None, optional
+            Maximum number of edges of the yielded cycles. By default there is no limit. With a
+            limit the search inside each component is a depth-first search that only extends a
+            path to the nodes that can still close the cycle within the limit.
+        """
+        names = self._index._names
+        node_ids = sorted(self._index._ids[node] for node in self._nodes)
+        for node in node_ids:
+            yield Cycle([names[node]])
+        for cycle in self._iter_cycles(node_ids, max_length):
+            yield Cycle(self._to_path(cycle))
+
+    def path_weight(
+        self, path: Path | list, default_value: "Group.element" = None
+    ) -> "Group.element":
+        """Returns the weight of traversing the given path in the graph. If the given
+        path is an empty a list, a default value can be set.
+
+        Parameters
+        ----------
+        path : Path | list
+            The path to calculate the weight.
+        default_value : Group.element, optional
+            The default value to return if the path is empty. The default is None."""
+
+        if not path:
+            return default_value
+
+        if len(path) == 1:
+            return self.group.identity
+
+        uknown_nodes = set(path) - self._nodes
+        if uknown_nodes:
+            raise NodeNotFound(uknown_nodes)
+
+        path_edges_weights = self._hop_weights([self._index.ids(path)])
+        result_weight = reduce(
+            self.group.operation, path_edges_weights, self.group.identity  # type: ignore
+        )
+        return result_weight
+
+    def path_weights(
+        self, paths: Iterable[Path | list], default_value: "Group.element" = None
+    ) -> list["Group.element"]:
+        """Returns the weights of traversing each of the given paths, following the same rules
+        as 'path_weight'. The steps of all the paths are resolved in a single pass and, if the
+        group has a NumPy ufunc, the weights are reduced with one 'ufunc.reduceat' call instead
+        of one operation call per step.
+
+        Parameters
+        ----------
+        paths : Iterable[Path | list]
+            The paths to calculate the weight.
+        default_value : Group.element, optional
+            The value returned for the empty paths. The default is None."""
+
+        paths = list(paths)
+        long_paths = [path for path in paths if len(path) > 1]
+        uknown_nodes = set().union(*long_paths) - self._nodes
+        if uknown_nodes:
+            raise NodeNotFound(uknown_nodes)
+
+        reduced_weights = iter(
+            _reduce_hop_weights(
+                self.group,
+                self._hop_weights([self._index.ids(path) for path in long_paths]),
+                [len(path) - 1 for path in long_paths],
+            )
+        )
+        weights = []
+        for path in paths:
+            if not path:
+                weights.append(default_value)
+            elif len(path) == 1:
+                weights.append(self.group.identity)
+            else:
+                weights.append(next(reduced_weights))
+        return weights
+
+    def bidirectional_view(self, method: str = "inverse") -> "BidirectionalView":
+        """Returns a read only view of the graph where every edge can also be traversed
+        backwards, without copying the graph. The reverse edges get the weights that
+        'add_reverse_edges' would give them with the same method."""
+        from ._views import BidirectionalView
+
+        return BidirectionalView(self, method)  # type: ignore
+
+    # region Dunder methods
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    # region Auxiliary methods
+    def _to_path(self, path: list[int]) -> Path:
+        """Translates a path of node ids to a Path of node names."""
+        names = self._index._names
+        return Path([names[node] for node in path])
+
+    def _to_id_visitations(self, visitations: dict[str, int]) -> dict[int, int]:
+        """Translates a {node: visitations} dictionary to node ids, dropping unknown nodes."""
+        ids = self._index._ids
+        return {ids[node]: value for node, value in visitations.items() if node in ids}
+
+    def _cache(self) -> dict[tuple, Any]:
+        """Returns the cache of per target results, emptied if the graph has changed."""
+        if self._target_cache is None or self._target_cache[0] != self._version:
+            self._target_cache = (self._version, {})
+        return self._target_cache[1]
+
+    def _reaching_nodes(self, target: int) -> frozenset[int]:
+        """Returns the ids of the nodes with a path to the target, the target included. The
+        result is cached until the graph changes."""
+        cache = self._cache()
+        if ("reaching", target) not in cache:
+            reaching = {target}
+            pending = [target]
+            while pending:
+                for parent, _ in self._predecessors(pending.pop()):
+                    if parent not in reaching:
+                        reaching.add(parent)
+                        pending.append(parent)
+            cache[("reaching", target)] = frozenset(reaching)
+        return cache[("reaching", target)]
+
+    def _completion_bounds(self, target: int) -> dict[int, "Group.element"] | None:
+        """Returns the weight of the lightest path from each node to the target, which bounds
+        from below the weight of any completion of a path, or None if the bounds do not hold.
+
+        The bounds are computed with a Dijkstra search over the predecessors of the target in
+        the real additive group with non negative weights and in the real multiplicative group
+        with weights not below 1, the latter on the logarithms of the weights. The result is
+        cached until the graph changes."""
+        cache = self._cache()
+        if ("bounds", target) not in cache:
+            group = self.group
+            if group.strict_total_order_function is None:
+                cache[("bounds", target)] = None
+            elif group.ufunc is np.add:
+                cache[("bounds", target)] = self._lightest_completions(target, 0, float, float)
+            elif group.ufunc is np.multiply:
+                cache[("bounds", target)] = self._lightest_completions(target, 1, log, exp)
+            else:
+                cache[("bounds", target)] = None
+        return cache[("bounds", target)]
+
+    def _lightest_completions(
+        self,
+        target: int,
+        lowest_weight: float,
+        to_cost: Callable[[float], float],
+        from_cost: Callable[[float], float],
+    ) -> dict[int, float] | None:
+        """Reverse Dijkstra search from the target on the costs 'to_cost(weight)'. Returns None
+        if any weight is not a real number or is below 'lowest_weight'."""
+        costs: dict[int, float] = {target: 0.0}
+        settled: set[int] = set()
+        heap = [(0.0, target)]
+        while heap:
+            cost, node = heappop(heap)
+            if node in settled:
+                continue
+            settled.add(node)
+            for parent, weight in self._predecessors(node):
+                if not isinstance(weight, (int, float)) or weight < lowest_weight:
+                    return None
+                parent_cost = cost + to_cost(weight)
+                if parent_cost < costs.get(parent, inf):
+                    costs[parent] = parent_cost
+                    heappush(heap, (parent_cost, parent))
+        return {node: from_cost(cost) for node, cost in costs.items()}
+
+    def _iter_aux(
+        self,
+        explorer: PathExplorerPlus,
+        target: int,
+        general_max_visitations: int,
+        specific_max_visitations: dict[int, int],
+        max_weight,
+        reaching: frozenset[int] | None = None,
+        bounds: dict[int, "Group.element"] | None = None,
+    ) -> tuple[list[Path], list[PathExplorerPlus], int]:
+        """Expands an explorer. Returns the found path (if the explorer is at the target), the
+        new explorers and the number of children pruned. If 'reaching' is given, children out
+        of it and all the children once the target can not be visited again are pruned. If
+        'bounds' and 'max_weight' are given, children that can not reach the target without
+        exceeding 'max_weight' are pruned too."""
+
+        current_node = explorer.path[-1]
+        weight = explorer.weight
+        visitations = explorer.visitations.copy()
+        visitations[current_node] = visitations.get(current_node, 0) + 1
+        current_node_vistiations = visitations[current_node]
+        current_node_max_vistiations = specific_max_visitations.get(
+            current_node, general_max_visitations
+        )
+        found_path: list[Path] = []
+        new_explorers: list[PathExplorerPlus] = []
+
+        if current_node_vistiations > current_node_max_vistiations:
+            return found_path, new_explorers, 0
+
+        if max_weight is not None:
+            if self.group.le(max_weight, weight):
+                return found_path, new_explorers, 0
+
+        if current_node == target:
+            found_path = [explorer.path]
+
+        children_tuples = self._successors(current_node)
+        forbidden_nodes = {
+            node
+            for node, rep in visitations.items()
+            if rep >= specific_max_visitations.get(node, general_max_visitations)
+        }
+        unexplored_nodes = [
+            (child, child_weight)
+            for child, child_weight in children_tuples
+            if child not in forbidden_nodes
+        ]
+        pruned = 0
+        if reaching is not None and unexplored_nodes:
+            if target in forbidden_nodes:
+                reachable_nodes = []
+            else:
+                reachable_nodes = [
+                    (child, child_weight)
+                    for child, child_weight in unexplored_nodes
+                    if child in reaching
+                ]
+            pruned = len(unexplored_nodes) - len(reachable_nodes)
+            unexplored_nodes = reachable_nodes
+        if not unexplored_nodes:
+            return found_path, new_explorers, pruned
+
+        group = self.group
+        for node, child_weight in unexplored_nodes:
+            child_path_weight = group(weight, child_weight)
+            if (
+                bounds is not None
+                and max_weight is not None
+                and _exceeds_bound(group, child_path_weight, bounds[node], max_weight)
+            ):
+                pruned += 1
+                continue
+            new_explorers.append(
+                PathExplorerPlus(Path(explorer.path + [node]), child_path_weight, visitations)
+            )
+        return found_path, new_explorers, pruned
+
+    def _iter_paths(
+        self,
+        start: int,
+        end: int,
+        general_max_visitations: int,
+        specific_max_visitations: dict[int, int],
+        max_weight,
+    ) -> Iterator[tuple[list[int], "Group.element"]]:
+        """Depth first version of '_find_paths'. The current path, its prefix weights and the
+        iterators over the pending children of each of its nodes are the only state kept.
+        Children that can not reach the target are skipped."""
+        group = self.group
+        reaching = self._reaching_nodes(end)
+        bounds = self._completion_bounds(end) if max_weight is not None else None
+        max_visitations = specific_max_visitations.get
+        if max_visitations(start, general_max_visitations) < 1:
+            return
+        if max_weight is not None and group.le(max_weight, group.identity):
+            return
+
+        path = [start]
+        path_weights = [group.identity]
+        visitations = {start: 1}
+        if start == end:
+            yield path.copy(), group.identity
+        pending_children = [iter(self._successors(start))]
+        while pending_children:
+            if visitations.get(end, 0) >= max_visitations(end, general_max_visitations):
+                pending_children[-1] = iter(())
+            for child, child_weight in pending_children[-1]:
+                if child not in reaching:
+                    continue
+                child_visitations = visitations.get(child, 0)
+                if child_visitations >= max_visitations(child, general_max_visitations):
+                    continue
+                weight = group(path_weights[-1], child_weight)
+                if max_weight is not None and group.le(max_weight, weight):
+                    continue
+                if bounds is not None and _exceeds_bound(group, weight, bounds[child], max_weight):
+                    continue
+                visitations[child] = child_visitations + 1
+                path.append(child)
+                path_weights.append(weight)
+                if child == end:
+                    yield path.copy(), weight
+                pending_children.append(iter(self._successors(child)))
+                break
+            else:
+                pending_children.pop()
+                visitations[path.pop()] -= 1
+                path_weights.pop()
+
+    def _find_paths(
+        self,
+        start: int,
+        end: int,
+        general_max_visitations: int = 1,
+        specific_max_visitations: dict[int, int] = {},
+        max_iter: int = 1_000,
+        max_paths: int | None = None,
+        max_weight=None,
+    ) -> list[Path]:
+        all_paths, _, expansions, pruned = self._find_paths_from(
+            [PathExplorerPlus(Path([start]), self.group.identity)],
+            end,
+            general_max_visitations,
+            specific_max_visitations,
+            max_iter,
+            max_paths,
+            max_weight,
+            self._reaching_nodes(end),
+            self._completion_bounds(end) if max_weight is not None else None,
+        )
+        self._last_search_stats = SearchStats(expansions, pruned)
+        if expansions + 1 == max_iter:
+            warn(f"Max iterations reached ({max_iter})", Warning)
+
+        return all_paths
+
+    def _find_paths_from(
+        self,
+        explorers: Iterable[PathExplorerPlus],
+        end: int,
+        general_max_visitations: int,
+        specific_max_visitations: dict[int, int],
+        max_iter: int,
+        max_paths: int | None,
+        max_weight,
+        reaching: frozenset[int] | None = None,
+        bounds: dict[int, "Group.element"] | None = None,
+    ) -> tuple[list[Path], list[int], int, int]:
+        """Breadth first search engine of '_find_paths' starting from the given explorers.
+        Returns the found paths, the iteration in which each path was found, the number of
+        explorers expanded, which is at most max_iter - 1, and the number of pruned branches."""
+        if max_paths is None:
+            m_paths: int | float = inf
+        else:
+            m_paths = max_paths
+        frontier: deque[PathExplorerPlus] = deque(explorers)
+        # Paths of the explorers waiting in the frontier. A path determines its visitations,
+        # so it identifies the explorer.
+        frontier_paths: set[tuple[int, ...]] = {tuple(explorer.path) for explorer in frontier}
+        all_paths: list[Path] = []
+        found_at: list[int] = []
+        pruned = 0
+
+        it = 1
+        while frontier and (it < max_iter) and (len(all_paths) < m_paths):
+            explorer = frontier.popleft()
+            frontier_paths.discard(tuple(explorer.path))
+            discovered_path, discovered_explorers, discovered_pruned = self._iter_aux(
+                explorer,
+                end,
+                general_max_visitations,
+                specific_max_visitations,
+                max_weight,
+                reaching,
+                bounds,
+            )
+            all_paths.extend(discovered_path)
+            found_at.extend(it for _ in discovered_path)
+            pruned += discovered_pruned
+            for new_explorer in discovered_explorers:
+                new_path = tuple(new_explorer.path)
+                if new_path not in frontier_paths:
+                    frontier_paths.add(new_path)
+                    frontier.append(new_explorer)
+
+            it += 1
+
+        return all_paths, found_at, it - 1, pruned
+
+    def _find_cycles(self, node: int, max_cycles: int | None) -> list[Path]:
+        list_cycles = self._find_paths(
+            start=node,
+            end=node,
+            general_max_visitations=1,
+            specific_max_visitations={node: 2},
+            max_paths=max_cycles,
+        )
+        return list_cycles
+
+    def _iter_cycles(self, node_ids: list[int], max_length: int | None) -> Iterator[list[int]]:
+        """Yields the cycles of length at least 2 among the given node ids, as lists of ids
+        that end with their first node. Each strongly connected component is searched from its
+        smallest node, which is then removed, and the rest of the component is split again."""
+        nodes = set(node_ids)
+        adjacency = {
+            node: [child for child, _ in self._successors(node) if child in nodes]
+            for node in node_ids
+        }
+        pending = [
+            component for component in _strongly_connected_components(adjacency)
+            if len(component) > 1
+        ]
+        while pending:
+            component = pending.pop()
+            start = min(component)
+            successors = {
+                node: [child for child in adjacency[node] if child in component]
+                for node in component
+            }
+            if max_length is None:
+                yield from self._johnson_circuits(start, successors)
+            else:
+                yield from self._bounded_circuits(start, successors, max_length)
+            component.discard(start)
+            remaining = {
+                node: [child for child in successors[node] if child != start]
+                for node in component
+            }
+            pending.extend(
+                sub_component
+                for sub_component in _strongly_connected_components(remaining)
+                if len(sub_component) > 1
+            )
+
+    @staticmethod
+    def _johnson_circuits(start: int, successors: dict[int, list[int]]) -> Iterator[list[int]]:
+        """Johnson's circuit search, written iteratively: yields the cycles through start in a
+        strongly connected component. A node stays blocked while it can not reach start without
+        going through the current path, so every dead end is explored only once."""
+        path = [start]
+        blocked = {start}
+        blocked_by: dict[int, set[int]] = {node: set() for node in successors}
+        closed = [False]
+        stack = [(start, iter(successors[start]))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child == start:
+                    yield path + [start]
+                    closed[-1] = True
+                elif child not in blocked:
+                    path.append(child)
+                    closed.append(False)
+                    stack.append((child, iter(successors[child])))
+                    blocked.add(child)
+                    break
+            else:
+                stack.pop()
+                node = path.pop()
+                if closed.pop():
+                    if closed:
+                        closed[-1] = True
+                    unblock = [node]
+                    while unblock:
+                        unblocked = unblock.pop()
+                        if unblocked in blocked:
+                            blocked.discard(unblocked)
+                            unblock.extend(blocked_by[unblocked])
+                            blocked_by[unblocked].clear()
+                else:
+                    for child in successors[node]:
+                        blocked_by[child].add(node)
+
+    @staticmethod
+    def _bounded_circuits(
+        start: int, successors: dict[int, list[int]], max_length: int
+    ) -> Iterator[list[int]]:
+        """Yields the cycles through start with at most max_length edges in a strongly
+        connected component. A path is only extended to the nodes whose distance back to start
+        still fits in the limit."""
+        distances = {start: 0}
+        predecessors: dict[int, list[int]] = {node: [] for node in successors}
+        for node, children in successors.items():
+            for child in children:
+                predecessors[child].append(node)
+        frontier = deque([start])
+        while frontier:
+            node = frontier.popleft()
+            for parent in predecessors[node]:
+                if parent not in distances:
+                    distances[parent] = distances[node] + 1
+                    frontier.append(parent)
+
+        path = [start]
+        on_path = {start}
+        stack = [iter(successors[start])]
+        while stack:
+            for child in stack[-1]:
+                if child == start:
+                    yield path + [start]
+                elif child not in on_path and len(path) + distances[child] <= max_length:
+                    path.append(child)
+                    on_path.add(child)
+                    stack.append(iter(successors[child]))
+                    break
+            else:
+                stack.pop()
+                on_path.discard(path.pop())
+
+    def _successors(self, node: int) -> Iterable[tuple[int, "Group.element"]]:
+        """Returns the (child id, weight) pairs of the edges leaving the node."""
+        raise NotImplementedError
+
+    def _predecessors(self, node: int) -> Iterable[tuple[int, "Group.element"]]:
+        """Returns the (parent id, weight) pairs of the edges arriving to the node."""
+        raise NotImplementedError
+
+    def _hop_weights(self, paths: list[list[int]]) -> list["Group.element"]:
+        """Returns the weights of all the steps of the given paths of node ids, one path after
+        the other. Raises a ValueError if any step is not an edge of the graph."""
+        raise NotImplementedError
+
+
+class WeightedDirectedGraph(_WeightedDirectedGraphBase):
 
     def __init__(
         self,
@@ -29,44 +909,43 @@ class WeightedDirectedGraph:
         group: Group = _real_multiplicative_group,
     ) -> None:
         self._nodes = nodes
-        self._edges = edges
+        self._edges: set[WeightedDirectedEdge] | None = edges
         self._group = group
+        self._index = NodeIndex()
+        self._children, self._parents = _build_adjacency(nodes, edges, self._index)
+        # (start, end) -> edge lookup table. Edges missing from it are built from the adjacency
+        # maps the first time they are requested.
+        self._edge_index = {(edge.start, edge.end): edge for edge in edges}
+        # Adjacency rows are shared between a graph and the graphs derived from it with
+        # 'inplace=False'. These are the rows this graph can modify without copying them
+        # first, None meaning all of them.
+        self._owned_children: set[int] | None = None
+        self._owned_parents: set[int] | None = None
 
     # region Properties
-    @property
-    def nodes(self) -> set[str]:
-        return self._nodes
-
     @property
     def edges(self) -> set[WeightedDirectedEdge]:
+        if self._edges is None:
+            names = self._index._names
+            self._edges = {
+                self._edge(names[start], names[end])
+                for start, row in self._children.items()
+                for end in row
+            }
         return self._edges
 
-    @property
-    def group(self) -> Group:
-        return self._group
-
     @property
     def is_well_defined(self) -> bool:
         """Checks if the graph is defined correctly. This is, that all edges nodes are in the nodes set."""
-        return _check_nodes_in_edges(self.nodes, self.edges)
-
-    @property
-    def cycles(self) -> set[Cycle]:
-        """Returns all cycles in the graph."""
-        return set.union(*[set(self.get_node_cycles(node)) for node in self.nodes])
+        names = self._index._names
+        return all(names[node] in self._nodes for node in self._children)
 
     @property
     def is_conmutative(self) -> bool:
         """Checks if the graph is conmutative. This is, that given two paths with the same
-        starting and ending nodes, the weight of traversing both paths is the same."""
-        complete_graph = self.add_reverse_edges(inplace=False)
-        group = self.group
-        identity = group.identity
-        check = all(
-            group.equal(complete_graph.path_weight(cycle), identity)
-            for cycle in complete_graph.cycles
-        )
-        return check
+        starting and ending nodes, the weight of traversing both paths is the same, going
+        through each edge backwards with the inverse of its weight."""
+        return self.conmutativity_witness() is None
 
     # region Node methods
     @deprecation_warning(
@@ -76,58 +955,60 @@ class WeightedDirectedGraph:
         """Checks if the graph is defined correctly."""
         return _check_nodes_in_edges(self.nodes, self.edges)
 
-    def children(self, node: str) -> set[str]:
-        """Returns the children of a node."""
-        if node not in self._nodes:
-            raise NodeNotFound(node)
-        return {edge.end for edge in self._edges if edge.start == node}
-
-    def parents(self, node: str) -> set[str]:
-        """Returns the parents of a node."""
-        if node not in self._nodes:
-            raise NodeNotFound(node)
-        return {edge.start for edge in self._edges if edge.end == node}
-
     def add_node(self, node: str, inplace: bool = False):
         """Adds a node to the graph"""
         if node in self._nodes:
             raise NodeAlreadyExists(node)
+        graph = self if inplace else self._copy()
+        graph._version += 1
+        graph._nodes.add(node)
+        node_id = graph._index.add(node)
+        graph._children.setdefault(node_id, {})
+        graph._parents.setdefault(node_id, {})
         if inplace:
-            self._nodes.add(node)
             return
-
-        return_graph = WeightedDirectedGraph(
-            nodes=self._nodes | {node}, edges=self._edges, group=self.group
-        )
-        return return_graph
+        return graph
 
     def delete_node(self, node: str, inplace: bool = False):
         """Deletes a node from the graph. Also removes all edges connected to this node."""
         if node not in self._nodes:
             raise NodeNotFound(node)
 
-        node_edges = {
-            edge for edge in self._edges if edge.start == node or edge.end == node
-        }
-        good_edges = self.edges - node_edges
-
+        graph = self if inplace else self._copy()
+        graph._version += 1
+        graph._nodes.remove(node)
+        graph._edges = None
+        names = graph._index._names
+        node_id = graph._index._ids[node]
+        for child in graph._children.pop(node_id):
+            del graph._writable_parents(child)[node_id]
+            graph._edge_index.pop((node, names[child]), None)
+        for parent in graph._parents.pop(node_id):
+            del graph._writable_children(parent)[node_id]
+            graph._edge_index.pop((names[parent], node), None)
         if inplace:
-            self._nodes.remove(node)
-            self._edges = good_edges
             return
-
-        return_graph = WeightedDirectedGraph(
-            nodes=self._nodes - {node}, edges=good_edges, group=self.group
-        )
-        return return_graph
-
-    def children_with_weight(self, node: str) -> set[tuple[str, "Group.element"]]:
-        """Returns a set of tuples with the children of a node and their weights."""
-        if node not in self._nodes:
-            raise NodeNotFound(node)
-        return {(edge.end, edge._weight) for edge in self._edges if edge.start == node}
+        return graph
 
     # region Edge methods
+    def has_edge(self, start: str, end: str) -> bool:
+        """Checks if the graph has an edge going from start to end."""
+        if start not in self._nodes or end not in self._nodes:
+            return False
+        ids = self._index._ids
+        return ids[end] in self._children[ids[start]]
+
+    def get_edge(self, start: str, end: str) -> WeightedDirectedEdge:
+        """Returns the edge going from start to end."""
+        self._check_edge(start, end)
+        return self._edge(start, end)
+
+    def weight(self, start: str, end: str) -> "Group.element":
+        """Returns the weight of the edge going from start to end."""
+        self._check_edge(start, end)
+        ids = self._index._ids
+        return self._children[ids[start]][ids[end]]
+
     def add_edge(
         self,
         start: str,
@@ -160,12 +1041,12 @@ class WeightedDirectedGraph:
         bad_nodes = {start, end} - self._nodes
         if bad_nodes:
             raise NodeNotFound(bad_nodes)
-        if (start, end) in {(edge.start, edge.end) for edge in self._edges}:
+        if self.has_edge(start, end):
             raise EdgeAlreadyExists(start, end)
 
         if weight is None:  # Find weight in another way
             if allow_inverse:
-                search_graph = self.add_reverse_edges(inplace=False)
+                search_graph = self.bidirectional_view()
             else:
                 search_graph = self
 
@@ -177,7 +1058,8 @@ class WeightedDirectedGraph:
                     + "Instead, either specify weight or find first a path between edges with the 'find_paths' method.",
                     DeprecationWarning,
                 )
-                path = search_graph.find_path(start, end)
+                found_paths = search_graph.find_paths(start, end, max_paths=1)
+                path = found_paths[0] if found_paths else []
                 if not path:
                     print(f"Unable to find a weight to connect edge {start} -> {end}")
                     if inplace:
@@ -186,34 +1068,22 @@ class WeightedDirectedGraph:
                 else:
                     weight = search_graph.path_weight(path)
 
+        graph = self if inplace else self._copy()
+        graph._insert_edge(WeightedDirectedEdge(start, end, weight, self.group))
         if inplace:
-            self._edges.add(WeightedDirectedEdge(start, end, weight, self.group))
             return
-
-        return_graph = WeightedDirectedGraph(
-            nodes=self._nodes,
-            edges=self._edges | {WeightedDirectedEdge(start, end, weight)},
-            group=self.group,
-        )
-        return return_graph
+        return graph
 
     def delete_edge(self, start: str, end: str, inplace: bool = False):
         """Deletes an edge connecting two existing nodes."""
 
-        bad_nodes = {start, end} - self._nodes
-        if bad_nodes:
-            raise NodeNotFound(bad_nodes)
+        self._check_edge(start, end)
 
-        good_edges = {
-            edge for edge in self._edges if (edge.start, edge.end) != (start, end)
-        }
-        if good_edges == self._edges:
-            raise EdgeNotFound(start, end)
+        graph = self if inplace else self._copy()
+        graph._remove_edge(start, end)
         if inplace:
-            self._edges = good_edges
             return
-
-        return WeightedDirectedGraph(self._nodes, good_edges, self.group)
+        return graph
 
     def add_reverse_edges(self, inplace: bool = False, method: str = "inverse"):
         """Adds the missing inverse direction edges. The weight assign to this new edges is
@@ -221,102 +1091,211 @@ class WeightedDirectedGraph:
         'mirror' will use the same weight as the original edge."""
 
         if method == "inverse":
-            all_inverse_edges = {edge.inverse for edge in self._edges}
+            reverse_weight = self.group.inverse
         elif method == "mirror":
-            all_inverse_edges = {edge.mirror for edge in self._edges}
+            reverse_weight = lambda weight: weight
         else:
             raise ValueError(
                 f"Unknown method '{method}'. Available methods are 'inverse' and 'mirror'."
             )
 
-        inverse_edges = {
-            edge
-            for edge in all_inverse_edges
-            if edge.start not in self.parents(edge.end)
-        }
+        inverse_rows: dict[int, dict[int, "Group.element"]] = {}
+        for start, row in self._children.items():
+            for end, weight in row.items():
+                if start not in self._children[end]:
+                    inverse_rows.setdefault(end, {})[start] = reverse_weight(weight)
+
+        graph = self if inplace else self._copy()
+        graph._insert_rows(inverse_rows)
         if inplace:
-            self._edges.update(inverse_edges)
             return
+        return graph
+
+    # region Bulk methods
+    def add_nodes_from(self, nodes: Iterable[str], inplace: bool = False):
+        """Adds several nodes to the graph at once. Repeated nodes are added once. If any of the
+        nodes already exists in the graph no node is added and a NodeAlreadyExists exception
+        listing all of them is raised."""
+        new_nodes = set(nodes)
+        existing_nodes = new_nodes & self._nodes
+        if existing_nodes:
+            raise NodeAlreadyExists(existing_nodes)
+
+        graph = self if inplace else self._copy()
+        graph._version += 1
+        graph._nodes |= new_nodes
+        for node in new_nodes:
+            node_id = graph._index.add(node)
+            graph._children.setdefault(node_id, {})
+            graph._parents.setdefault(node_id, {})
+        if inplace:
+            return
+        return graph
+
+    def delete_nodes_from(self, nodes: Iterable[str], inplace: bool = False):
+        """Deletes several nodes from the graph at once, together with all the edges connected
+        to them. If any of the nodes is not in the graph no node is deleted and a NodeNotFound
+        exception listing all of them is raised."""
+        removed_nodes = set(nodes)
+        missing_nodes = removed_nodes - self._nodes
+        if missing_nodes:
+            raise NodeNotFound(missing_nodes)
+
+        graph = self if inplace else self._copy()
+        graph._version += 1
+        graph._nodes -= removed_nodes
+        graph._edges = None
+        names = graph._index._names
+        removed_ids = set(graph._index.ids(removed_nodes))
+        for node in removed_ids:
+            for child in graph._children.pop(node):
+                graph._edge_index.pop((names[node], names[child]), None)
+                if child not in removed_ids:
+                    del graph._writable_parents(child)[node]
+            for parent in graph._parents.pop(node):
+                graph._edge_index.pop((names[parent], names[node]), None)
+                if parent not in removed_ids:
+                    del graph._writable_children(parent)[node]
+        if inplace:
+            return
+        return graph
 
-        return WeightedDirectedGraph(
-            self._nodes, self._edges | inverse_edges, self.group
-        )
-
-    # region Paths methods
-    def find_paths(
+    def add_edges_from(
         self,
-        start: str,
-        end: str,
-        general_max_visitations: int = 1,
-        specific_max_visitations: dict[str, int] = {},
-        max_iter: int | None = None,
-        max_paths: int | None = None,
-        max_weight=None,
-    ) -> list[Path]:
-        """Finds all the paths between two nodes in the graph.
+        edges: Iterable[tuple[str, str, "Group.element"] | WeightedDirectedEdge],
+        inplace: bool = False,
+    ):
+        """Adds several edges to the graph in one pass.
 
         Parameters
         ----------
-        start : str
-            The start node.
-        end : str
-            The end node.
-        general_max_visitations : int, optional
-            A positive integer that controls the maximum number that a node can be visited
-            throughout the search. The default is 1.
-        specific_max_visitations : dict[str, int], optional
-            A dictionary of node names and their maximum number of visits that the node can
-            be visited throughout the search. This overwrites the general_max_visitations parameter
-            for the specify nodes. The default is {}.
-        max_iter : int, optional
-            A positive integer that controls the maximum number of iterations that the searching algorithm
-            can perform. If the algorithm reach this number, a warning will be raised. The default is
-            the factorial of the number of nodes of the graph.
-        max_paths : int, optional
-            A positive integer that controls the maximum number of paths that the searching algorithm
-            will look for. The default is None, which means that the algorithm will look for all the paths.
-
-        Returns
-        -------
-        list[Path]
-            A list of Path objects containing all the found paths. If no paths are found, an empty list is returned.
-
-        More information about the method
-        ---------------------------------
-            The most basic way of using this method is just passing the start and end nodes. In this situation,
-            the algorithm will look for all the paths between the start and end nodes not allowing node repetition.
-            This means that if start and end nodes are the same (you are looking for a cycle), the algorithm will return an empty list
-            because it will need to visit the same node twice.
-
-            If you want to look for cycles that contains node 'A', start and end node should be set to 'A'
-            and the `specific_max_visitations` parameter should be at least `{'A': 2}`, so the algorithm
-            is allowed to visit node 'A' twice.
-
-            Given a graph that connect nodes 'A' and 'B' in both directions and 'B' and 'C' also
-            in both directions. We have the following examples:
-
-            Example 1: `start = 'A', end = 'B', general_max_visitations = 2`
-                In this scenario the return paths will be `['A','B'], ['A','B','A','B], ['A','B','C','B']`.
-            Example 2: `start = 'A', end = 'A', general_max_visitations = 2`
-                In this scenario the return paths will be `['A'], ['A','B','A'], ['A','B','C','B','A']`.
-                Notice that the null cycle that runs through 'A' is return as `['A']`.
-        """
+        edges : Iterable[tuple[str, str, Group.element] | WeightedDirectedEdge]
+            The edges to add, given as (start, end, weight) tuples or WeightedDirectedEdge objects.
+            Edges repeated with the same weight are added once.
+        inplace : bool, optional
+            If True, the graph is modified. Otherwise a new graph is returned. The default is False.
+
+        Raises
+        ------
+        NodeNotFound
+            If any edge uses a node that is not in the graph. All the unknown nodes are reported.
+        EdgesAlreadyExist
+            If any edge already exists in the graph or is given twice with different weights. All
+            the conflicting edges are reported.
+
+        In both cases no edge is added."""
+        equal = self.group.equal
+        new_rows: dict[str, dict[str, "Group.element"]] = {}
+        missing_nodes: set[str] = set()
+        conflicts: set[tuple[str, str]] = set()
+        for start, end, weight in edges:
+            if start == end:
+                raise ValueError("Start and end vertices must be different")
+            missing_nodes.update(node for node in (start, end) if node not in self._nodes)
+            row = new_rows.setdefault(start, {})
+            if self.has_edge(start, end) or (end in row and not equal(row[end], weight)):
+                conflicts.add((start, end))
+            row[end] = weight
+
+        if missing_nodes:
+            raise NodeNotFound(missing_nodes)
+        if conflicts:
+            raise EdgesAlreadyExist(conflicts)
+
+        ids = self._index._ids
+        graph = self if inplace else self._copy()
+        graph._insert_rows(
+            {
+                ids[start]: {ids[end]: weight for end, weight in row.items()}
+                for start, row in new_rows.items()
+            }
+        )
+        if inplace:
+            return
+        return graph
 
-        if max_iter is None:
-            max_iter = factorial(len(self))
-        bad_nodes = {start, end} - self._nodes
-        if bad_nodes:
-            raise NodeNotFound(bad_nodes)
+    def delete_edges_from(
+        self, edges: Iterable[tuple[str, str] | DirectedEdge], inplace: bool = False
+    ):
+        """Deletes several edges from the graph at once. The edges can be given as (start, end)
+        tuples or as edge objects, whose weights are ignored. If any of the edges is not in the
+        graph no edge is deleted and an exception listing all the unknown nodes (NodeNotFound) or
+        edges (EdgesNotFound) is raised."""
+        pairs = {(start, end) for start, end, *_ in edges}
+        missing_nodes = {node for pair in pairs for node in pair} - self._nodes
+        if missing_nodes:
+            raise NodeNotFound(missing_nodes)
+        missing_edges = {(start, end) for start, end in pairs if not self.has_edge(start, end)}
+        if missing_edges:
+            raise EdgesNotFound(missing_edges)
+
+        graph = self if inplace else self._copy()
+        for start, end in pairs:
+            graph._remove_edge(start, end)
+        if inplace:
+            return
+        return graph
 
-        found_paths = self._find_paths(
-            start,
-            end,
-            general_max_visitations,
-            specific_max_visitations,
-            max_iter,
-            max_paths,
-        )
-        return found_paths
+    # region Paths methods
+    def conmutativity_witness(self) -> Cycle | None:
+        """Returns a cycle whose weight is not the identity, None if the graph is conmutative.
+        The cycle may go through edges backwards, with the inverse of their weights, and its
+        first step is an edge of the graph that breaks the conmutativity.
+
+        The graph is conmutative exactly when each node can be given a potential such that the
+        weight of every edge is the inverse of the potential of its start operated with the
+        potential of its end. The potentials are set along a breadth-first spanning forest of
+        the graph, ignoring the direction of the edges, and then every edge is checked against
+        them, so the check takes O(V+E) time. Edges in both directions are checked against each
+        other first, so that the steps of the forest have the same weight in both directions."""
+        group = self.group
+        identity = group.identity
+        for start, row in self._children.items():
+            for end, weight in row.items():
+                back_weight = self._children[end].get(start)
+                if start < end and back_weight is not None:
+                    if not group.equal(group(weight, back_weight), identity):
+                        return Cycle(self._to_path([start, end, start]))
+
+        potentials: dict[int, "Group.element"] = {}
+        tree_parents: dict[int, int | None] = {}
+        tree_edges: set[tuple[int, int]] = set()
+        for root in sorted(self._children):
+            if root in potentials:
+                continue
+            potentials[root] = identity
+            tree_parents[root] = None
+            frontier = deque([root])
+            while frontier:
+                node = frontier.popleft()
+                potential = potentials[node]
+                for child, weight in self._children[node].items():
+                    if child not in potentials:
+                        potentials[child] = group(potential, weight)
+                        tree_parents[child] = node
+                        tree_edges.add((node, child))
+                        frontier.append(child)
+                for parent, weight in self._parents[node].items():
+                    if parent not in potentials:
+                        potentials[parent] = group(potential, group.inverse(weight))
+                        tree_parents[parent] = node
+                        tree_edges.add((parent, node))
+                        frontier.append(parent)
+
+        for start, row in self._children.items():
+            start_potential = potentials[start]
+            for end, weight in row.items():
+                if (start, end) in tree_edges:
+                    continue
+                cycle_weight = group(
+                    group(start_potential, weight), group.inverse(potentials[end])
+                )
+                if group.equal(cycle_weight, identity):
+                    continue
+                cycle = self._fundamental_cycle(start, end, tree_parents)
+                if not group.equal(self._undirected_path_weight(cycle), identity):
+                    return Cycle(self._to_path(cycle))
+        return None
 
     @deprecation_warning(
         "This method is deprecated and will be removed. Use 'find_paths' instead limiting the number of return paths to 1."
@@ -329,47 +1308,6 @@ class WeightedDirectedGraph:
             return found_paths[0]
         return []
 
-    def get_node_cycles(self, node: str, max_cycles: int | None = None) -> list[Cycle]:
-        """Returns a list of Cycle objects containing all the simple cycles that contain the given node."""
-        return self._find_cycles(node, max_cycles)
-
-    def path_weight(
-        self, path: Path | list, default_value: "Group.element" = None
-    ) -> "Group.element":
-        """Returns the weight of traversing the given path in the graph. If the given
-        path is an empty a list, a default value can be set.
-
-        Parameters
-        ----------
-        path : Path | list
-            The path to calculate the weight.
-        default_value : Group.element, optional
-            The default value to return if the path is empty. The default is None."""
-
-        path_copy = path.copy()
-
-        if not path_copy:
-            return default_value
-
-        if len(path_copy) == 1:
-            return self.group.identity
-
-        uknown_nodes = set(path_copy) - self.nodes
-        if uknown_nodes:
-            raise NodeNotFound(uknown_nodes)
-
-        path_pairs = list(zip(path_copy, path_copy[1:]))
-        if not all(node_f in self.parents(node_c) for node_f, node_c in path_pairs):
-            raise ValueError("The given path is not a valid path in the graph.")
-
-        path_edges_weights = [
-            edge._weight for edge in self.edges if (edge.start, edge.end) in path_pairs
-        ]
-        result_weight = reduce(
-            self.group.operation, path_edges_weights, self.group.identity  # type: ignore
-        )
-        return result_weight
-
     @deprecation_warning(
         "This method is deprecated and will be removed. Use 'path_weight' instead."
     )
@@ -380,6 +1318,42 @@ class WeightedDirectedGraph:
         path = self.find_path(start, end)
         return self.path_weight(path, default)
 
+    def freeze(self) -> "FrozenWeightedDirectedGraph":
+        """Returns a read only copy of the graph backed by NumPy arrays in CSR format. The frozen
+        graph supports the same queries (children, parents, path_weight, find_paths, Dijkstra...)
+        using less memory, which pays off for graphs that are built once and queried many times.
+        The graph must be well defined."""
+        from ._frozen import FrozenWeightedDirectedGraph
+
+        return FrozenWeightedDirectedGraph.from_graph(self)
+
+    def save(self, path: str) -> None:
+        """Saves the graph to a binary file. The file stores the frozen version of the graph,
+        see 'FrozenWeightedDirectedGraph.save'. The graph must be well defined."""
+        self.freeze().save(path)
+
+    @classmethod
+    def load(
+        cls, path: str, mmap: bool = True, group: Group | None = None
+    ) -> "WeightedDirectedGraph":
+        """Loads a graph saved with 'save'. The file is read through a memory map unless 'mmap'
+        is False. Graphs that are only queried can be loaded with 'FrozenWeightedDirectedGraph.load',
+        which keeps the arrays memory mapped instead of building the adjacency maps.
+
+        Parameters
+        ----------
+        path : str
+            The file to load.
+        mmap : bool, optional
+            If True (default), the file is memory mapped instead of read in one go.
+        group : Group, optional
+            The group of the graph. Only needed when it is not one of the predefined groups,
+            its name must match the name of the stored group.
+        """
+        from ._frozen import FrozenWeightedDirectedGraph
+
+        return FrozenWeightedDirectedGraph.load(path, mmap, group).thaw()
+
     # region Classmethods
     @classmethod
     def from_dict(
@@ -422,7 +1396,7 @@ class WeightedDirectedGraph:
             for end, weight in end_dict.items()
         }
         return cls(nodes, edges, group)
-    
+
     @classmethod
     def from_tuples(
         cls, 
@@ -467,124 +1441,391 @@ class WeightedDirectedGraph:
         }
         return cls(nodes, edges, group)
 
-    # region Dunder methods
-    def __repr__(self) -> str:
-        nodes_str = f"Nodes: {self.nodes}\n"
-        edges_str = f"Edges:\n"
-        for edge in self.edges:
-            edges_str += f"{edge}\n"
-        return nodes_str + edges_str
+    @classmethod
+    def from_arrays(
+        cls,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        weights: np.ndarray,
+        group: Group = _real_multiplicative_group,
+        nodes: Iterable[str] | None = None,
+    ) -> "WeightedDirectedGraph":
+        """Creates a graph from columnar data. The i-th edge goes from 'starts[i]' to 'ends[i]'
+        with weight 'weights[i]'. Vector weights are given as a 2 dimensional array with one row
+        per edge. The arrays are validated and indexed with vectorized operations and no edge
+        object is built until it is requested.
 
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, WeightedDirectedGraph):
-            return self._nodes == other._nodes and self._edges == other._edges
-        return False
+        Repeated edges with the same weight are kept once. Repeated edges with different weights
+        raise an EdgesAlreadyExist exception.
 
-    def __len__(self) -> int:
-        return len(self._nodes)
+        Parameters
+        ----------
+        starts : np.ndarray
+            The initial node of each edge.
+        ends : np.ndarray
+            The destination node of each edge.
+        weights : np.ndarray
+            The weight of each edge.
+        group : Group, optional
+            The group where the weights of the graph belongs to. The default is the real multiplicative group.
+        nodes : Iterable[str], optional
+            Extra nodes of the graph. Nodes appearing in the edges are always added.
 
-    # region Auxiliary methods
-    def _iter_aux(
-        self,
-        explorer: PathExplorerPlus,
-        target: str,
-        general_max_visitations: int,
-        specific_max_visitations: dict[str, int],
-        max_weight,
-    ) -> tuple[list[Path], list[PathExplorerPlus]]:
+        Example
+        -------
+        graph = WeightedDirectedGraph.from_arrays(
+            np.array(['A', 'A', 'B']),
+            np.array(['B', 'C', 'C']),
+            np.array([2.0, 8.0, 5.0]),
+            CommonGroups.RealAdditive,
+            nodes=['Z'],
+        )
 
-        current_node = explorer.path[-1]
-        weight = explorer.weight
-        visitations = explorer.visitations.copy()
-        visitations[current_node] = visitations.get(current_node, 0) + 1
-        current_node_vistiations = visitations[current_node]
-        current_node_max_vistiations = specific_max_visitations.get(
-            current_node, general_max_visitations
+        """
+        starts, ends, weights = np.asarray(starts), np.asarray(ends), np.asarray(weights)
+        number_of_edges = len(starts)
+        if starts.ndim != 1 or ends.shape != starts.shape or len(weights) != number_of_edges:
+            raise ValueError("starts, ends and weights must have one entry per edge.")
+
+        columns = [starts, ends]
+        extra_nodes = list(nodes) if nodes is not None else []
+        if extra_nodes:
+            columns.append(np.asarray(extra_nodes))
+        names, codes = np.unique(np.concatenate(columns), return_inverse=True)
+        codes = codes.reshape(-1)
+        start_ids, end_ids = codes[:number_of_edges], codes[number_of_edges : 2 * number_of_edges]
+        if np.any(start_ids == end_ids):
+            raise ValueError("Start and end vertices must be different")
+
+        order = np.lexsort((end_ids, start_ids))
+        start_ids, end_ids, weights = start_ids[order], end_ids[order], weights[order]
+        repeated = np.flatnonzero(
+            (start_ids[1:] == start_ids[:-1]) & (end_ids[1:] == end_ids[:-1])
         )
-        found_path: list[Path] = []
-        new_explorers: list[PathExplorerPlus] = []
+        if repeated.size:
+            node_names = names.tolist()
+            conflicts = {
+                (node_names[start_ids[i]], node_names[end_ids[i]])
+                for i in repeated.tolist()
+                if not group.equal(
+                    _weights_to_list(weights[i : i + 1])[0],
+                    _weights_to_list(weights[i + 1 : i + 2])[0],
+                )
+            }
+            if conflicts:
+                raise EdgesAlreadyExist(conflicts)
+            keep = np.ones(len(start_ids), dtype=bool)
+            keep[repeated + 1] = False
+            start_ids, end_ids, weights = start_ids[keep], end_ids[keep], weights[keep]
+
+        reverse_order = np.argsort(end_ids, kind="stable")
+        children = _rows_from_sorted(start_ids, end_ids, weights, len(names))
+        parents = _rows_from_sorted(
+            end_ids[reverse_order],
+            start_ids[reverse_order],
+            weights[reverse_order],
+            len(names),
+        )
+        return cls._from_adjacency(NodeIndex(names.tolist()), children, parents, group)
 
-        if current_node_vistiations > current_node_max_vistiations:
-            return found_path, new_explorers
+    @classmethod
+    def read_edgelist(
+        cls,
+        path: str,
+        group: Group = _real_multiplicative_group,
+        delimiter: str = ",",
+        columns: tuple[int, int, int | Sequence[int]] = (0, 1, 2),
+        weight_parser: Callable[[Any], "Group.element"] | None = None,
+        header: bool = False,
+        chunk_size: int = 100_000,
+    ) -> "WeightedDirectedGraph":
+        """Creates a graph from a delimited text file with one edge per line. The file is read in
+        chunks of 'chunk_size' lines and each chunk is added to the graph before reading the next
+        one, so the memory used while reading does not depend on the size of the file. Empty lines
+        and lines starting with '#' are skipped.
 
-        if max_weight is not None:
-            if self.group.le(max_weight, weight):
-                return found_path, new_explorers
+        Repeated edges with the same weight are kept once. Repeated edges with different weights
+        raise an EdgesAlreadyExist exception.
 
-        if current_node == target:
-            found_path = [explorer.path]
+        Parameters
+        ----------
+        path : str
+            The file to read.
+        group : Group, optional
+            The group where the weights of the graph belongs to. The default is the real multiplicative group.
+        delimiter : str, optional
+            The field delimiter. The default is ",". Use "\t" for TSV files.
+        columns : tuple[int, int, int | Sequence[int]], optional
+            The positions of the start node, the end node and the weight fields. Vector weights
+            can be spread over several fields giving a sequence of positions. The default is (0, 1, 2).
+        weight_parser : Callable[[Any], Group.element], optional
+            Function that converts the weight field (or the list of weight fields) to an element of
+            the group. The default is float for a single field and a float NumPy array for several.
+        header : bool, optional
+            If True, the first line is skipped. The default is False.
+        chunk_size : int, optional
+            The number of lines parsed and added at once. The default is 100000.
 
-        children_tuples: set[tuple[str, "Group.element"]] = self.children_with_weight(
-            current_node
+        Example
+        -------
+        graph = WeightedDirectedGraph.read_edgelist(
+            'edges.tsv', CommonGroups.RealAdditive, delimiter='\t', header=True
         )
-        forbidden_nodes = {
-            node
-            for node, rep in visitations.items()
-            if rep >= specific_max_visitations.get(node, general_max_visitations)
-        }
-        unexplored_nodes = {
-            (child, child_weight)
-            for child, child_weight in children_tuples
-            if child not in forbidden_nodes
-        }
-        if not unexplored_nodes:
-            return found_path, new_explorers
 
-        new_explorers = [
-            PathExplorerPlus(
-                Path(explorer.path + [node]),
-                self.group(weight, child_weight),
-                visitations,
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        start_column, end_column, weight_columns = columns
+        if isinstance(weight_columns, int):
+            weight_field = lambda fields: fields[weight_columns]
+            parser = weight_parser or float
+        else:
+            weight_columns = list(weight_columns)
+            weight_field = lambda fields: [fields[column] for column in weight_columns]
+            parser = weight_parser or (lambda value: np.array(value, dtype=float))
+
+        graph = cls._from_adjacency(NodeIndex(), {}, {}, group)
+        with open(path, newline="") as file:
+            if header:
+                next(file, None)
+            rows = (
+                fields
+                for fields in csv.reader(file, delimiter=delimiter)
+                if fields and not fields[0].startswith("#")
             )
-            for node, child_weight in unexplored_nodes
-        ]
-        return found_path, new_explorers
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                graph._add_columns(
+                    [fields[start_column] for fields in chunk],
+                    [fields[end_column] for fields in chunk],
+                    [parser(weight_field(fields)) for fields in chunk],
+                )
+        return graph
 
-    def _find_paths(
-        self,
-        start: str,
-        end: str,
-        general_max_visitations: int = 1,
-        specific_max_visitations: dict[str, int] = {},
-        max_iter: int = 1_000,
-        max_paths: int | None = None,
-        max_weight=None,
-    ) -> list[Path]:
-        if max_paths is None:
-            m_paths: int | float = inf
-        else:
-            m_paths = max_paths
-        explorers: list[PathExplorerPlus] = [
-            PathExplorerPlus(Path([start]), self.group.identity)
-        ]
-        all_paths: list[Path] = []
+    @classmethod
+    def _from_adjacency(
+        cls,
+        index: NodeIndex,
+        children: dict[int, dict[int, "Group.element"]],
+        parents: dict[int, dict[int, "Group.element"]],
+        group: Group,
+    ) -> "WeightedDirectedGraph":
+        """Creates a graph directly from its adjacency maps. The nodes of the graph are the
+        keys of 'children', which must be the same as the keys of 'parents'."""
+        graph = cls.__new__(cls)
+        graph._nodes = set(index.names(children))
+        graph._edges = None
+        graph._group = group
+        graph._index = index
+        graph._children = children
+        graph._parents = parents
+        graph._edge_index = {}
+        graph._owned_children = None
+        graph._owned_parents = None
+        return graph
 
-        it = 1
-        while explorers and (it < max_iter) and (len(all_paths) < m_paths):
-            discovered_path, discovered_explorers = self._iter_aux(
-                explorers.pop(0),
-                end,
-                general_max_visitations,
-                specific_max_visitations,
-                max_weight,
-            )
-            all_paths.extend(discovered_path)
-            new_explorers = list(set(discovered_explorers) - set(explorers))
-            explorers.extend(new_explorers)
+    # region Dunder methods
+    def __repr__(self) -> str:
+        nodes_str = f"Nodes: {self.nodes}\n"
+        edges_str = f"Edges:\n"
+        for edge in self.edges:
+            edges_str += f"{edge}\n"
+        return nodes_str + edges_str
 
-            it += 1
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, WeightedDirectedGraph):
+            if self._nodes != other._nodes or len(self._children) != len(other._children):
+                return False
+            names, other_ids = self._index._names, other._index._ids
+            equal = self.group.equal
+            for node, row in self._children.items():
+                other_node = other_ids.get(names[node])
+                other_row = other._children.get(other_node)  # type: ignore
+                if other_row is None or len(row) != len(other_row):
+                    return False
+                for end, weight in row.items():
+                    other_end = other_ids.get(names[end])
+                    if other_end not in other_row or not equal(weight, other_row[other_end]):
+                        return False
+            return True
+        return False
 
-        if it == max_iter:
-            warn(f"Max iterations reached ({max_iter})", Warning)
+    # region Auxiliary methods
+    def _copy(self) -> "WeightedDirectedGraph":
+        """Returns a copy of the graph that can be modified without affecting this one. Only the
+        node tables are copied, the adjacency rows are shared by both graphs and copied the first
+        time any of them modifies one (copy on write), so deriving a graph costs about the size
+        of the change instead of the size of the graph."""
+        graph = WeightedDirectedGraph.__new__(WeightedDirectedGraph)
+        graph._nodes = self._nodes.copy()
+        graph._edges = None
+        graph._edge_index = {}
+        graph._index = self._index
+        graph._group = self._group
+        graph._children = self._children.copy()
+        graph._parents = self._parents.copy()
+        graph._owned_children = set()
+        graph._owned_parents = set()
+        self._owned_children = set()
+        self._owned_parents = set()
+        return graph
+
+    def _writable_children(self, node: int) -> dict[int, "Group.element"]:
+        """Returns the children row of the node, copying it first if it is shared with another graph."""
+        if self._owned_children is not None and node not in self._owned_children:
+            self._children[node] = self._children.get(node, {}).copy()
+            self._owned_children.add(node)
+        return self._children.setdefault(node, {})
+
+    def _writable_parents(self, node: int) -> dict[int, "Group.element"]:
+        """Returns the parents row of the node, copying it first if it is shared with another graph."""
+        if self._owned_parents is not None and node not in self._owned_parents:
+            self._parents[node] = self._parents.get(node, {}).copy()
+            self._owned_parents.add(node)
+        return self._parents.setdefault(node, {})
+
+    def _insert_edge(self, edge: WeightedDirectedEdge) -> None:
+        """Adds the edge to the graph and its adjacency maps without any check."""
+        self._version += 1
+        if self._edges is not None:
+            self._edges.add(edge)
+        self._edge_index[(edge.start, edge.end)] = edge
+        start, end = self._index.add(edge.start), self._index.add(edge.end)
+        self._writable_children(start)[end] = edge._weight
+        self._children.setdefault(end, {})
+        self._writable_parents(end)[start] = edge._weight
+        self._parents.setdefault(start, {})
+
+    def _insert_rows(self, rows: dict[int, dict[int, "Group.element"]]) -> None:
+        """Adds the edges given as {start_id: {end_id: weight}} to the graph and its adjacency
+        maps without any check. Each modified row is updated once."""
+        self._version += 1
+        names = self._index._names
+        parents_rows: dict[int, dict[int, "Group.element"]] = {}
+        for start, row in rows.items():
+            if not row:
+                continue
+            self._writable_children(start).update(row)
+            self._parents.setdefault(start, {})
+            for end, weight in row.items():
+                parents_rows.setdefault(end, {})[start] = weight
+                self._edge_index.pop((names[start], names[end]), None)
+        for end, row in parents_rows.items():
+            self._writable_parents(end).update(row)
+            self._children.setdefault(end, {})
+        if self._edges is not None:
+            self._edges.update(
+                self._edge(names[start], names[end])
+                for start, row in rows.items()
+                for end in row
+            )
 
-        return all_paths
+    def _add_columns(
+        self,
+        starts: list[str],
+        ends: list[str],
+        weights: list["Group.element"],
+    ) -> None:
+        """Adds the edges given as columns to the graph, adding their nodes if needed. Repeated
+        edges with the same weight are added once; if any edge is repeated with a different
+        weight an EdgesAlreadyExist exception is raised and no edge is added."""
+        add, equal = self._index.add, self.group.equal
+        names = self._index._names
+        new_rows: dict[int, dict[int, "Group.element"]] = {}
+        conflicts: set[tuple[str, str]] = set()
+        for start, end, weight in zip(starts, ends, weights):
+            if start == end:
+                raise ValueError("Start and end vertices must be different")
+            start_id, end_id = add(start), add(end)
+            row = new_rows.setdefault(start_id, {})
+            old_weight = row.get(end_id)
+            if old_weight is None and start_id in self._children:
+                old_weight = self._children[start_id].get(end_id)
+            if old_weight is None:
+                row[end_id] = weight
+            elif not equal(old_weight, weight):
+                conflicts.add((start, end))
+        if conflicts:
+            raise EdgesAlreadyExist(conflicts)
+
+        for start_id, row in new_rows.items():
+            for node_id in (start_id, *row):
+                if node_id not in self._children:
+                    self._nodes.add(names[node_id])
+                    self._children[node_id] = {}
+                    self._parents[node_id] = {}
+        self._insert_rows(new_rows)
+
+    def _remove_edge(self, start: str, end: str) -> None:
+        """Removes the edge from the graph and its adjacency maps without any check."""
+        self._version += 1
+        self._edges = None
+        self._edge_index.pop((start, end), None)
+        start_id, end_id = self._index._ids[start], self._index._ids[end]
+        del self._writable_children(start_id)[end_id]
+        del self._writable_parents(end_id)[start_id]
+
+    def _check_edge(self, start: str, end: str) -> None:
+        """Raises an exception if the edge from start to end is not in the graph."""
+        bad_nodes = {start, end} - self._nodes
+        if bad_nodes:
+            raise NodeNotFound(bad_nodes)
+        if not self.has_edge(start, end):
+            raise EdgeNotFound(start, end)
 
-    def _find_cycles(self, node: str, max_cycles: int | None) -> list[Cycle]:
-        list_cycles = self._find_paths(
-            start=node,
-            end=node,
-            general_max_visitations=1,
-            specific_max_visitations={node: 2},
-            max_paths=max_cycles,
-        )
-        return [Cycle(cycle) for cycle in list_cycles]
+    def _fundamental_cycle(
+        self, start: int, end: int, tree_parents: dict[int, int | None]
+    ) -> list[int]:
+        """Returns the ids of the cycle made of the edge from start to end and the path of the
+        spanning forest that goes back from end to start."""
+        start_branch = [start]
+        while tree_parents[start_branch[-1]] is not None:
+            start_branch.append(tree_parents[start_branch[-1]])  # type: ignore
+        start_ancestors = set(start_branch)
+        end_branch = [end]
+        while end_branch[-1] not in start_ancestors:
+            end_branch.append(tree_parents[end_branch[-1]])  # type: ignore
+        common_ancestor = end_branch[-1]
+        back_branch = start_branch[: start_branch.index(common_ancestor)]
+        return [start] + end_branch + back_branch[::-1]
+
+    def _undirected_path_weight(self, path: list[int]) -> "Group.element":
+        """Weight of a path of node ids that may go through edges backwards, with the inverse of
+        their weights, like in the bidirectional view of the graph."""
+        group = self.group
+        weight = group.identity
+        for start, end in zip(path, path[1:]):
+            step_weight = self._children[start].get(end)
+            if step_weight is None:
+                step_weight = group.inverse(self._children[end][start])
+            weight = group(weight, step_weight)
+        return weight
+
+    def _edge(self, start: str, end: str) -> WeightedDirectedEdge:
+        """Returns the edge object of an existing edge, building it if it is not indexed yet."""
+        edge = self._edge_index.get((start, end))
+        if edge is None:
+            ids = self._index._ids
+            weight = self._children[ids[start]][ids[end]]
+            edge = WeightedDirectedEdge(start, end, weight, self.group)
+            self._edge_index[(start, end)] = edge
+        return edge
+
+    def _successors(self, node: int) -> Iterable[tuple[int, "Group.element"]]:
+        return self._children[node].items()
+
+    def _predecessors(self, node: int) -> Iterable[tuple[int, "Group.element"]]:
+        return self._parents[node].items()
+
+    def _hop_weights(self, paths: list[list[int]]) -> list["Group.element"]:
+        children = self._children
+        weights = []
+        for path in paths:
+            for start, end in zip(path, path[1:]):
+                row = children.get(start, {})
+                if end not in row:
+                    raise ValueError("The given path is not a valid path in the graph.")
+                weights.append(row[end])
+        return weights
@@ -0,0 +1,68 @@
+from typing import Iterable, Iterator
+from ..exceptions import NodeNotFound  # type: ignore
+
+__all__ = ["NodeIndex"]
+
+
+class NodeIndex:
+    """Interning table that maps node names to dense integer ids and back. Ids are given in
+    insertion order starting at 0 and are never reused, so an id keeps pointing to the same
+    name for the whole life of the index.
+
+    Graphs intern their nodes when they are added and run their algorithms on the ids, which
+    are cheaper to hash and compare than arbitrary names and can be used to index arrays.
+    A graph and the graphs derived from it with 'inplace=False' share the same index, so
+    deleting a node from a graph does not remove its name from the index."""
+
+    __slots__ = ("_ids", "_names")
+
+    def __init__(self, nodes: Iterable[str] = ()) -> None:
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: str) -> int:
+        """Interns the node and returns its id. Nodes already in the index keep their id."""
+        node_id = self._ids.get(node)
+        if node_id is None:
+            node_id = len(self._names)
+            self._ids[node] = node_id
+            self._names.append(node)
+        return node_id
+
+    def id(self, node: str) -> int:
+        """Returns the id of the node."""
+        if node not in self._ids:
+            raise NodeNotFound(node)
+        return self._ids[node]
+
+    def name(self, node_id: int) -> str:
+        """Returns the name of the node with the given id."""
+        return self._names[node_id]
+
+    def ids(self, nodes: Iterable[str]) -> list[int]:
+        """Returns the ids of the given nodes."""
+        ids = self._ids
+        nodes = list(nodes)
+        unknown_nodes = {node for node in nodes if node not in ids}
+        if unknown_nodes:
+            raise NodeNotFound(unknown_nodes)
+        return [ids[node] for node in nodes]
+
+    def names(self, node_ids: Iterable[int]) -> list[str]:
+        """Returns the names of the nodes with the given ids."""
+        names = self._names
+        return [names[node_id] for node_id in node_ids]
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"NodeIndex({self._names})"
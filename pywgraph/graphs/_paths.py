@@ -1,5 +1,3 @@
-from functools import cached_property
-
 
 def _cycle_representations(cycle: list[str]) -> list[list[str]]:
     return [cycle[-i:] + cycle[:-i] for i in range(len(cycle))]
@@ -18,6 +16,8 @@ def _canonic_representation(cycle: list[str]) -> list[str]:
 class Path(list[str]):
     """Class that represents a path."""
 
+    __slots__ = ()
+
     def __init__(self, path: list[str]) -> None:
         if any(path[i] == path[i + 1] for i in range(len(path) - 1)):
             raise ValueError("A path can not contain equal consecutive elements")
@@ -42,6 +42,8 @@ class Cycle(Path):
     of a cycle is given by a canonic representation, which consists of the representation that 
     starts with the 'smallest' node."""
 
+    __slots__ = ("_clean_cycle", "_canonic_representation", "_hash")
+
     def __init__(self, cycle: Path | list[str]) -> None:
         if not cycle:
             raise ValueError("A cycle can not be empty")
@@ -50,22 +52,26 @@ class Cycle(Path):
         super().__init__(cycle)
 
         if len(cycle) == 1:
-            self._clean_cycle = cycle
+            self._clean_cycle = list(cycle)
         else:
-            self._clean_cycle = cycle[:-1]
+            self._clean_cycle = list(cycle[:-1])
+        self._canonic_representation: list[str] | None = None
+        self._hash: int | None = None
 
-    @cached_property
+    @property
     def canonic_representation(self) -> list[str]:
-        return _canonic_representation(self._clean_cycle)
+        if self._canonic_representation is None:
+            self._canonic_representation = _canonic_representation(self._clean_cycle)
+        return self._canonic_representation
 
-    @cached_property
+    @property
     def equivalent_representations(self) -> list[list[str]]:
         return _cycle_representations(self._clean_cycle)
 
     def __hash__(self) -> int:  # type: ignore
-        return hash(
-            tuple(self.canonic_representation)
-        )  # Mypy don't allow to override hash for list since lists are not hashable
+        if self._hash is None:
+            self._hash = hash(tuple(self.canonic_representation))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Cycle):
@@ -115,10 +121,13 @@ class PathExplorer:
 class PathExplorerPlus:
     """Auxiliary object to help in the searching of paths on a graph"""
 
+    __slots__ = ("_path", "_weight", "_visitations", "_hash")
+
     def __init__(self, path: Path, weight: "Group.element", visitations: dict[str, int] = {}) -> None:
         self._path = path
         self._weight = weight
         self._visitations = visitations
+        self._hash: int | None = None
 
     @property
     def path(self) -> Path:
@@ -133,14 +142,16 @@ class PathExplorerPlus:
         return self._visitations
 
     def __hash__(self) -> int:
-        hash_list = hash(tuple(self.path))
-        hash_dict = hash(
-            tuple(sorted(list(self.visitations.items()), key=lambda x: x[0]))
-        )
-        return hash_list ^ hash_dict
+        if self._hash is None:
+            hash_list = hash(tuple(self.path))
+            hash_dict = hash(
+                tuple(sorted(list(self.visitations.items()), key=lambda x: x[0]))
+            )
+            self._hash = hash_list ^ hash_dict
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, PathExplorer):
+        if isinstance(other, PathExplorerPlus):
             return (self.path, self.visitations) == (other.path, other.visitations)
         return False
 
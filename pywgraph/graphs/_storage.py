@@ -0,0 +1,137 @@
+import json
+import pickle
+import numpy as np
+from typing import Any
+from ..groups import Group, CommonGroups
+
+# Binary layout of a saved graph:
+#   magic (8 bytes) | header length (uint64, little endian) | JSON header | padding | sections
+# Each section is stored raw at an offset aligned to '_ALIGNMENT' bytes, so numeric arrays can
+# be memory mapped. The header keeps the format version, the group name and the offset, dtype
+# and shape of each section.
+
+_MAGIC = b"PYWGRAPH"
+_FORMAT_VERSION = 1
+_ALIGNMENT = 64
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _predefined_group(name: str, weights_shape: tuple[int, ...]) -> Group | None:
+    """Returns the predefined group with the given name, if there is one."""
+    candidates = [
+        CommonGroups.RealMultiplicative,
+        CommonGroups.RealAdditive,
+        CommonGroups.IntegerAdditive,
+    ]
+    if len(weights_shape) == 2 and weights_shape[1] > 1:
+        candidates.append(CommonGroups.RealsNMultiplicative(weights_shape[1]))
+        candidates.append(CommonGroups.RealsNAdditive(weights_shape[1]))
+    for group in candidates:
+        if group.name == name:
+            return group
+    return None
+
+
+def _save_csr(
+    path: str,
+    nodes: list[str],
+    arrays: dict[str, np.ndarray],
+    weights: np.ndarray,
+    group: Group,
+) -> None:
+    """Writes the node table, the CSR arrays and the weights of a graph to a file. Object
+    weights, which can not be stored as a raw array, are pickled."""
+    sections: dict[str, bytes] = {"nodes": json.dumps(nodes).encode("utf-8")}
+    header: dict[str, Any] = {
+        "version": _FORMAT_VERSION,
+        "group": group.name,
+        "weights_pickled": weights.dtype.hasobject,
+        "arrays": {},
+    }
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        sections[name] = array.tobytes()
+        header["arrays"][name] = {"dtype": array.dtype.str, "shape": list(array.shape)}
+    if weights.dtype.hasobject:
+        sections["weights"] = pickle.dumps(list(weights), protocol=pickle.HIGHEST_PROTOCOL)
+        header["weights_shape"] = list(weights.shape)
+    else:
+        weights = np.ascontiguousarray(weights)
+        sections["weights"] = weights.tobytes()
+        header["arrays"]["weights"] = {"dtype": weights.dtype.str, "shape": list(weights.shape)}
+        header["weights_shape"] = list(weights.shape)
+
+    # The offsets are part of the header, so its length is fixed before computing them
+    header["sections"] = {name: [0, len(data)] for name, data in sections.items()}
+    header_length = len(json.dumps(header).encode("utf-8")) + 32 * len(sections)
+    offset = _aligned(len(_MAGIC) + 8 + header_length)
+    for name, data in sections.items():
+        header["sections"][name] = [offset, len(data)]
+        offset = _aligned(offset + len(data))
+    header_bytes = json.dumps(header).encode("utf-8").ljust(header_length)
+
+    with open(path, "wb") as file:
+        file.write(_MAGIC)
+        file.write(len(header_bytes).to_bytes(8, "little"))
+        file.write(header_bytes)
+        for name, data in sections.items():
+            file.seek(header["sections"][name][0])
+            file.write(data)
+
+
+def _load_csr(
+    path: str, mmap: bool = True, group: Group | None = None
+) -> tuple[list[str], dict[str, np.ndarray], np.ndarray, Group]:
+    """Reads a file written by '_save_csr'. Returns the node names, the CSR arrays, the weights
+    and the group. With 'mmap' the numeric arrays are read only memory maps of the file.
+
+    The group is resolved from its stored name among the predefined groups. Graphs with other
+    groups must be loaded passing the group, whose name must match the stored one."""
+    with open(path, "rb") as file:
+        if file.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{path} is not a saved graph.")
+        header_length = int.from_bytes(file.read(8), "little")
+        header = json.loads(file.read(header_length).decode("utf-8"))
+        if header["version"] > _FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported graph format version {header['version']}. "
+                f"The newest supported version is {_FORMAT_VERSION}."
+            )
+
+        def read_section(name: str) -> bytes:
+            offset, length = header["sections"][name]
+            file.seek(offset)
+            return file.read(length)
+
+        nodes = json.loads(read_section("nodes").decode("utf-8"))
+        weights_shape = tuple(header["weights_shape"])
+        if header["weights_pickled"]:
+            weights = np.empty(weights_shape, dtype=object)
+            for position, weight in enumerate(pickle.loads(read_section("weights"))):
+                weights[position] = weight
+        arrays: dict[str, np.ndarray] = {}
+        for name, description in header["arrays"].items():
+            dtype, shape = np.dtype(description["dtype"]), tuple(description["shape"])
+            offset, length = header["sections"][name]
+            if mmap and length:
+                arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+            else:
+                arrays[name] = np.frombuffer(read_section(name), dtype=dtype).reshape(shape)
+    if not header["weights_pickled"]:
+        weights = arrays.pop("weights")
+
+    if group is None:
+        group = _predefined_group(header["group"], weights_shape)
+        if group is None:
+            raise ValueError(
+                f"The graph was saved with the group '{header['group']}', which is not "
+                "predefined. Pass the group to load it."
+            )
+    elif group.name != header["group"]:
+        raise ValueError(
+            f"The graph was saved with the group '{header['group']}', not '{group.name}'."
+        )
+    return nodes, arrays, weights, group
@@ -0,0 +1,118 @@
+from typing import Iterable
+from ..groups import Group
+from ..exceptions import NodeNotFound, EdgeNotFound  # type: ignore
+from ._graph import _WeightedDirectedGraphBase, WeightedDirectedGraph  # type: ignore
+from ._frozen import FrozenWeightedDirectedGraph  # type: ignore
+from ._node_index import NodeIndex  # type: ignore
+
+__all__ = ["BidirectionalView"]
+
+
+class BidirectionalView(_WeightedDirectedGraphBase):
+    """Read only view of a graph where every edge can also be traversed backwards. It behaves
+    like the graph returned by 'add_reverse_edges' with the same method, but the reverse edges
+    are computed on the fly from the original graph instead of being stored. The view follows
+    the changes made in place to the original graph.
+
+    The weight of a reverse edge is the inverse of the original weight with the 'inverse' method
+    and the same weight with the 'mirror' method. Edges that already exist in both directions
+    keep their own weights."""
+
+    def __init__(
+        self,
+        graph: WeightedDirectedGraph | FrozenWeightedDirectedGraph,
+        method: str = "inverse",
+    ) -> None:
+        if method == "inverse":
+            self._reverse_weight = graph.group.inverse
+        elif method == "mirror":
+            self._reverse_weight = lambda weight: weight
+        else:
+            raise ValueError(
+                f"Unknown method '{method}'. Available methods are 'inverse' and 'mirror'."
+            )
+        self._graph = graph
+        self._method = method
+
+    # region Properties
+    @property
+    def graph(self) -> WeightedDirectedGraph | FrozenWeightedDirectedGraph:
+        return self._graph
+
+    @property
+    def method(self) -> str:
+        return self._method
+
+    @property
+    def is_well_defined(self) -> bool:
+        return self._graph.is_well_defined
+
+    @property
+    def _nodes(self) -> set[str] | frozenset[str]:  # type: ignore
+        return self._graph._nodes
+
+    @property
+    def _index(self) -> NodeIndex:  # type: ignore
+        return self._graph._index
+
+    @property
+    def _group(self) -> Group:  # type: ignore
+        return self._graph._group
+
+    @property
+    def _version(self) -> int:  # type: ignore
+        return self._graph._version
+
+    # region Edge methods
+    def has_edge(self, start: str, end: str) -> bool:
+        """Checks if the edge from start to end or its reverse is in the original graph."""
+        return self._graph.has_edge(start, end) or self._graph.has_edge(end, start)
+
+    def weight(self, start: str, end: str) -> "Group.element":
+        """Returns the weight of the edge going from start to end in the view."""
+        bad_nodes = {start, end} - self._nodes
+        if bad_nodes:
+            raise NodeNotFound(bad_nodes)
+        if self._graph.has_edge(start, end):
+            return self._graph.weight(start, end)
+        if self._graph.has_edge(end, start):
+            return self._reverse_weight(self._graph.weight(end, start))
+        raise EdgeNotFound(start, end)
+
+    # region Dunder methods
+    def __repr__(self) -> str:
+        return f"BidirectionalView(method={self._method}, graph={self._graph!r})"
+
+    # region Auxiliary methods
+    def _successors(self, node: int) -> Iterable[tuple[int, "Group.element"]]:
+        forward = list(self._graph._successors(node))
+        children = {child for child, _ in forward}
+        reverse_weight = self._reverse_weight
+        forward.extend(
+            (parent, reverse_weight(weight))
+            for parent, weight in self._graph._predecessors(node)
+            if parent not in children
+        )
+        return forward
+
+    def _predecessors(self, node: int) -> Iterable[tuple[int, "Group.element"]]:
+        backward = list(self._graph._predecessors(node))
+        parents = {parent for parent, _ in backward}
+        reverse_weight = self._reverse_weight
+        backward.extend(
+            (child, reverse_weight(weight))
+            for child, weight in self._graph._successors(node)
+            if child not in parents
+        )
+        return backward
+
+    def _hop_weights(self, paths: list[list[int]]) -> list["Group.element"]:
+        hop_weights = self._graph._hop_weights
+        weights: list["Group.element"] = []
+        for path in paths:
+            for start, end in zip(path, path[1:]):
+                try:
+                    weights.extend(hop_weights([[start, end]]))
+                except ValueError:
+                    weights.append(self._reverse_weight(hop_weights([[end, start]])[0]))
+        return weights
@@ -21,6 +21,8 @@ class Group:
         hash_function: Callable[[T], int] = hash,
         group_checker: Callable[[Any], bool] | None = None,
         strict_total_order_function: Callable[[T, T], bool] | None = None,
+        ufunc: Any = None,
+        sort_key: Callable[[T], Any] | None = None,
     ) -> None:
         """Abstraction of a mathematical group.
 
@@ -39,6 +41,18 @@ class Group:
             if elements of the group are not hashable.
         group_checker : Callable[[Any], bool], optional
             Function that checks if an element is in the group, by default None.
+        strict_total_order_function : Callable[[T, T], bool], optional
+            Function that returns True if the first element is strictly smaller than the
+            second one, by default None.
+        ufunc : numpy.ufunc, optional
+            NumPy universal function that computes the operation elementwise over arrays of
+            elements, by default None. Only for groups whose elements are real numbers or
+            arrays of real numbers. If given, batch methods reduce weights with it instead of
+            calling the operation once per pair of elements.
+        sort_key : Callable[[T], Any], optional
+            Function that maps each element to a key whose natural order is the order given by
+            strict_total_order_function, by default None. If given, sorting and priority queues
+            compare the keys directly instead of going through 'cmp_key'.
 
         Examples
         --------
@@ -57,6 +71,8 @@ class Group:
         self._hash_function = hash_function
         self._group_checker = group_checker
         self.strict_total_order_function = strict_total_order_function
+        self._ufunc = ufunc
+        self._sort_key = sort_key
 
     @property
     def name(self) -> str:
@@ -78,6 +94,10 @@ class Group:
     def hash_function(self) -> Callable[[T], int]:
         return self._hash_function
 
+    @property
+    def ufunc(self) -> Any:
+        return self._ufunc
+
     @property
     def cmp_key(self) -> Callable[[T], Any]:
         def _cmp(a: T, b: T) -> int:
@@ -90,6 +110,14 @@ class Group:
 
         return cmp_to_key(_cmp)
 
+    @property
+    def sort_key(self) -> Callable[[T], Any]:
+        """Returns a key function for the order of the group, the one given on initialization
+        or 'cmp_key' if there is none."""
+        if self._sort_key is None:
+            return self.cmp_key
+        return self._sort_key
+
     def inverse(self, element: T) -> T:
         return self.inverse_function(element)
 
@@ -15,6 +15,8 @@ _real_multiplicative_group = Group(
     inverse_function=lambda x: 1 / x,
     group_checker=_reals_check,
     strict_total_order_function=lambda x, y: x < y,
+    ufunc=np.multiply,
+    sort_key=float,
 )
 
 _real_additive_group = Group(
@@ -24,6 +26,8 @@ _real_additive_group = Group(
     inverse_function=lambda x: -x,
     group_checker=_reals_check,
     strict_total_order_function=lambda x, y: x < y,
+    ufunc=np.add,
+    sort_key=float,
 )
 
 # region: Integers 1 dimensional groups
@@ -36,6 +40,7 @@ _integer_additive_group = Group(
     inverse_function=lambda x: -x,
     group_checker=_integers_check,
     strict_total_order_function=lambda x, y: x < y,
+    sort_key=lambda x: x,
 )
 
 
@@ -56,6 +61,7 @@ def _reals_n_multiplicative_group(n: int) -> Group:
         inverse_function=lambda x: 1 / x,
         group_checker=lambda x: _reals_n_check(x, n),
         strict_total_order_function=None,
+        ufunc=np.multiply,
     )
 
 
@@ -67,6 +73,7 @@ def _reals_n_additive_group(n: int) -> Group:
         inverse_function=lambda x: -x,
         group_checker=lambda x: _reals_n_check(x, n),
         strict_total_order_function=None,
+        ufunc=np.add,
     )
 
 
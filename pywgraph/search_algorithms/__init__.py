@@ -1,3 +1,9 @@
 from ._dijkstra import *
+from ._parallel_paths import *
+from ._k_shortest_paths import *
+from ._all_pairs import *
+from ._bidirectional_dijkstra import *
+from ._a_star import *
+from ._bellman_ford import *
 
 __all__ = [s for s in dir() if not s.startswith("_")]
\ No newline at end of file
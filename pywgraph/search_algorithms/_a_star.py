@@ -0,0 +1,282 @@
+import numpy as np
+from heapq import heappush, heappop
+from itertools import count
+from math import exp, log
+from typing import Any, Callable, Iterable
+from ..graphs import WeightedDirectedGraph, FrozenWeightedDirectedGraph
+from ..groups import Group
+from ..exceptions import NodeNotFound, PathNotFound
+from ._dijkstra import DijkstraResult
+
+__all__ = ["AStar", "LandmarkHeuristic"]
+
+# Cost stored in the landmark arrays for the nodes that can not be reached. Being finite, the
+# differences of two unreachable costs are 0 instead of nan.
+_UNREACHABLE = 1e300
+
+
+def _lightest_costs(
+    source: int,
+    neighbors: Callable[[int], Iterable[tuple[int, Any]]],
+    to_cost: Callable[[float], float],
+    costs: np.ndarray,
+) -> None:
+    """Dijkstra search on the costs 'to_cost(weight)' from the source following 'neighbors'.
+    Writes the cost of reaching each node in 'costs', indexed by node id."""
+    costs[source] = 0.0
+    settled: set[int] = set()
+    heap = [(0.0, source)]
+    while heap:
+        cost, node = heappop(heap)
+        if node in settled:
+            continue
+        settled.add(node)
+        for neighbor, weight in neighbors(node):
+            neighbor_cost = cost + to_cost(weight)
+            if neighbor_cost < costs[neighbor]:
+                costs[neighbor] = neighbor_cost
+                heappush(heap, (neighbor_cost, neighbor))
+
+
+class LandmarkHeuristic:
+    """Landmark (ALT) lower bounds for A*. The lightest path weights from each landmark to
+    every node and from every node to each landmark are computed once with Dijkstra and stored
+    as NumPy arrays. By the triangle inequality, the weight of the lightest path from a node v
+    to a target t is at least d(L, t) - d(L, v) and d(v, L) - d(t, L) for every landmark L,
+    and the heuristic is the largest of these bounds, which is consistent.
+
+    Only the real additive group with non negative weights and the real multiplicative group
+    with weights not below 1 are supported, the latter on the logarithms of the weights.
+
+    Parameters
+    ----------
+    graph : WeightedDirectedGraph | FrozenWeightedDirectedGraph
+        The graph. The heuristic is only valid while the graph does not change.
+    landmarks : int | list[str], optional
+        Landmark nodes, or the number of landmarks to choose, by default 8. They are chosen by
+        farthest selection: starting with the smallest node, each new landmark is the node
+        farthest from the ones already chosen, preferring the nodes they do not reach.
+    """
+
+    def __init__(
+        self,
+        graph: WeightedDirectedGraph | FrozenWeightedDirectedGraph,
+        landmarks: int | list[str] = 8,
+    ) -> None:
+        group = graph.group
+        if group.strict_total_order_function is None or group.ufunc not in (np.add, np.multiply):
+            raise ValueError(
+                "Landmark heuristics only support the real additive and multiplicative groups."
+            )
+        lowest_weight = 0 if group.ufunc is np.add else 1
+        for node in graph.nodes:
+            for _, weight in graph._successors(graph._index._ids[node]):
+                if weight < lowest_weight:
+                    raise ValueError(
+                        "Landmark heuristics need weights that are not below the identity of "
+                        "the group."
+                    )
+        self._graph = graph
+        self._multiplicative = group.ufunc is np.multiply
+        self._to_cost: Callable[[float], float] = log if self._multiplicative else float
+
+        if isinstance(landmarks, int):
+            landmark_ids = self._choose_landmarks(landmarks)
+        else:
+            bad_nodes = set(landmarks) - graph.nodes
+            if bad_nodes:
+                raise NodeNotFound(bad_nodes)
+            landmark_ids = [graph._index._ids[node] for node in landmarks]
+        n = len(graph._index)
+        self._from_landmarks = np.empty((n, len(landmark_ids)))
+        self._to_landmarks = np.empty((n, len(landmark_ids)))
+        for position, landmark in enumerate(landmark_ids):
+            self._from_landmarks[:, position] = self._costs(landmark, graph._successors)
+            self._to_landmarks[:, position] = self._costs(landmark, graph._predecessors)
+        self._from_landmarks[np.isinf(self._from_landmarks)] = _UNREACHABLE
+        self._to_landmarks[np.isinf(self._to_landmarks)] = _UNREACHABLE
+        self._landmarks = [graph._index._names[landmark] for landmark in landmark_ids]
+
+    @property
+    def landmarks(self) -> list[str]:
+        return self._landmarks
+
+    @property
+    def from_landmarks(self) -> np.ndarray:
+        """Costs of the lightest paths from each landmark (columns) to each node (rows, by node
+        id), inf if there is none. The costs are the logarithms of the weights in the real
+        multiplicative group."""
+        return np.where(self._from_landmarks == _UNREACHABLE, np.inf, self._from_landmarks)
+
+    @property
+    def to_landmarks(self) -> np.ndarray:
+        """Costs of the lightest paths from each node (rows, by node id) to each landmark
+        (columns), inf if there is none."""
+        return np.where(self._to_landmarks == _UNREACHABLE, np.inf, self._to_landmarks)
+
+    def heuristic(self, end: str) -> Callable[[str], "Group.element"]:
+        """Returns the heuristic h(node) for paths that end in the given node."""
+        if end not in self._graph.nodes:
+            raise NodeNotFound(end)
+        bound = self._bound(self._graph._index._ids[end])
+        ids = self._graph._index._ids
+        return lambda node: bound(ids[node])
+
+    def __repr__(self) -> str:
+        return f"LandmarkHeuristic(landmarks={self._landmarks})"
+
+    # region Auxiliary methods
+    def _bound(self, end: int) -> Callable[[int], "Group.element"]:
+        """Returns the heuristic for paths that end in the given node id, taking node ids."""
+        from_landmarks, to_landmarks = self._from_landmarks, self._to_landmarks
+        landmarks_to_end = from_landmarks[end]
+        end_to_landmarks = to_landmarks[end]
+
+        def cost_bound(node: int) -> float:
+            bound = max(
+                (landmarks_to_end - from_landmarks[node]).max(),
+                (to_landmarks[node] - end_to_landmarks).max(),
+                0.0,
+            )
+            # Only an unreachable cost minus a reachable one gets this large, which means
+            # that the end can not be reached from the node
+            return np.inf if bound >= _UNREACHABLE / 2 else float(bound)
+
+        if self._multiplicative:
+            return lambda node: exp(cost_bound(node))
+        return cost_bound
+
+    def _costs(
+        self, source: int, neighbors: Callable[[int], Iterable[tuple[int, Any]]]
+    ) -> np.ndarray:
+        costs = np.full(len(self._graph._index), np.inf)
+        _lightest_costs(source, neighbors, self._to_cost, costs)
+        return costs
+
+    def _choose_landmarks(self, number: int) -> list[int]:
+        graph = self._graph
+        node_ids = sorted(graph._index._ids[node] for node in graph.nodes)
+        if not node_ids or number <= 0:
+            return []
+        is_node = np.zeros(len(graph._index), dtype=bool)
+        is_node[node_ids] = True
+        landmarks = [graph._index._ids[min(graph.nodes)]]
+        closest = np.full(len(graph._index), np.inf)
+        while len(landmarks) < min(number, len(node_ids)):
+            closest = np.fmin(closest, self._costs(landmarks[-1], graph._successors))
+            closest[landmarks[-1]] = -np.inf
+            candidates = np.where(is_node, closest, -np.inf)
+            landmarks.append(int(np.argmax(candidates)))
+        return landmarks
+
+
+class AStar:
+    """A* search for point to point shortest paths. It is Dijkstra's algorithm ordered by the
+    weight from the start operated with a heuristic estimate of the weight to the end, so the
+    nodes that lead away from the end are settled late or never.
+
+    The heuristic h(node) must be consistent with the 'le' order of the group: h(end) must be
+    the identity and h(u) must not be above the weight of an edge from u to v operated with
+    h(v). Without a heuristic the search is Dijkstra's algorithm.
+
+    Parameters
+    ----------
+    graph : WeightedDirectedGraph | FrozenWeightedDirectedGraph
+        The graph.
+    landmarks : LandmarkHeuristic | None, optional
+        Landmark heuristic used by the queries that do not pass their own heuristic.
+
+    Example
+    -------
+    a_star = AStar(graph, LandmarkHeuristic(graph, landmarks=4))
+    result = a_star.shortest_path('A', 'E')
+    """
+
+    def __init__(
+        self,
+        graph: WeightedDirectedGraph | FrozenWeightedDirectedGraph,
+        landmarks: LandmarkHeuristic | None = None,
+    ):
+        self._graph = graph
+        self._landmarks = landmarks
+        self._last_settled: int | None = None
+
+    @property
+    def graph(self) -> WeightedDirectedGraph | FrozenWeightedDirectedGraph:
+        return self._graph
+
+    @property
+    def landmarks(self) -> LandmarkHeuristic | None:
+        return self._landmarks
+
+    @property
+    def last_settled(self) -> int | None:
+        """Number of nodes settled by the last query, None if no query has been made yet."""
+        return self._last_settled
+
+    def shortest_path(
+        self,
+        start: str,
+        end: str,
+        heuristic: Callable[[str], "Group.element"] | None = None,
+    ) -> DijkstraResult:
+        """Returns the shortest path from start to end. The heuristic estimates the weight of
+        the path from each node to end, by default the landmark heuristic if there is one."""
+        graph = self._graph
+        bad_nodes = {start, end} - graph.nodes
+        if bad_nodes:
+            raise NodeNotFound(bad_nodes)
+        ids = graph._index._ids
+        start_id, end_id = ids[start], ids[end]
+        if heuristic is not None:
+            names = graph._index._names
+            estimate = lambda node: heuristic(names[node])
+        elif self._landmarks is not None:
+            estimate = self._landmarks._bound(end_id)
+        else:
+            estimate = None
+
+        group = graph.group
+        sort_key = group.sort_key
+        weights: dict[int, "Group.element"] = {start_id: group.identity}
+        keys: dict[int, Any] = {start_id: sort_key(group.identity)}
+        estimates: dict[int, "Group.element"] = {}
+        previous: dict[int, int] = {}
+        settled: set[int] = set()
+        counter = count(1)
+
+        def priority(node: int) -> Any:
+            if estimate is None:
+                return keys[node]
+            if node not in estimates:
+                estimates[node] = estimate(node)
+            return sort_key(group(weights[node], estimates[node]))
+
+        heap = [(priority(start_id), 0, start_id)]
+        while heap and end_id not in settled:
+            _, _, node = heappop(heap)
+            if node in settled:
+                continue
+            settled.add(node)
+            weight = weights[node]
+            for child, child_weight in graph._successors(node):
+                if child in settled:
+                    continue
+                extended_weight = group(weight, child_weight)
+                extended_key = sort_key(extended_weight)
+                if child not in keys or extended_key < keys[child]:
+                    weights[child] = extended_weight
+                    keys[child] = extended_key
+                    previous[child] = node
+                    heappush(heap, (priority(child), next(counter), child))
+
+        self._last_settled = len(settled)
+        if end_id not in settled:
+            raise PathNotFound(start, end)
+        path_ids = [end_id]
+        while path_ids[-1] != start_id:
+            path_ids.append(previous[path_ids[-1]])
+        return DijkstraResult(graph._to_path(path_ids[::-1]), weights[end_id])
+
+    def __repr__(self) -> str:
+        return f"AStar(graph={self._graph!r}, landmarks={self._landmarks!r})"
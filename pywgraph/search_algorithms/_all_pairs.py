@@ -0,0 +1,201 @@
+import numpy as np
+from ..graphs import Path, WeightedDirectedGraph, FrozenWeightedDirectedGraph
+from ..exceptions import NodeNotFound, PathNotFound
+from ._dijkstra import Dijkstra, DijkstraResult
+
+__all__ = ["AllPairsShortest", "all_pairs_shortest"]
+
+# Density ((edges + nodes) / nodes^2) from which Floyd-Warshall beats one Dijkstra per source
+_DENSE_THRESHOLD = 0.003
+# Number of intermediate nodes processed at once by the blocked Floyd-Warshall
+_BLOCK_SIZE = 64
+# Number of elements of the chunks of rows relaxed at once by the blocked Floyd-Warshall
+_CHUNK_ELEMENTS = 2**17
+
+
+class AllPairsShortest:
+    """Shortest weights between every pair of nodes of a graph, as returned by
+    'all_pairs_shortest'. 'weights[i, j]' is the weight of the shortest path from 'nodes[i]' to
+    'nodes[j]', inf if there is none, and 'predecessors[i, j]' is the position of the node
+    before 'nodes[j]' in that path, -1 if there is no path or i == j. The paths are only built
+    when they are requested with 'shortest_path'."""
+
+    def __init__(
+        self,
+        nodes: list[str],
+        weights: np.ndarray,
+        predecessors: np.ndarray,
+        method: str,
+    ) -> None:
+        self._nodes = nodes
+        self._positions = {node: position for position, node in enumerate(nodes)}
+        self._weights = weights
+        self._predecessors = predecessors
+        self._method = method
+
+    @property
+    def nodes(self) -> list[str]:
+        return self._nodes
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weights
+
+    @property
+    def predecessors(self) -> np.ndarray:
+        return self._predecessors
+
+    @property
+    def method(self) -> str:
+        """Algorithm used to compute the matrices, 'floyd-warshall' or 'dijkstra'."""
+        return self._method
+
+    def weight(self, start: str, end: str) -> float:
+        """Returns the weight of the shortest path from start to end, inf if there is none."""
+        start_position, end_position = self._node_positions(start, end)
+        return float(self._weights[start_position, end_position])
+
+    def shortest_path(self, start: str, end: str) -> DijkstraResult:
+        """Builds the shortest path from start to end from the predecessor matrix."""
+        start_position, end_position = self._node_positions(start, end)
+        if start_position == end_position:
+            return DijkstraResult(Path([start]), float(self._weights[start_position, end_position]))
+        if self._predecessors[start_position, end_position] < 0:
+            raise PathNotFound(start, end)
+        row = self._predecessors[start_position]
+        positions = [end_position]
+        while positions[-1] != start_position:
+            positions.append(int(row[positions[-1]]))
+        path = Path([self._nodes[position] for position in reversed(positions)])
+        return DijkstraResult(path, float(self._weights[start_position, end_position]))
+
+    def __repr__(self) -> str:
+        return f"AllPairsShortest(nodes={len(self._nodes)}, method={self._method})"
+
+    def _node_positions(self, start: str, end: str) -> tuple[int, int]:
+        bad_nodes = {start, end} - self._positions.keys()
+        if bad_nodes:
+            raise NodeNotFound(bad_nodes)
+        return self._positions[start], self._positions[end]
+
+
+def all_pairs_shortest(
+    graph: WeightedDirectedGraph | FrozenWeightedDirectedGraph,
+    method: str = "auto",
+) -> AllPairsShortest:
+    """Computes the shortest weights between every pair of nodes of a graph with the real
+    additive group, or with the real multiplicative group and positive weights, working on the
+    logarithms of the weights.
+
+    Parameters
+    ----------
+    graph : WeightedDirectedGraph | FrozenWeightedDirectedGraph
+        The graph.
+    method : str, optional
+        'floyd-warshall' runs a blocked Floyd-Warshall vectorized with NumPy, which suits dense
+        graphs and allows weights below the identity. 'dijkstra' runs the heap Dijkstra from
+        every node, which suits sparse graphs and needs weights not below the identity. 'auto',
+        the default, picks Floyd-Warshall when there are weights below the identity or the
+        graph is dense, and Dijkstra otherwise.
+
+    Raises
+    ------
+    ValueError
+        If the group is not supported, if the method is unknown or can not be used, or if the
+        graph has a cycle whose weight is below the identity.
+    """
+    group = graph.group
+    if group.strict_total_order_function is None or group.ufunc not in (np.add, np.multiply):
+        raise ValueError(
+            "all_pairs_shortest only supports the real additive and multiplicative groups."
+        )
+    if method not in ("auto", "floyd-warshall", "dijkstra"):
+        raise ValueError(
+            f"Unknown method '{method}'. Available methods are 'auto', 'floyd-warshall' and "
+            "'dijkstra'."
+        )
+
+    node_ids = sorted(graph._index._ids[node] for node in graph.nodes)
+    names = graph._index._names
+    nodes = [names[node] for node in node_ids]
+    positions = {node: position for position, node in enumerate(node_ids)}
+    starts: list[int] = []
+    ends: list[int] = []
+    edge_weights: list[float] = []
+    for node in node_ids:
+        for child, weight in graph._successors(node):
+            starts.append(positions[node])
+            ends.append(positions[child])
+            edge_weights.append(weight)
+    costs = np.asarray(edge_weights, dtype=float)
+    if group.ufunc is np.multiply:
+        if np.any(costs <= 0):
+            raise ValueError("The weights of the real multiplicative group must be positive.")
+        costs = np.log(costs)
+
+    has_negative_costs = bool(np.any(costs < 0))
+    if method == "auto":
+        dense = len(costs) + len(nodes) >= _DENSE_THRESHOLD * len(nodes) ** 2
+        method = "floyd-warshall" if has_negative_costs or dense else "dijkstra"
+    elif method == "dijkstra" and has_negative_costs:
+        raise ValueError("Dijkstra needs weights that are not below the identity of the group.")
+
+    if method == "dijkstra":
+        weights, predecessors = _repeated_dijkstra(graph, node_ids, positions)
+    else:
+        distances, predecessors = _floyd_warshall(len(nodes), starts, ends, costs)
+        weights = np.exp(distances) if group.ufunc is np.multiply else distances
+    return AllPairsShortest(nodes, weights, predecessors, method)
+
+
+def _repeated_dijkstra(
+    graph: WeightedDirectedGraph | FrozenWeightedDirectedGraph,
+    node_ids: list[int],
+    positions: dict[int, int],
+) -> tuple[np.ndarray, np.ndarray]:
+    n = len(node_ids)
+    weights = np.full((n, n), np.inf)
+    predecessors = np.full((n, n), -1, dtype=np.int64)
+    names = graph._index._names
+    for row, node in enumerate(node_ids):
+        dijkstra = Dijkstra(graph, names[node])
+        dijkstra.perform_dijkstra_algorithm()
+        for reached, weight in dijkstra._weights.items():
+            weights[row, positions[reached]] = weight
+        for reached, previous in dijkstra._previous.items():
+            predecessors[row, positions[reached]] = positions[previous]
+    return weights, predecessors
+
+
+def _floyd_warshall(
+    n: int, starts: list[int], ends: list[int], costs: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Blocked Floyd-Warshall on the costs. The intermediate nodes are taken in blocks: the rows
+    of the block are relaxed first through each node of the block, and then the rest of the
+    rows are relaxed through the same nodes in chunks that fit in the cache, using the already
+    final rows of the block."""
+    distances = np.full((n, n), np.inf)
+    predecessors = np.full((n, n), -1, dtype=np.int64)
+    distances[starts, ends] = costs
+    predecessors[starts, ends] = starts
+    np.fill_diagonal(distances, 0.0)
+
+    rows_per_chunk = max(1, _CHUNK_ELEMENTS // max(n, 1))
+    for block_start in range(0, n, _BLOCK_SIZE):
+        block = range(block_start, min(block_start + _BLOCK_SIZE, n))
+        chunks = [slice(block.start, block.stop)] + [
+            slice(row_start, min(row_start + rows_per_chunk, stop))
+            for start, stop in ((0, block.start), (block.stop, n))
+            for row_start in range(start, stop, rows_per_chunk)
+        ]
+        for rows in chunks:
+            chunk_distances = distances[rows]
+            chunk_predecessors = predecessors[rows]
+            for k in block:
+                candidates = chunk_distances[:, k, None] + distances[k]
+                improved = candidates < chunk_distances
+                np.copyto(chunk_distances, candidates, where=improved)
+                np.copyto(chunk_predecessors, predecessors[k], where=improved)
+        if np.any(np.diagonal(distances) < 0):
+            raise ValueError("The graph has a cycle whose weight is below the identity.")
+    return distances, predecessors
@@ -0,0 +1,286 @@
+import numpy as np
+from collections import deque
+from typing import Any
+from ..graphs import Cycle, WeightedDirectedGraph, FrozenWeightedDirectedGraph
+from ..groups import Group
+from ..exceptions import NodeNotFound, PathNotFound, NegativeCycleFound
+from ._dijkstra import DijkstraResult
+
+__all__ = ["BellmanFord"]
+
+
+def _predecessor_cycle(previous: dict[int, int]) -> list[int] | None:
+    """Returns a cycle of the predecessor graph as a list of node ids in the direction of the
+    edges, ending with its first node, or None if there is none."""
+    visited: dict[int, int] = {}
+    for walk, node in enumerate(previous):
+        current: int | None = node
+        while current is not None and current not in visited:
+            visited[current] = walk
+            current = previous.get(current)
+        if current is not None and visited[current] == walk:
+            cycle = [current]
+            node = previous[current]
+            while node != current:
+                cycle.append(node)
+                node = previous[node]
+            cycle.append(current)
+            return cycle[::-1]
+    return None
+
+
+class BellmanFord:
+    """Shortest paths from a start node allowing weights below the identity of the group, like
+    negative weights in the real additive group or weights below 1 in the real multiplicative
+    group, where 'Dijkstra' gives wrong answers. If a cycle whose weight is below the identity
+    can be reached from the start node, shortest paths are not defined and the cycle is
+    returned by 'negative_cycle'.
+
+    Parameters
+    ----------
+    graph : WeightedDirectedGraph | FrozenWeightedDirectedGraph
+        The graph.
+    start : str
+        The start node.
+    method : str, optional
+        'spfa' runs the queue based Bellman-Ford (SPFA), which only relaxes the edges leaving
+        the nodes whose weight has changed and works with any group with an order. 'numpy'
+        relaxes all the edges at once with NumPy arrays on each pass, and is only available for
+        the real additive group and the real multiplicative group with positive weights, the
+        latter on the logarithms of the weights. 'auto', the default, uses 'numpy' when it is
+        available.
+
+    Example
+    -------
+    bellman_ford = BellmanFord(graph, 'USD')
+    if bellman_ford.negative_cycle is None:
+        result = bellman_ford.shortest_path('USD', 'JPY')
+    """
+
+    def __init__(
+        self,
+        graph: WeightedDirectedGraph | FrozenWeightedDirectedGraph,
+        start: str,
+        method: str = "auto",
+    ):
+        if start not in graph.nodes:
+            raise NodeNotFound(start)
+        group = graph.group
+        real_group = group.strict_total_order_function is not None and group.ufunc in (
+            np.add,
+            np.multiply,
+        )
+        if method == "auto":
+            method = "numpy" if real_group else "spfa"
+        elif method not in ("spfa", "numpy"):
+            raise ValueError(
+                f"Unknown method '{method}'. Available methods are 'auto', 'spfa' and 'numpy'."
+            )
+        elif method == "numpy" and not real_group:
+            raise ValueError(
+                "The numpy method only supports the real additive and multiplicative groups."
+            )
+        self._graph = graph
+        self._start = start
+        self._method = method
+        self._executed = False
+        self._weights: dict[int, "Group.element"] = {}
+        self._previous: dict[int, int] = {}
+        self._negative_cycle: Cycle | None = None
+
+    @property
+    def graph(self) -> WeightedDirectedGraph | FrozenWeightedDirectedGraph:
+        return self._graph
+
+    @property
+    def start(self) -> str:
+        return self._start
+
+    @property
+    def method(self) -> str:
+        return self._method
+
+    @property
+    def weights(self) -> dict[str, "Group.element"]:
+        """Weights of the shortest paths from the start node to the nodes it reaches."""
+        self.perform_bellman_ford_algorithm()
+        names = self._graph._index._names
+        return {names[node]: weight for node, weight in self._weights.items()}
+
+    @property
+    def predecessors(self) -> dict[str, str]:
+        """Node before each node in its shortest path from the start node."""
+        self.perform_bellman_ford_algorithm()
+        names = self._graph._index._names
+        return {names[node]: names[previous] for node, previous in self._previous.items()}
+
+    @property
+    def negative_cycle(self) -> Cycle | None:
+        """A cycle reachable from the start node whose weight is below the identity, None if
+        there is none."""
+        self.perform_bellman_ford_algorithm()
+        return self._negative_cycle
+
+    def perform_bellman_ford_algorithm(self) -> None:
+        if self._executed:
+            return
+        start = self._graph._index._ids[self._start]
+        if self._method == "numpy":
+            cycle = self._relax_arrays(start)
+        else:
+            cycle = self._relax_queue(start)
+        if cycle is not None:
+            self._negative_cycle = Cycle(self._graph._to_path(cycle))
+        self._executed = True
+
+    def shortest_path(self, start: str, end: str) -> DijkstraResult:
+        """Returns the shortest path from start to end. Start must be the start node of the
+        algorithm or a node of the shortest path to end. Raises NegativeCycleFound if there is a
+        cycle reachable from the start node whose weight is below the identity."""
+        bad_nodes = {start, end} - self._graph.nodes
+        if bad_nodes:
+            raise NodeNotFound(bad_nodes)
+        self.perform_bellman_ford_algorithm()
+        if self._negative_cycle is not None:
+            raise NegativeCycleFound(self._negative_cycle)
+        ids = self._graph._index._ids
+        start_id, end_id, first_id = ids[start], ids[end], ids[self._start]
+        if end_id not in self._weights:
+            raise PathNotFound(self._start, end)
+
+        path_ids = [end_id]
+        while path_ids[-1] != start_id:
+            if path_ids[-1] == first_id:
+                raise ValueError(
+                    f"{start} is not in the shortest path from {self._start} to {end}."
+                )
+            path_ids.append(self._previous[path_ids[-1]])
+
+        path = self._graph._to_path(path_ids[::-1])
+        if start_id == first_id:
+            return DijkstraResult(path, self._weights[end_id])
+        return DijkstraResult(path, self._graph.path_weight(path))
+
+    def __repr__(self) -> str:
+        return f"BellmanFord(start={self._start}, method={self._method})"
+
+    # region Auxiliary methods
+    def _relax_queue(self, start: int) -> list[int] | None:
+        """SPFA. Returns a cycle below the identity if there is one. The number of edges of the
+        path of each node is tracked: a path with as many edges as nodes has a repeated node,
+        and then the predecessor graph is searched for the cycle."""
+        graph = self._graph
+        group = graph.group
+        sort_key = group.sort_key
+        n = len(graph.nodes)
+        weights: dict[int, "Group.element"] = {start: group.identity}
+        keys: dict[int, Any] = {start: sort_key(group.identity)}
+        previous: dict[int, int] = {}
+        lengths = {start: 0}
+        queue = deque([start])
+        in_queue = {start}
+        while queue:
+            node = queue.popleft()
+            in_queue.discard(node)
+            weight = weights[node]
+            for child, child_weight in graph._successors(node):
+                extended_weight = group(weight, child_weight)
+                extended_key = sort_key(extended_weight)
+                if child in keys and not extended_key < keys[child]:
+                    continue
+                weights[child] = extended_weight
+                keys[child] = extended_key
+                previous[child] = node
+                lengths[child] = lengths[node] + 1
+                if lengths[child] >= n and lengths[child] % n == 0:
+                    cycle = _predecessor_cycle(previous)
+                    if cycle is not None:
+                        self._weights, self._previous = weights, previous
+                        return cycle
+                if child not in in_queue:
+                    queue.append(child)
+                    in_queue.add(child)
+        self._weights, self._previous = weights, previous
+        return None
+
+    def _relax_arrays(self, start: int) -> list[int] | None:
+        """Bellman-Ford with one NumPy relaxation of all the edges per pass, on the costs of the
+        edges. The edges are sorted by end node so the best candidate of each node is a
+        'minimum.reduceat'. Returns a cycle below the identity if there is one."""
+        graph = self._graph
+        multiplicative = graph.group.ufunc is np.multiply
+        node_ids = sorted(graph._index._ids[node] for node in graph.nodes)
+        positions = {node: position for position, node in enumerate(node_ids)}
+        starts: list[int] = []
+        ends: list[int] = []
+        weights: list[float] = []
+        for node in node_ids:
+            for child, weight in graph._successors(node):
+                starts.append(positions[node])
+                ends.append(positions[child])
+                weights.append(weight)
+        costs = np.asarray(weights, dtype=float)
+        if multiplicative:
+            if np.any(costs <= 0):
+                raise ValueError("The weights of the real multiplicative group must be positive.")
+            costs = np.log(costs)
+
+        n = len(node_ids)
+        distances = np.full(n, np.inf)
+        distances[positions[start]] = 0.0
+        predecessors = np.full(n, -1, dtype=np.int64)
+        cycle_passes = 0
+        if len(costs):
+            order = np.argsort(ends, kind="stable")
+            edge_starts = np.asarray(starts, dtype=np.int64)[order]
+            edge_ends = np.asarray(ends, dtype=np.int64)[order]
+            costs = costs[order]
+            unique_ends, first_edges, edge_counts = np.unique(
+                edge_ends, return_index=True, return_counts=True
+            )
+            edge_groups = np.repeat(np.arange(len(unique_ends)), edge_counts)
+
+            def relax() -> bool:
+                candidates = distances[edge_starts] + costs
+                best = np.minimum.reduceat(candidates, first_edges)
+                improved = best < distances[unique_ends]
+                if not improved.any():
+                    return False
+                winners = improved[edge_groups] & (candidates == best[edge_groups])
+                predecessors[edge_ends[winners]] = edge_starts[winners]
+                distances[unique_ends[improved]] = best[improved]
+                return True
+
+            # Simple paths have at most n - 1 edges, so a pass that still improves some node
+            # after n - 1 passes means that there is a cycle below the identity
+            passes = 0
+            while passes < n and relax():
+                passes += 1
+            cycle_passes = n if passes == n else 0
+
+        reached = np.flatnonzero(np.isfinite(distances))
+        reached_weights = np.exp(distances[reached]) if multiplicative else distances[reached]
+        self._weights = {
+            node_ids[position]: float(weight)
+            for position, weight in zip(reached.tolist(), reached_weights.tolist())
+        }
+        if cycle_passes == 0:
+            self._previous = self._predecessor_ids(node_ids, predecessors)
+            return None
+        # The predecessors of the nodes on the cycle point around it, at the latest after a
+        # few more passes
+        while cycle_passes < 2 * n:
+            self._previous = self._predecessor_ids(node_ids, predecessors)
+            cycle = _predecessor_cycle(self._previous)
+            if cycle is not None or not relax():
+                return cycle
+            cycle_passes += 1
+        return None
+
+    @staticmethod
+    def _predecessor_ids(node_ids: list[int], predecessors: np.ndarray) -> dict[int, int]:
+        return {
+            node_ids[position]: node_ids[predecessor]
+            for position, predecessor in enumerate(predecessors.tolist())
+            if predecessor >= 0
+        }
@@ -0,0 +1,137 @@
+from heapq import heappush, heappop
+from itertools import count
+from typing import Any, Callable, Iterable
+from ..graphs import WeightedDirectedGraph, FrozenWeightedDirectedGraph
+from ..groups import Group
+from ..exceptions import NodeNotFound, PathNotFound
+from ._dijkstra import DijkstraResult
+
+__all__ = ["BidirectionalDijkstra"]
+
+
+class _SearchFront:
+    """State of one of the two searches of the bidirectional Dijkstra. The weights of the
+    backward search are the weights of the paths from each node to the end node."""
+
+    __slots__ = ("weights", "keys", "previous", "settled", "heap")
+
+    def __init__(self, node: int, identity: "Group.element", key: Any) -> None:
+        self.weights: dict[int, "Group.element"] = {node: identity}
+        self.keys: dict[int, Any] = {node: key}
+        self.previous: dict[int, int] = {}
+        self.settled: set[int] = set()
+        self.heap: list[tuple[Any, int, int]] = [(key, 0, node)]
+
+    def top_key(self) -> Any:
+        """Returns the key of the next node to settle, dropping the stale entries of the heap.
+        None if there are no nodes left."""
+        heap = self.heap
+        while heap and heap[0][2] in self.settled:
+            heappop(heap)
+        return heap[0][0] if heap else None
+
+
+class BidirectionalDijkstra:
+    """Point to point shortest paths with two Dijkstra searches that run at the same time,
+    one forward from the start node over the children and one backward from the end node over
+    the parents. The searches take turns settling the node with the smallest key of the two
+    and stop when the lightest pair of settled nodes can not improve the best path found where
+    both searches meet, so they usually settle far fewer nodes than a Dijkstra search from the
+    start node. The order is the one of the group of the graph, as in 'Dijkstra'.
+
+    Example
+    -------
+    bidirectional = BidirectionalDijkstra(graph)
+    result = bidirectional.shortest_path('A', 'E')
+    """
+
+    def __init__(self, graph: WeightedDirectedGraph | FrozenWeightedDirectedGraph):
+        self._graph = graph
+        self._last_settled: int | None = None
+
+    @property
+    def graph(self) -> WeightedDirectedGraph | FrozenWeightedDirectedGraph:
+        return self._graph
+
+    @property
+    def last_settled(self) -> int | None:
+        """Number of nodes settled by both searches in the last query, None if no query has
+        been made yet."""
+        return self._last_settled
+
+    def shortest_path(self, start: str, end: str) -> DijkstraResult:
+        """Returns the shortest path from start to end."""
+        graph = self._graph
+        bad_nodes = {start, end} - graph.nodes
+        if bad_nodes:
+            raise NodeNotFound(bad_nodes)
+        group = graph.group
+        sort_key = group.sort_key
+        identity = group.identity
+        identity_key = sort_key(identity)
+        ids = graph._index._ids
+        start_id, end_id = ids[start], ids[end]
+
+        forward = _SearchFront(start_id, identity, identity_key)
+        backward = _SearchFront(end_id, identity, identity_key)
+        counter = count(1)
+        best_weight: "Group.element" = identity if start_id == end_id else None
+        best_key = identity_key if start_id == end_id else None
+        meeting = start_id if start_id == end_id else None
+
+        while True:
+            forward_key, backward_key = forward.top_key(), backward.top_key()
+            if forward_key is None or backward_key is None:
+                break
+            if best_key is not None:
+                _, _, forward_node = forward.heap[0]
+                _, _, backward_node = backward.heap[0]
+                lower_bound = group(forward.weights[forward_node], backward.weights[backward_node])
+                if not sort_key(lower_bound) < best_key:
+                    break
+
+            if not backward_key < forward_key:
+                front, other = forward, backward
+                neighbors: Callable[[int], Iterable[tuple[int, Any]]] = graph._successors
+                extend = lambda weight, step: group(weight, step)
+            else:
+                front, other = backward, forward
+                neighbors = graph._predecessors
+                extend = lambda weight, step: group(step, weight)
+
+            _, _, node = heappop(front.heap)
+            front.settled.add(node)
+            weight = front.weights[node]
+            for neighbor, step in neighbors(node):
+                if neighbor in front.settled:
+                    continue
+                extended_weight = extend(weight, step)
+                extended_key = sort_key(extended_weight)
+                if neighbor not in front.keys or extended_key < front.keys[neighbor]:
+                    front.weights[neighbor] = extended_weight
+                    front.keys[neighbor] = extended_key
+                    front.previous[neighbor] = node
+                    heappush(front.heap, (extended_key, next(counter), neighbor))
+                    if neighbor in other.weights:
+                        if front is forward:
+                            path_weight = group(extended_weight, other.weights[neighbor])
+                        else:
+                            path_weight = group(other.weights[neighbor], extended_weight)
+                        path_key = sort_key(path_weight)
+                        if best_key is None or path_key < best_key:
+                            best_weight, best_key, meeting = path_weight, path_key, neighbor
+
+        self._last_settled = len(forward.settled) + len(backward.settled)
+        if meeting is None:
+            raise PathNotFound(start, end)
+
+        path_ids = [meeting]
+        while path_ids[-1] != start_id:
+            path_ids.append(forward.previous[path_ids[-1]])
+        path_ids.reverse()
+        while path_ids[-1] != end_id:
+            path_ids.append(backward.previous[path_ids[-1]])
+        return DijkstraResult(graph._to_path(path_ids), best_weight)
+
+    def __repr__(self) -> str:
+        return f"BidirectionalDijkstra(graph={self._graph!r})"
@@ -1,6 +1,12 @@
+from heapq import heappush, heappop
+from itertools import count
 from typing import Any, NamedTuple
-from ..graphs import Path, WeightedDirectedGraph
+from ..graphs import Path, WeightedDirectedGraph, FrozenWeightedDirectedGraph
 from ..groups import Group
+from ..exceptions import NodeNotFound, PathNotFound
+
+__all__ = ["Dijkstra", "DijkstraResult"]
+
 
 class DijkstraResult(NamedTuple):
     path: Path
@@ -8,15 +14,35 @@ class DijkstraResult(NamedTuple):
 
 
 class Dijkstra:
-
-    def __init__(self, graph: WeightedDirectedGraph, start: str):
+    """Dijkstra's algorithm from a start node, with the order given by the 'le' method of the
+    group of the graph. The nodes are settled lazily with a binary heap keyed by the
+    'sort_key' of the group: 'shortest_path' only settles the nodes needed to reach its end
+    node and later calls continue from there. 'perform_dijkstra_algorithm' settles all the
+    nodes reachable from the start. The weights of the edges must not be below the identity of
+    the group, otherwise the results may be wrong and 'BellmanFord' must be used."""
+
+    def __init__(
+        self, graph: WeightedDirectedGraph | FrozenWeightedDirectedGraph, start: str
+    ):
+        if start not in graph.nodes:
+            raise NodeNotFound(start)
         self._graph = graph
         self._start = start
-        self._table = self._initial_dijkstra_table
-        self._executed = False
+        self._start_id = graph._index._ids[start]
+        identity = graph.group.identity
+        self._sort_key = graph.group.sort_key
+        # Best known weight and previous node of each reached node, by node id. The values of
+        # the settled nodes are final.
+        self._weights: dict[int, "Group.element"] = {self._start_id: identity}
+        self._keys: dict[int, Any] = {self._start_id: self._sort_key(identity)}
+        self._previous: dict[int, int] = {}
+        self._settled: set[int] = set()
+        self._counter = count(1)
+        self._heap: list[tuple[Any, int, int]] = [(self._keys[self._start_id], 0, self._start_id)]
+        self._table: tuple[int, dict[str, dict[str, Any]]] | None = None
 
     @property
-    def graph(self) -> WeightedDirectedGraph:
+    def graph(self) -> WeightedDirectedGraph | FrozenWeightedDirectedGraph:
         return self._graph
 
     @property
@@ -25,118 +51,74 @@ class Dijkstra:
 
     @property
     def table(self) -> dict[str, dict[str, "Group.element"]]:
-        return self._table
-
-    @property
-    def _initial_dijkstra_table(self) -> dict[str, dict[str, Any]]:
-        """{node: {"ShortestWeight": weight, "PreviousNode": node}}"""
-
-        table: dict[str, dict[str, Any]] = {node: {} for node in self.graph.nodes}
-        table[self.start] = {"ShortestWeight": self.graph.group.identity}
-        return table
+        """{node: {"ShortestWeight": weight, "PreviousNode": node}} for the settled nodes. The
+        other nodes have an empty dictionary."""
+        if self._table is None or self._table[0] != len(self._settled):
+            names = self._graph._index._names
+            table: dict[str, dict[str, Any]] = {node: {} for node in self._graph.nodes}
+            for node in self._settled:
+                row = {"ShortestWeight": self._weights[node]}
+                if node in self._previous:
+                    row["PreviousNode"] = names[self._previous[node]]
+                table[names[node]] = row
+            self._table = (len(self._settled), table)
+        return self._table[1]
 
     def perform_dijkstra_algorithm(self) -> None:
-
-        if self._executed:
-            return
-
-        table: dict[str, dict[str, "Group.element"]] = self._initial_dijkstra_table
-        visited: set[str] = set()
-        unvisited = self.graph.nodes.copy()
-        next_node = self.start
-
-        while next_node:
-
-            self._dijkstra_iter(
-                graph=self.graph,
-                node=next_node,
-                visited=visited,
-                unvisited=unvisited,
-                table=table,
-            )
-
-            next_node = self._next_node(
-                table=table,
-                unvisited=unvisited,
-                group=self.graph.group,
-                start=next_node, # type: ignore
-            )
-
-        self._table = table
-        self._executed = True
+        """Settles all the nodes reachable from the start node."""
+        self._settle()
 
     def shortest_path(
         self, start: str, end: str,
     ) -> DijkstraResult:
-        """Returns the shortest path from start to end in the table."""
-
-        if not self._executed:
-            self.perform_dijkstra_algorithm()
-
-        path = Path([end])
-        current_node = end
-        while current_node != start:
-            current_node = self.table[current_node]["PreviousNode"]
-            path.append(current_node)
-
-        path = Path(path[::-1])
-        weight = self.graph.path_weight(path)
-        return DijkstraResult(path, weight)
+        """Returns the shortest path from start to end, settling nodes until end is settled.
+        Start must be the start node of the algorithm or a node of the shortest path to end."""
+
+        bad_nodes = {start, end} - self._graph.nodes
+        if bad_nodes:
+            raise NodeNotFound(bad_nodes)
+        ids = self._graph._index._ids
+        start_id, end_id = ids[start], ids[end]
+        if not self._settle(end_id):
+            raise PathNotFound(self._start, end)
+
+        path_ids = [end_id]
+        while path_ids[-1] != start_id:
+            if path_ids[-1] == self._start_id:
+                raise ValueError(
+                    f"{start} is not in the shortest path from {self._start} to {end}."
+                )
+            path_ids.append(self._previous[path_ids[-1]])
+
+        path = self._graph._to_path(path_ids[::-1])
+        if start_id == self._start_id:
+            return DijkstraResult(path, self._weights[end_id])
+        return DijkstraResult(path, self._graph.path_weight(path))
 
     # region: auxiliary methods
-    @classmethod
-    def _dijkstra_iter(
-        cls,
-        graph: WeightedDirectedGraph,
-        node: str,
-        visited: set[str],
-        unvisited: set[str],
-        table: dict[str, dict[str, "Group.element"]],
-    ):
-        """Updates visit and unvisited nodes and the dijkstra table."""
-
-        visited.add(node)
-        unvisited.remove(node)
-        current_weight = table[node]["ShortestWeight"]
-
-        unvisited_children = {
-            (child, child_weight)
-            for child, child_weight in graph.children_with_weight(node)
-            if child not in visited
-        }
-        for child, child_weight in unvisited_children:
-
-            child_current_weight = table[child].get("ShortestWeight")
-            extended_weight = graph.group(current_weight, child_weight)
-
-            if child_current_weight is None:
-                table[child]["ShortestWeight"] = extended_weight
-                table[child]["PreviousNode"] = node
-            elif graph.group.le(extended_weight, child_current_weight):
-                table[child]["ShortestWeight"] = extended_weight
-                table[child]["PreviousNode"] = node
-
-    @classmethod
-    def _next_node(
-        cls,
-        table: dict[str, dict[str, Any]],
-        unvisited: set[str],
-        group: Group,
-        start: str,
-    ) -> str | None:
-        if not unvisited:
-            return None
-
-        _filter_table = {
-            key: value.get("ShortestWeight")
-            for key, value in table.items()
-            if ((value.get("ShortestWeight") is not None) and (key in unvisited))
-        }
-        if not _filter_table:
-            return start
-        # _min_weight = min(_filter_table.values(), key=group.cmp_key)
-        # _next_node = [
-        #     key for key, value in _filter_table.items() if value == _min_weight
-        # ][0]
-        _next_node = min(_filter_table, key= lambda x: group.cmp_key(_filter_table[x]))
-        return _next_node
\ No newline at end of file
+    def _settle(self, target: int | None = None) -> bool:
+        """Pops nodes from the heap until the target is settled, or all the reachable nodes if
+        there is no target. Returns whether the target is settled."""
+        graph = self._graph
+        group = graph.group
+        sort_key = self._sort_key
+        weights, keys, previous = self._weights, self._keys, self._previous
+        settled, heap, counter = self._settled, self._heap, self._counter
+
+        while heap and target not in settled:
+            _, _, node = heappop(heap)
+            if node in settled:
+                continue
+            settled.add(node)
+            weight = weights[node]
+            for child, child_weight in graph._successors(node):
+                if child in settled:
+                    continue
+                extended_weight = group(weight, child_weight)
+                extended_key = sort_key(extended_weight)
+                if child not in keys or extended_key < keys[child]:
+                    weights[child] = extended_weight
+                    keys[child] = extended_key
+                    previous[child] = node
+                    heappush(heap, (extended_key, next(counter), child))
+        return target is None or target in settled
@@ -0,0 +1,205 @@
+from collections import OrderedDict
+from heapq import heappush, heappop
+from itertools import count, islice
+from typing import Iterable, Iterator
+from ..graphs import Path, WeightedDirectedGraph, FrozenWeightedDirectedGraph
+from ..graphs._graph import _WeightedDirectedGraphBase  # type: ignore
+from ..exceptions import NodeNotFound, PathNotFound
+from ..groups import Group
+from ._dijkstra import Dijkstra, DijkstraResult
+
+__all__ = ["KShortestPaths", "k_shortest_paths"]
+
+# Number of KShortestPaths objects kept by each graph for 'k_shortest_paths'
+_CACHED_FINDERS = 8
+
+
+class _RestrictedGraph(_WeightedDirectedGraphBase):
+    """Read only view of a graph without some nodes and edges, used for the spur searches."""
+
+    def __init__(
+        self,
+        graph: _WeightedDirectedGraphBase,
+        removed_nodes: set[int],
+        removed_edges: set[tuple[int, int]],
+    ) -> None:
+        self._graph = graph
+        self._removed_nodes = removed_nodes
+        self._removed_edges = removed_edges
+        self._index = graph._index
+        self._group = graph._group
+        names = graph._index._names
+        self._nodes = graph._nodes - {names[node] for node in removed_nodes}
+
+    def _successors(self, node: int) -> Iterable[tuple[int, "Group.element"]]:
+        return [
+            (child, weight)
+            for child, weight in self._graph._successors(node)
+            if child not in self._removed_nodes and (node, child) not in self._removed_edges
+        ]
+
+    def _predecessors(self, node: int) -> Iterable[tuple[int, "Group.element"]]:
+        return [
+            (parent, weight)
+            for parent, weight in self._graph._predecessors(node)
+            if parent not in self._removed_nodes and (parent, node) not in self._removed_edges
+        ]
+
+    def _hop_weights(self, paths: list[list[int]]) -> list["Group.element"]:
+        return self._graph._hop_weights(paths)
+
+
+class KShortestPaths:
+    """Yen's algorithm for the k shortest simple paths between two nodes, ordered with the
+    'le' order of the group of the graph. The paths are computed lazily: iterating over the
+    object yields DijkstraResult objects in order, computing each path the first time it is
+    requested and reusing the ones already found, so asking for k + 1 paths after k paths only
+    computes one more path.
+
+    Each new path only branches from its deviation node onwards (Lawler's improvement) and the
+    spur paths are cached by root path and removed edges. The object works on the graph as it
+    is when the paths are computed, the graph must not be modified while it is in use.
+
+    Example
+    -------
+    finder = KShortestPaths(graph, 'A', 'C')
+    best_three = finder.paths(3)
+    fourth = finder.paths(4)[-1]
+    """
+
+    def __init__(
+        self,
+        graph: WeightedDirectedGraph | FrozenWeightedDirectedGraph,
+        start: str,
+        end: str,
+    ):
+        bad_nodes = {start, end} - graph.nodes
+        if bad_nodes:
+            raise NodeNotFound(bad_nodes)
+        self._graph = graph
+        self._start = start
+        self._end = end
+        self._found: list[DijkstraResult] = []
+        # Index of the node where each found path leaves the path it was derived from
+        self._deviations: list[int] = []
+        # Heap of (weight key, insertion order, path, weight, deviation index)
+        self._candidates: list[tuple] = []
+        self._candidate_paths: set[tuple[str, ...]] = set()
+        self._spur_cache: dict[tuple, DijkstraResult | None] = {}
+        self._counter = count()
+        self._exhausted = False
+
+    @property
+    def graph(self) -> WeightedDirectedGraph | FrozenWeightedDirectedGraph:
+        return self._graph
+
+    @property
+    def start(self) -> str:
+        return self._start
+
+    @property
+    def end(self) -> str:
+        return self._end
+
+    def paths(self, k: int) -> list[DijkstraResult]:
+        """Returns the k shortest simple paths, or all of them if there are fewer."""
+        return list(islice(self, k))
+
+    def __iter__(self) -> Iterator[DijkstraResult]:
+        position = 0
+        while True:
+            if position == len(self._found) and not self._find_next():
+                return
+            yield self._found[position]
+            position += 1
+
+    def __repr__(self) -> str:
+        return f"KShortestPaths({self._start} -> {self._end}, found={len(self._found)})"
+
+    # region Auxiliary methods
+    def _find_next(self) -> bool:
+        """Computes the next shortest path. Returns False if there are no more paths."""
+        if self._exhausted:
+            return False
+        if not self._found:
+            first_path = self._spur_path((self._start,), frozenset())
+            if first_path is None:
+                self._exhausted = True
+                return False
+            self._found.append(first_path)
+            self._deviations.append(0)
+            return True
+
+        self._add_spur_candidates(self._found[-1].path, self._deviations[-1])
+        if not self._candidates:
+            self._exhausted = True
+            return False
+        _, _, path, weight, deviation = heappop(self._candidates)
+        self._found.append(DijkstraResult(path, weight))
+        self._deviations.append(deviation)
+        return True
+
+    def _add_spur_candidates(self, last_path: Path, deviation: int) -> None:
+        sort_key = self._graph.group.sort_key
+        for i in range(deviation, len(last_path) - 1):
+            root = tuple(last_path[: i + 1])
+            removed_edges = frozenset(
+                (result.path[i], result.path[i + 1])
+                for result in self._found
+                if len(result.path) > i + 1 and tuple(result.path[: i + 1]) == root
+            )
+            spur = self._spur_path(root, removed_edges)
+            if spur is None:
+                continue
+            path = Path(list(root[:-1]) + list(spur.path))
+            key = tuple(path)
+            if key in self._candidate_paths:
+                continue
+            self._candidate_paths.add(key)
+            weight = self._graph.path_weight(path)
+            heappush(
+                self._candidates, (sort_key(weight), next(self._counter), path, weight, i)
+            )
+
+    def _spur_path(
+        self, root: tuple[str, ...], removed_edges: frozenset[tuple[str, str]]
+    ) -> DijkstraResult | None:
+        """Shortest path from the last node of the root to the end that does not use the other
+        nodes of the root nor the removed edges. Returns None if there is no such path."""
+        cache_key = (root, removed_edges)
+        if cache_key not in self._spur_cache:
+            ids = self._graph._index._ids
+            search_graph = _RestrictedGraph(
+                self._graph,
+                {ids[node] for node in root[:-1]},
+                {(ids[start], ids[end]) for start, end in removed_edges},
+            )
+            dijkstra = Dijkstra(search_graph, root[-1])  # type: ignore
+            try:
+                self._spur_cache[cache_key] = dijkstra.shortest_path(root[-1], self._end)
+            except PathNotFound:
+                self._spur_cache[cache_key] = None
+        return self._spur_cache[cache_key]
+
+
+def k_shortest_paths(
+    graph: WeightedDirectedGraph | FrozenWeightedDirectedGraph,
+    start: str,
+    end: str,
+    k: int,
+) -> Iterator[DijkstraResult]:
+    """Lazily yields the k shortest simple paths from start to end, shortest first, as
+    DijkstraResult objects. The graph keeps the KShortestPaths objects of the last few pairs of
+    nodes asked for until it changes, so asking again for more paths between the same nodes
+    continues the search."""
+    bad_nodes = {start, end} - graph.nodes
+    if bad_nodes:
+        raise NodeNotFound(bad_nodes)
+    finders = graph._cache().setdefault(("k_shortest_paths",), OrderedDict())
+    if (start, end) in finders:
+        finders.move_to_end((start, end))
+    else:
+        finders[(start, end)] = KShortestPaths(graph, start, end)
+        if len(finders) > _CACHED_FINDERS:
+            finders.popitem(last=False)
+    return islice(iter(finders[(start, end)]), k)
@@ -0,0 +1,251 @@
+import multiprocessing
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from math import factorial
+from ..graphs import (
+    Path,
+    PathExplorerPlus,
+    SearchStats,
+    WeightedDirectedGraph,
+    FrozenWeightedDirectedGraph,
+)
+from ..exceptions import NodeNotFound
+
+__all__ = ["ParallelPathFinder"]
+
+# Graph of the worker process, set once per pool by '_init_worker'
+_worker_graph: WeightedDirectedGraph | FrozenWeightedDirectedGraph | None = None
+
+
+def _init_worker(graph: WeightedDirectedGraph | FrozenWeightedDirectedGraph) -> None:
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _search_subtree(
+    explorer: PathExplorerPlus,
+    end: int,
+    general_max_visitations: int,
+    specific_max_visitations: dict[int, int],
+    max_iter: int,
+    max_paths: int | None,
+    max_weight,
+) -> tuple[list[list[int]], list[int], int, int]:
+    """Runs the breadth first search of the worker graph from one explorer."""
+    graph = _worker_graph
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        paths, found_at, expansions, pruned = graph._find_paths_from(  # type: ignore
+            [explorer],
+            end,
+            general_max_visitations,
+            specific_max_visitations,
+            max_iter,
+            max_paths,
+            max_weight,
+            graph._reaching_nodes(end),  # type: ignore
+            graph._completion_bounds(end) if max_weight is not None else None,  # type: ignore
+        )
+    return [list(path) for path in paths], found_at, expansions, pruned
+
+
+class ParallelPathFinder:
+    """Runs 'find_paths' on several processes. The search tree is split by the paths of the
+    first 'prefix_depth' steps from the start node and each subtree is searched in a worker of
+    a process pool. The graph is sent to each worker once, when the pool starts, so the finder
+    works on the graph as it was at that moment.
+
+    'max_iter' and 'max_paths' are global. The iterations left after the first levels are split
+    evenly between the subtrees, so the whole search takes at most 'max_iter' iterations, and
+    the paths of the subtrees are merged in order until 'max_paths' is reached, so the result
+    does not depend on the number of workers. The paths are returned shortest first, but when
+    a subtree uses all its iterations they are not necessarily the shortest ones nor the ones
+    'find_paths' would return.
+
+    Groups usually hold lambdas that can not be pickled, so the pool uses the 'fork' start
+    method where it is available. On other platforms the graph and its group must be picklable.
+
+    Example
+    -------
+    with ParallelPathFinder(graph, workers=4) as finder:
+        paths = finder.find_paths('A', 'E', general_max_visitations=2)
+    """
+
+    def __init__(
+        self,
+        graph: WeightedDirectedGraph | FrozenWeightedDirectedGraph,
+        workers: int | None = None,
+        prefix_depth: int = 1,
+    ):
+        if prefix_depth < 1:
+            raise ValueError("prefix_depth must be a positive integer.")
+        self._graph = graph
+        self._workers = workers
+        self._prefix_depth = prefix_depth
+        self._executor: ProcessPoolExecutor | None = None
+        self._last_search_stats: SearchStats | None = None
+
+    @property
+    def graph(self) -> WeightedDirectedGraph | FrozenWeightedDirectedGraph:
+        return self._graph
+
+    @property
+    def workers(self) -> int | None:
+        return self._workers
+
+    @property
+    def prefix_depth(self) -> int:
+        return self._prefix_depth
+
+    @property
+    def last_search_stats(self) -> SearchStats | None:
+        """Returns the counters of the last search, adding up the expansions and pruned
+        branches of all the subtrees searched."""
+        return self._last_search_stats
+
+    def find_paths(
+        self,
+        start: str,
+        end: str,
+        general_max_visitations: int = 1,
+        specific_max_visitations: dict[str, int] = {},
+        max_iter: int | None = None,
+        max_paths: int | None = None,
+        max_weight=None,
+    ) -> list[Path]:
+        """Finds the paths between two nodes. The parameters are the same as in
+        'WeightedDirectedGraph.find_paths'."""
+        graph = self._graph
+        if max_iter is None:
+            max_iter = factorial(len(graph))
+        bad_nodes = {start, end} - graph.nodes
+        if bad_nodes:
+            raise NodeNotFound(bad_nodes)
+
+        ids = graph._index._ids
+        end_id = ids[end]
+        id_visitations = graph._to_id_visitations(specific_max_visitations)
+        search_parameters = (general_max_visitations, id_visitations, max_weight)
+
+        # Expand the first levels here, keeping the paths found on the way. Each expansion
+        # takes one iteration of the budget.
+        budget = max_iter - 1
+        reaching = graph._reaching_nodes(end_id)
+        bounds = graph._completion_bounds(end_id) if max_weight is not None else None
+        pruned = 0
+        found_paths: list[list[int]] = []
+        prefixes = [PathExplorerPlus(Path([ids[start]]), graph.group.identity)]
+        for _ in range(self._prefix_depth):
+            next_prefixes: list[PathExplorerPlus] = []
+            for explorer in prefixes:
+                if budget == 0 or (max_paths is not None and len(found_paths) >= max_paths):
+                    break
+                budget -= 1
+                discovered_paths, discovered_explorers, discovered_pruned = graph._iter_aux(
+                    explorer, end_id, *search_parameters, reaching, bounds
+                )
+                pruned += discovered_pruned
+                found_paths.extend(discovered_paths)
+                next_prefixes.extend(discovered_explorers)
+            prefixes = next_prefixes
+
+        expansions = max_iter - 1 - budget
+        exhausted = budget == 0
+        if prefixes and budget > 0:
+            remaining_paths = None if max_paths is None else max_paths - len(found_paths)
+            if remaining_paths is None or remaining_paths > 0:
+                subtrees_expansions, exhausted, subtrees_pruned = self._search_prefixes(
+                    prefixes, end_id, search_parameters, budget, remaining_paths, found_paths
+                )
+                expansions += subtrees_expansions
+                pruned += subtrees_pruned
+        self._last_search_stats = SearchStats(expansions, pruned)
+        if exhausted:
+            warnings.warn(f"Max iterations reached ({max_iter})", Warning)
+
+        if max_paths is not None:
+            found_paths = found_paths[:max_paths]
+        found_paths.sort(key=len)
+        return [graph._to_path(path) for path in found_paths]
+
+    def close(self) -> None:
+        """Shuts down the process pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "ParallelPathFinder":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ParallelPathFinder(workers={self._workers}, prefix_depth={self._prefix_depth})"
+
+    # region Auxiliary methods
+    def _search_prefixes(
+        self,
+        prefixes: list[PathExplorerPlus],
+        end: int,
+        search_parameters: tuple,
+        budget: int,
+        max_paths: int | None,
+        found_paths: list[list[int]],
+    ) -> tuple[int, bool, int]:
+        """Searches the subtrees of the prefixes in the pool, each one with an even share of
+        the budget, and adds the paths to found_paths in the order of the prefixes until
+        max_paths is reached. Returns the number of expansions, whether some subtree used its
+        whole share and the number of pruned branches of the merged subtrees."""
+        general_max_visitations, specific_max_visitations, max_weight = search_parameters
+        share, larger_shares = divmod(budget, len(prefixes))
+        # The first prefixes take the remainder, so only the last ones can get no iterations
+        shares = [share + (position < larger_shares) for position in range(len(prefixes))]
+        futures = [
+            self._pool().submit(
+                _search_subtree,
+                explorer,
+                end,
+                general_max_visitations,
+                specific_max_visitations,
+                subtree_budget + 1,
+                max_paths,
+                max_weight,
+            )
+            for explorer, subtree_budget in zip(prefixes, shares)
+            if subtree_budget > 0
+        ]
+        # Prefixes left without iterations are not searched at all
+        exhausted = len(futures) < len(prefixes)
+        new_paths = 0
+        expansions = 0
+        pruned = 0
+        for position, future in enumerate(futures):
+            paths, _, subtree_expansions, subtree_pruned = future.result()
+            expansions += subtree_expansions
+            pruned += subtree_pruned
+            for path in paths:
+                if max_paths is not None and new_paths >= max_paths:
+                    break
+                found_paths.append(path)
+                new_paths += 1
+            if max_paths is not None and new_paths >= max_paths:
+                for pending_future in futures[position + 1 :]:
+                    pending_future.cancel()
+                return expansions, False, pruned
+            exhausted = exhausted or subtree_expansions == shares[position]
+        return expansions, exhausted, pruned
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            if "fork" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("fork")
+            else:
+                context = multiprocessing.get_context()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self._graph,),
+            )
+        return self._executor
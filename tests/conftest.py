@@ -0,0 +1,35 @@
+import random
+import pytest
+from typing import Callable
+from pywgraph import WeightedDirectedGraph, CommonGroups
+
+
+@pytest.fixture
+def small_graph() -> WeightedDirectedGraph:
+    dictionary: dict[str, dict[str, float]] = {
+        "A": {"B": 1, "C": 4, "D": 2},
+        "B": {"C": 2, "E": 5},
+        "C": {"E": 1},
+        "D": {"C": 3, "E": 6},
+        "E": {"F": 1},
+        "F": {},
+        "Z": {"A": 1},
+    }
+    return WeightedDirectedGraph.from_dict(dictionary, CommonGroups.RealAdditive)
+
+
+@pytest.fixture
+def grid_graph() -> Callable[..., WeightedDirectedGraph]:
+    # Builds a square grid whose edges go both ways with random weights between 1 and 2, like
+    # a road network
+    def build(size: int, group=CommonGroups.RealAdditive) -> WeightedDirectedGraph:
+        rng = random.Random(0)
+        tuples = []
+        for i in range(size):
+            for j in range(size):
+                for di, dj in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+                    if 0 <= i + di < size and 0 <= j + dj < size:
+                        tuples.append((f"{i},{j}", f"{i + di},{j + dj}", rng.uniform(1.0, 2.0)))
+        return WeightedDirectedGraph.from_tuples(tuples, group)
+
+    return build
@@ -0,0 +1,90 @@
+import random
+import numpy as np
+import pytest
+from pywgraph import (
+    CommonGroups,
+    Dijkstra,
+    AStar,
+    LandmarkHeuristic,
+    NodeNotFound,
+    PathNotFound,
+)
+
+
+class TestAStar:
+
+    def test_without_heuristic(self, small_graph):
+        result = AStar(small_graph).shortest_path("A", "F")
+        assert result.path == ["A", "B", "C", "E", "F"]
+        assert result.weight == 5
+
+    def test_custom_heuristic(self, grid_graph):
+        # Manhattan distance on a grid whose weights are at least 1
+        def manhattan(node: str) -> float:
+            i, j = map(int, node.split(","))
+            return float(abs(i - 9) + abs(j - 9))
+
+        grid = grid_graph(10)
+        a_star = AStar(grid)
+        result = a_star.shortest_path("0,0", "9,9", manhattan)
+        expected = Dijkstra(grid, "0,0").shortest_path("0,0", "9,9")
+        assert result.weight == pytest.approx(expected.weight)
+        assert a_star.last_settled < len(grid.nodes)
+
+    @pytest.mark.parametrize(
+        "group", [CommonGroups.RealAdditive, CommonGroups.RealMultiplicative]
+    )
+    def test_landmarks_same_as_dijkstra(self, group, grid_graph):
+        grid = grid_graph(10, group)
+        a_star = AStar(grid, LandmarkHeuristic(grid, landmarks=4))
+        rng = random.Random(1)
+        nodes = sorted(grid.nodes)
+        for _ in range(30):
+            start, end = rng.sample(nodes, 2)
+            expected = Dijkstra(grid, start).shortest_path(start, end)
+            result = a_star.shortest_path(start, end)
+            assert result.weight == pytest.approx(expected.weight)
+            assert grid.path_weight(result.path) == pytest.approx(result.weight)
+
+    def test_landmarks_settle_fewer_nodes(self, grid_graph):
+        grid = grid_graph(20)
+        dijkstra = Dijkstra(grid, "0,0")
+        dijkstra.shortest_path("0,0", "19,19")
+        a_star = AStar(grid, LandmarkHeuristic(grid, landmarks=["0,19", "19,0", "19,19"]))
+        a_star.shortest_path("0,0", "19,19")
+        settled = sum(1 for row in dijkstra.table.values() if row)
+        assert a_star.last_settled < settled / 2
+
+    def test_heuristic_is_a_lower_bound(self, small_graph):
+        landmarks = LandmarkHeuristic(small_graph, landmarks=["A", "F"])
+        heuristic = landmarks.heuristic("F")
+        for node in ["A", "B", "C", "D", "E"]:
+            assert heuristic(node) <= Dijkstra(small_graph, node).shortest_path(node, "F").weight
+        assert heuristic("F") == 0
+        assert heuristic("Z") == 6
+
+    def test_landmark_arrays(self, small_graph):
+        landmarks = LandmarkHeuristic(small_graph, landmarks=3)
+        assert len(landmarks.landmarks) == 3
+        assert landmarks.from_landmarks.shape == landmarks.to_landmarks.shape
+        assert np.isinf(landmarks.from_landmarks).any()
+
+    def test_unreachable(self, small_graph):
+        with pytest.raises(PathNotFound):
+            AStar(small_graph, LandmarkHeuristic(small_graph, 2)).shortest_path("A", "Z")
+
+    def test_node_not_found(self, small_graph):
+        with pytest.raises(NodeNotFound):
+            AStar(small_graph).shortest_path("A", "Y")
+        with pytest.raises(NodeNotFound):
+            LandmarkHeuristic(small_graph, landmarks=["Y"])
+
+    def test_negative_weights(self, small_graph):
+        with pytest.raises(ValueError):
+            LandmarkHeuristic(small_graph.add_edge("C", "D", -1))
+
+    def test_frozen_graph(self, small_graph):
+        frozen = small_graph.freeze()
+        result = AStar(frozen, LandmarkHeuristic(frozen, 2)).shortest_path("Z", "F")
+        assert result.path == ["Z", "A", "B", "C", "E", "F"]
+        assert result.weight == 6
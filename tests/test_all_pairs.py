@@ -0,0 +1,112 @@
+import random
+import numpy as np
+import pytest
+from pywgraph import (
+    WeightedDirectedGraph,
+    CommonGroups,
+    Dijkstra,
+    all_pairs_shortest,
+    NodeNotFound,
+    PathNotFound,
+)
+
+
+def random_graph(seed: int, n: int, group=CommonGroups.RealAdditive) -> WeightedDirectedGraph:
+    rng = random.Random(seed)
+    tuples = [
+        (f"n{i}", f"n{j}", rng.uniform(1.0, 3.0))
+        for i in range(n)
+        for j in range(n)
+        if i != j and rng.random() < 0.1
+    ]
+    return WeightedDirectedGraph.from_tuples(tuples, group)
+
+
+class TestAllPairsShortest:
+
+    @pytest.mark.parametrize("method", ["floyd-warshall", "dijkstra"])
+    def test_paths(self, method, small_graph):
+        result = all_pairs_shortest(small_graph, method)
+        assert result.shortest_path("A", "F").path == ["A", "B", "C", "E", "F"]
+        assert result.weight("A", "F") == 5
+        assert result.weight("Z", "F") == 6
+        assert result.weight("A", "A") == 0
+        assert result.weight("A", "Z") == np.inf
+        assert result.method == method
+
+    @pytest.mark.parametrize("seed", range(3))
+    @pytest.mark.parametrize(
+        "group", [CommonGroups.RealAdditive, CommonGroups.RealMultiplicative]
+    )
+    def test_methods_agree(self, seed, group):
+        # More than one block of the Floyd-Warshall
+        graph = random_graph(seed, 80, group)
+        floyd_warshall = all_pairs_shortest(graph, "floyd-warshall")
+        dijkstra = all_pairs_shortest(graph, "dijkstra")
+        assert floyd_warshall.nodes == dijkstra.nodes
+        assert np.allclose(floyd_warshall.weights, dijkstra.weights)
+        assert np.array_equal(floyd_warshall.predecessors < 0, dijkstra.predecessors < 0)
+
+    def test_same_as_dijkstra(self):
+        graph = random_graph(0, 20)
+        result = all_pairs_shortest(graph)
+        for start in graph.nodes:
+            dijkstra = Dijkstra(graph, start)
+            for end in graph.nodes:
+                try:
+                    expected = dijkstra.shortest_path(start, end).weight
+                except PathNotFound:
+                    expected = np.inf
+                assert result.weight(start, end) == pytest.approx(expected)
+                if expected != np.inf:
+                    path = result.shortest_path(start, end).path
+                    assert graph.path_weight(path) == pytest.approx(expected)
+
+    def test_auto_method(self, small_graph):
+        assert all_pairs_shortest(small_graph).method == "floyd-warshall"
+        sparse_graph = WeightedDirectedGraph.from_tuples(
+            [(f"a{i}", f"b{i}", 1.0) for i in range(1000)], CommonGroups.RealAdditive
+        )
+        assert all_pairs_shortest(sparse_graph).method == "dijkstra"
+
+    def test_negative_weights(self, small_graph):
+        graph = small_graph.add_edge("C", "D", -2)
+        assert all_pairs_shortest(graph).method == "floyd-warshall"
+        assert all_pairs_shortest(graph).weight("A", "D") == 1
+        with pytest.raises(ValueError):
+            all_pairs_shortest(graph, "dijkstra")
+
+    def test_negative_cycle(self, small_graph):
+        graph = small_graph.add_edge("C", "A", -4)
+        with pytest.raises(ValueError):
+            all_pairs_shortest(graph)
+
+    def test_unreachable(self, small_graph):
+        with pytest.raises(PathNotFound):
+            all_pairs_shortest(small_graph).shortest_path("A", "Z")
+
+    def test_node_not_found(self, small_graph):
+        with pytest.raises(NodeNotFound):
+            all_pairs_shortest(small_graph).weight("A", "Y")
+
+    def test_unsupported_group(self):
+        graph = WeightedDirectedGraph.from_arrays(
+            np.array(["A"]),
+            np.array(["B"]),
+            np.array([[1.0, 2.0]]),
+            CommonGroups.RealsNAdditive(2),
+        )
+        with pytest.raises(ValueError):
+            all_pairs_shortest(graph)
+
+    def test_unknown_method(self, small_graph):
+        with pytest.raises(ValueError):
+            all_pairs_shortest(small_graph, "johnson")
+
+    def test_frozen_graph(self, small_graph):
+        graph = small_graph
+        frozen_result = all_pairs_shortest(graph.freeze())
+        result = all_pairs_shortest(graph)
+        for start in graph.nodes:
+            for end in graph.nodes:
+                assert frozen_result.weight(start, end) == result.weight(start, end)
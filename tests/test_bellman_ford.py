@@ -0,0 +1,148 @@
+import random
+import pytest
+from pywgraph import (
+    WeightedDirectedGraph,
+    CommonGroups,
+    Cycle,
+    Dijkstra,
+    BellmanFord,
+    NodeNotFound,
+    PathNotFound,
+    NegativeCycleFound,
+)
+
+
+def negative_graph() -> WeightedDirectedGraph:
+    dictionary: dict[str, dict[str, float]] = {
+        "A": {"B": 4, "C": 5},
+        "B": {"D": 3},
+        "C": {"B": -3, "D": 4},
+        "D": {"E": 2},
+        "E": {},
+    }
+    return WeightedDirectedGraph.from_dict(dictionary, CommonGroups.RealAdditive)
+
+
+def exchange_graph() -> WeightedDirectedGraph:
+    # EUR -> GBP -> JPY -> EUR multiplies the money by 0.86 * 190 * 0.00625 = 1.02125, so the
+    # weights are the inverse rates, whose product along the cycle is below 1
+    rates = [
+        ("USD", "EUR", 0.92),
+        ("EUR", "GBP", 0.86),
+        ("GBP", "JPY", 190.0),
+        ("JPY", "EUR", 0.00625),
+        ("JPY", "USD", 0.006),
+    ]
+    return WeightedDirectedGraph.from_tuples(
+        [(start, end, 1 / rate) for start, end, rate in rates], CommonGroups.RealMultiplicative
+    )
+
+
+def random_graph(seed: int) -> WeightedDirectedGraph:
+    rng = random.Random(seed)
+    nodes = [f"N{i}" for i in range(30)]
+    tuples = [
+        (start, end, rng.uniform(0.0, 10.0))
+        for start in nodes
+        for end in nodes
+        if start != end and rng.random() < 0.15
+    ]
+    return WeightedDirectedGraph.from_tuples(tuples, CommonGroups.RealAdditive)
+
+
+class TestBellmanFord:
+
+    @pytest.mark.parametrize("method", ["spfa", "numpy"])
+    def test_same_as_dijkstra(self, method):
+        for seed in range(3):
+            random_weighted = random_graph(seed)
+            bellman_ford = BellmanFord(random_weighted, "N0", method)
+            dijkstra = Dijkstra(random_weighted, "N0")
+            assert bellman_ford.negative_cycle is None
+            for node in random_weighted.nodes:
+                try:
+                    expected = dijkstra.shortest_path("N0", node)
+                except PathNotFound:
+                    assert node not in bellman_ford.weights
+                    continue
+                result = bellman_ford.shortest_path("N0", node)
+                assert result.weight == pytest.approx(expected.weight)
+                assert random_weighted.path_weight(result.path) == pytest.approx(result.weight)
+
+    @pytest.mark.parametrize("method", ["spfa", "numpy"])
+    def test_negative_weights(self, method):
+        bellman_ford = BellmanFord(negative_graph(), "A", method)
+        assert bellman_ford.weights == {"A": 0, "B": 2, "C": 5, "D": 5, "E": 7}
+        assert bellman_ford.predecessors == {"B": "C", "C": "A", "D": "B", "E": "D"}
+        result = bellman_ford.shortest_path("A", "E")
+        assert result.path == ["A", "C", "B", "D", "E"]
+        assert result.weight == 7
+        assert bellman_ford.shortest_path("C", "E").weight == 2
+
+    @pytest.mark.parametrize("method", ["spfa", "numpy"])
+    def test_negative_cycle(self, method):
+        cyclic = negative_graph().add_edge("D", "C", -2)
+        bellman_ford = BellmanFord(cyclic, "A", method)
+        cycle = bellman_ford.negative_cycle
+        assert isinstance(cycle, Cycle)
+        assert cycle == Cycle(["B", "D", "C", "B"])
+        assert cyclic.path_weight(cycle) < 0
+        with pytest.raises(NegativeCycleFound) as error:
+            bellman_ford.shortest_path("A", "E")
+        assert error.value.cycle == cycle
+
+    @pytest.mark.parametrize("method", ["spfa", "numpy"])
+    def test_profitable_cycle(self, method):
+        exchange = exchange_graph()
+        cycle = BellmanFord(exchange, "USD", method).negative_cycle
+        assert cycle == Cycle(["EUR", "GBP", "JPY", "EUR"])
+        assert exchange.path_weight(cycle) < 1
+
+    def test_unreachable_negative_cycle(self):
+        cyclic = negative_graph().add_edge("D", "C", -2)
+        bellman_ford = BellmanFord(cyclic, "E")
+        assert bellman_ford.negative_cycle is None
+        assert bellman_ford.weights == {"E": 0}
+
+    def test_auto_method(self, small_graph):
+        assert BellmanFord(small_graph, "A").method == "numpy"
+        integer_graph = WeightedDirectedGraph.from_dict(
+            {"A": {"B": 2}, "B": {}}, CommonGroups.IntegerAdditive
+        )
+        assert BellmanFord(integer_graph, "A").method == "spfa"
+
+    def test_unreachable(self, small_graph):
+        with pytest.raises(PathNotFound):
+            BellmanFord(small_graph, "A").shortest_path("A", "Z")
+
+    def test_start_not_in_path(self, small_graph):
+        with pytest.raises(ValueError):
+            BellmanFord(small_graph, "A").shortest_path("D", "F")
+
+    def test_node_not_found(self, small_graph):
+        with pytest.raises(NodeNotFound):
+            BellmanFord(small_graph, "Y")
+        with pytest.raises(NodeNotFound):
+            BellmanFord(small_graph, "A").shortest_path("A", "Y")
+
+    def test_invalid_method(self, small_graph):
+        with pytest.raises(ValueError):
+            BellmanFord(small_graph, "A", "dijkstra")
+        integer_graph = WeightedDirectedGraph.from_dict(
+            {"A": {"B": 2}, "B": {}}, CommonGroups.IntegerAdditive
+        )
+        with pytest.raises(ValueError):
+            BellmanFord(integer_graph, "A", "numpy")
+
+    def test_non_positive_multiplicative_weights(self):
+        zero_graph = WeightedDirectedGraph.from_dict(
+            {"A": {"B": 0.0}, "B": {}}, CommonGroups.RealMultiplicative
+        )
+        with pytest.raises(ValueError):
+            BellmanFord(zero_graph, "A", "numpy").perform_bellman_ford_algorithm()
+
+    def test_frozen_graph(self):
+        for method in ["spfa", "numpy"]:
+            result = BellmanFord(negative_graph().freeze(), "A", method).shortest_path("A", "E")
+            assert result.path == ["A", "C", "B", "D", "E"]
+            assert result.weight == 7
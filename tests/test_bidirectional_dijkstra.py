@@ -0,0 +1,65 @@
+import random
+import pytest
+from pywgraph import (
+    CommonGroups,
+    Dijkstra,
+    BidirectionalDijkstra,
+    NodeNotFound,
+    PathNotFound,
+)
+
+
+class TestBidirectionalDijkstra:
+
+    def test_shortest_path(self, small_graph):
+        result = BidirectionalDijkstra(small_graph).shortest_path("A", "F")
+        assert result.path == ["A", "B", "C", "E", "F"]
+        assert result.weight == 5
+
+    @pytest.mark.parametrize(
+        "group", [CommonGroups.RealAdditive, CommonGroups.RealMultiplicative]
+    )
+    def test_same_as_dijkstra(self, group, grid_graph):
+        grid = grid_graph(8, group)
+        bidirectional = BidirectionalDijkstra(grid)
+        rng = random.Random(1)
+        nodes = sorted(grid.nodes)
+        for _ in range(30):
+            start, end = rng.sample(nodes, 2)
+            expected = Dijkstra(grid, start).shortest_path(start, end)
+            result = bidirectional.shortest_path(start, end)
+            assert result.weight == pytest.approx(expected.weight)
+            assert grid.path_weight(result.path) == pytest.approx(result.weight)
+            assert result.path[0] == start and result.path[-1] == end
+
+    def test_settles_fewer_nodes(self, grid_graph):
+        grid = grid_graph(20)
+        dijkstra = Dijkstra(grid, "0,0")
+        dijkstra.shortest_path("0,0", "19,19")
+        bidirectional = BidirectionalDijkstra(grid)
+        bidirectional.shortest_path("0,0", "19,19")
+        settled = sum(1 for row in dijkstra.table.values() if row)
+        assert bidirectional.last_settled < settled
+
+    def test_direct_edge(self, small_graph):
+        result = BidirectionalDijkstra(small_graph).shortest_path("E", "F")
+        assert result.path == ["E", "F"]
+        assert result.weight == 1
+
+    def test_same_node(self, small_graph):
+        result = BidirectionalDijkstra(small_graph).shortest_path("A", "A")
+        assert result.path == ["A"]
+        assert result.weight == 0
+
+    def test_unreachable(self, small_graph):
+        with pytest.raises(PathNotFound):
+            BidirectionalDijkstra(small_graph).shortest_path("A", "Z")
+
+    def test_node_not_found(self, small_graph):
+        with pytest.raises(NodeNotFound):
+            BidirectionalDijkstra(small_graph).shortest_path("A", "Y")
+
+    def test_frozen_graph(self, small_graph):
+        result = BidirectionalDijkstra(small_graph.freeze()).shortest_path("Z", "F")
+        assert result.path == ["Z", "A", "B", "C", "E", "F"]
+        assert result.weight == 6
@@ -0,0 +1,75 @@
+import pytest
+from pywgraph import (
+    WeightedDirectedGraph,
+    BidirectionalView,
+    CommonGroups,
+    NodeNotFound,
+    EdgeNotFound,
+)
+
+
+def graph() -> WeightedDirectedGraph:
+    dictionary: dict[str, dict[str, float]] = {
+        "A": {"B": 2.0, "C": 4.0},
+        "B": {"C": 2.0},
+        "C": {"A": 0.5, "D": 1.5},
+        "D": {},
+        "Z": {},
+    }
+    return WeightedDirectedGraph.from_dict(dictionary)
+
+
+class TestBidirectionalView:
+
+    @pytest.mark.parametrize("method", ["inverse", "mirror"])
+    def test_same_as_add_reverse_edges(self, method):
+        view = graph().bidirectional_view(method)
+        complete_graph = graph().add_reverse_edges(method=method)
+        for node in complete_graph.nodes:
+            assert view.children(node) == complete_graph.children(node)
+            assert view.parents(node) == complete_graph.parents(node)
+            assert view.children_with_weight(node) == complete_graph.children_with_weight(node)
+        assert view.find_paths("D", "A") == complete_graph.find_paths("D", "A")
+        assert view.cycles == complete_graph.cycles
+
+    def test_frozen_graph(self):
+        view = graph().freeze().bidirectional_view()
+        complete_graph = graph().add_reverse_edges()
+        assert view.parents("C") == complete_graph.parents("C")
+        assert view.path_weight(["D", "C", "B"]) == complete_graph.path_weight(["D", "C", "B"])
+
+    def test_weights(self):
+        view = graph().bidirectional_view()
+        assert view.weight("A", "C") == 4.0
+        assert view.weight("C", "A") == 0.5
+        assert view.weight("D", "C") == 1 / 1.5
+        assert view.path_weight(["D", "C", "B", "A"]) == pytest.approx(1 / 1.5 / 2.0 / 2.0)
+        assert view.graph.has_edge("C", "B") is False
+        assert view.has_edge("C", "B")
+
+    def test_weight_errors(self):
+        view = graph().bidirectional_view()
+        with pytest.raises(EdgeNotFound):
+            view.weight("A", "Z")
+        with pytest.raises(NodeNotFound):
+            view.weight("A", "X")
+        with pytest.raises(ValueError):
+            view.path_weight(["A", "Z"])
+
+    def test_mirror_additive(self):
+        additive_graph = WeightedDirectedGraph.from_dict(
+            {"A": {"B": 2.0}, "B": {}}, CommonGroups.RealAdditive
+        )
+        assert additive_graph.bidirectional_view("mirror").weight("B", "A") == 2.0
+        assert additive_graph.bidirectional_view().weight("B", "A") == -2.0
+
+    def test_view_follows_changes(self):
+        original_graph = graph()
+        view = original_graph.bidirectional_view()
+        original_graph.add_edge("Z", "A", 3.0, inplace=True)
+        assert "Z" in view.children("A")
+        assert view.weight("A", "Z") == 1 / 3.0
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            BidirectionalView(graph(), "other")
@@ -0,0 +1,115 @@
+import random
+import pytest
+from pywgraph import WeightedDirectedGraph, CommonGroups
+
+
+def consistent_graph() -> WeightedDirectedGraph:
+    dictionary: dict[str, dict[str, float]] = {
+        "EUR": {"USD": 2.0, "GBP": 0.5},
+        "USD": {"JPY": 8.0},
+        "GBP": {"JPY": 32.0},
+        "JPY": {},
+        "CHF": {"SEK": 4.0},
+        "SEK": {},
+    }
+    return WeightedDirectedGraph.from_dict(dictionary)
+
+
+def inconsistent_graph() -> WeightedDirectedGraph:
+    return consistent_graph().add_edge("JPY", "EUR", 0.5)
+
+
+def random_graph(seed: int) -> WeightedDirectedGraph:
+    rng = random.Random(seed)
+    potentials = {f"n{i}": rng.randint(-5, 5) for i in range(6)}
+    tuples = []
+    for start in potentials:
+        for end in potentials:
+            if start != end and rng.random() < 0.4:
+                weight = potentials[end] - potentials[start]
+                if rng.random() < 0.1:
+                    weight += 1
+                tuples.append((start, end, weight))
+    return WeightedDirectedGraph.from_tuples(tuples, CommonGroups.RealAdditive)
+
+
+def ordered_graph(tuples: list, node_order: list[str]) -> WeightedDirectedGraph:
+    # The ids of the nodes, and so the spanning forest, follow the order they are added in
+    graph = WeightedDirectedGraph(set(), set(), CommonGroups.RealAdditive)
+    for node in node_order:
+        graph.add_node(node, inplace=True)
+    return graph.add_edges_from(tuples)
+
+
+def brute_force_conmutative(graph: WeightedDirectedGraph) -> bool:
+    view = graph.bidirectional_view()
+    return all(
+        graph.group.equal(view.path_weight(cycle), graph.group.identity)
+        for cycle in view.cycles
+    )
+
+
+class TestConmutativity:
+
+    def test_conmutative(self):
+        assert consistent_graph().is_conmutative
+        assert consistent_graph().conmutativity_witness() is None
+
+    def test_not_conmutative(self):
+        assert not inconsistent_graph().is_conmutative
+
+    def test_witness(self):
+        graph = inconsistent_graph()
+        witness = graph.conmutativity_witness()
+        assert witness is not None
+        assert graph.has_edge(witness[0], witness[1])
+        view = graph.bidirectional_view()
+        assert not graph.group.equal(view.path_weight(witness), graph.group.identity)
+
+    def test_two_way_edges(self):
+        graph = WeightedDirectedGraph.from_tuples([("A", "B", 2.0), ("B", "A", 0.25)])
+        assert not graph.is_conmutative
+        assert len(graph.conmutativity_witness()) == 3
+
+    @pytest.mark.parametrize("back_weight, conmutative", [(4, False), (2, True)])
+    def test_witness_with_two_way_edges(self, back_weight, conmutative):
+        tuples = [
+            ("B", "A", 3),
+            ("A", "D", 0),
+            ("A", "F", -2),
+            ("F", "A", back_weight),
+            ("B", "E", 4),
+            ("B", "F", 1),
+            ("C", "D", 2),
+            ("E", "C", -3),
+            ("F", "E", 3),
+        ]
+        rng = random.Random(0)
+        for _ in range(50):
+            node_order = rng.sample(["A", "B", "C", "D", "E", "F"], 6)
+            graph = ordered_graph(tuples, node_order)
+            witness = graph.conmutativity_witness()
+            assert (witness is None) == conmutative == brute_force_conmutative(graph)
+            if witness is not None:
+                view = graph.bidirectional_view()
+                assert not graph.group.equal(view.path_weight(witness), graph.group.identity)
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_same_as_cycles(self, seed):
+        graph = random_graph(seed)
+        assert graph.is_conmutative == brute_force_conmutative(graph)
+
+    def test_large_graph(self):
+        rng = random.Random(0)
+        rates = {f"C{i}": rng.randint(1, 10) for i in range(3000)}
+        currencies = list(rates)
+        tuples = [
+            (start, end, rates[end] - rates[start])
+            for start in currencies
+            for end in rng.sample(currencies, 3)
+            if start != end
+        ]
+        graph = WeightedDirectedGraph.from_tuples(tuples, CommonGroups.RealAdditive)
+        assert graph.is_conmutative
+        broken = graph.add_edge("C0", "C1", rates["C1"] - rates["C0"] + 1)
+        assert not broken.is_conmutative
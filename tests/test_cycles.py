@@ -0,0 +1,77 @@
+import random
+import pytest
+from pywgraph import WeightedDirectedGraph, Cycle
+
+
+def graph() -> WeightedDirectedGraph:
+    dictionary: dict[str, dict[str, float]] = {
+        "A": {"B": 1.0, "C": 2.5},
+        "B": {"C": 2.5},
+        "C": {"A": 1 / 2.5, "D": 1.3},
+        "D": {"E": 3.4},
+        "E": {"C": 1 / (1.3 * 3.4), "A": 13.0},
+        "Z": {},
+    }
+    return WeightedDirectedGraph.from_dict(dictionary)
+
+
+def random_graph(seed: int) -> WeightedDirectedGraph:
+    rng = random.Random(seed)
+    tuples = [
+        (f"n{i}", f"n{j}", 1.0)
+        for i in range(7)
+        for j in range(7)
+        if i != j and rng.random() < 0.4
+    ]
+    return WeightedDirectedGraph.from_tuples(tuples)
+
+
+def cycles_by_node(graph: WeightedDirectedGraph) -> set[Cycle]:
+    return {cycle for node in graph.nodes for cycle in graph.get_node_cycles(node)}
+
+
+class TestCycles:
+
+    def test_cycles(self):
+        solution = {
+            Cycle([node]) for node in "ABCDEZ"
+        } | {
+            Cycle(["A", "C", "A"]),
+            Cycle(["A", "B", "C", "A"]),
+            Cycle(["A", "C", "D", "E", "A"]),
+            Cycle(["A", "B", "C", "D", "E", "A"]),
+            Cycle(["C", "D", "E", "C"]),
+        }
+        assert graph().cycles == solution
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_same_as_node_cycles(self, seed):
+        random_graph_ = random_graph(seed)
+        assert random_graph_.cycles == cycles_by_node(random_graph_)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_each_cycle_once(self, seed):
+        cycles = list(random_graph(seed).iter_cycles())
+        assert len(cycles) == len(set(cycles))
+
+    def test_is_lazy(self):
+        cycles = graph().iter_cycles()
+        first_cycle = next(cycles)
+        assert len(first_cycle) == 1 and first_cycle[0] in graph().nodes
+
+    @pytest.mark.parametrize("max_length", [0, 1, 2, 3, 4, 5])
+    def test_max_length(self, max_length):
+        cycles = set(graph().iter_cycles(max_length))
+        assert cycles == {cycle for cycle in graph().cycles if len(cycle) - 1 <= max_length}
+
+    def test_long_cycle(self):
+        nodes = [f"n{i}" for i in range(5000)]
+        tuples = [(start, end, 1.0) for start, end in zip(nodes, nodes[1:] + nodes[:1])]
+        cycles = WeightedDirectedGraph.from_tuples(tuples).cycles
+        assert len(cycles) == len(nodes) + 1
+
+    def test_frozen_graph(self):
+        assert graph().freeze().cycles == graph().cycles
+
+    def test_bidirectional_view(self):
+        assert graph().bidirectional_view().cycles == graph().add_reverse_edges().cycles
@@ -0,0 +1,92 @@
+import random
+import pytest
+from pywgraph import (
+    WeightedDirectedGraph,
+    Group,
+    Dijkstra,
+    NodeNotFound,
+    PathNotFound,
+)
+
+
+def random_graph(seed: int) -> WeightedDirectedGraph:
+    rng = random.Random(seed)
+    tuples = [
+        (f"n{i}", f"n{j}", rng.uniform(1.0, 3.0))
+        for i in range(8)
+        for j in range(8)
+        if i != j and rng.random() < 0.35
+    ]
+    return WeightedDirectedGraph.from_tuples(tuples)
+
+
+class TestDijkstra:
+
+    def test_shortest_path(self, small_graph):
+        result = Dijkstra(small_graph, "A").shortest_path("A", "F")
+        assert result.path == ["A", "B", "C", "E", "F"]
+        assert result.weight == 5
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_same_as_lightest_path(self, seed):
+        random_graph_ = random_graph(seed)
+        dijkstra = Dijkstra(random_graph_, "n0")
+        for end in random_graph_.nodes - {"n0"}:
+            paths = random_graph_.find_paths("n0", end)
+            if not paths:
+                with pytest.raises(PathNotFound):
+                    dijkstra.shortest_path("n0", end)
+                continue
+            result = dijkstra.shortest_path("n0", end)
+            lightest = min(random_graph_.path_weight(path) for path in paths)
+            assert result.weight == pytest.approx(lightest)
+            assert random_graph_.path_weight(result.path) == pytest.approx(result.weight)
+
+    def test_early_exit(self, small_graph):
+        dijkstra = Dijkstra(small_graph, "A")
+        dijkstra.shortest_path("A", "B")
+        settled = {node for node, row in dijkstra.table.items() if row}
+        assert settled == {"A", "B"}
+        dijkstra.shortest_path("A", "F")
+        assert dijkstra.table["E"] == {"ShortestWeight": 4, "PreviousNode": "C"}
+
+    def test_table(self, small_graph):
+        dijkstra = Dijkstra(small_graph, "A")
+        dijkstra.perform_dijkstra_algorithm()
+        assert dijkstra.table["A"] == {"ShortestWeight": 0.0}
+        assert dijkstra.table["C"] == {"ShortestWeight": 3, "PreviousNode": "B"}
+        assert dijkstra.table["Z"] == {}
+
+    def test_start_in_the_middle(self, small_graph):
+        result = Dijkstra(small_graph, "A").shortest_path("C", "F")
+        assert result.path == ["C", "E", "F"]
+        assert result.weight == 2
+
+    def test_start_not_in_path(self, small_graph):
+        with pytest.raises(ValueError):
+            Dijkstra(small_graph, "A").shortest_path("D", "F")
+
+    def test_unreachable(self, small_graph):
+        with pytest.raises(PathNotFound):
+            Dijkstra(small_graph, "A").shortest_path("A", "Z")
+
+    def test_node_not_found(self, small_graph):
+        with pytest.raises(NodeNotFound):
+            Dijkstra(small_graph, "Y")
+        with pytest.raises(NodeNotFound):
+            Dijkstra(small_graph, "A").shortest_path("A", "Y")
+
+    def test_group_without_sort_key(self, small_graph):
+        group = Group(
+            "Real numbers with addition",
+            0.0,
+            lambda x, y: x + y,
+            lambda x: -x,
+            strict_total_order_function=lambda x, y: x < y,
+        )
+        edges = [(edge.start, edge.end, edge.weight) for edge in small_graph.edges]
+        result = Dijkstra(WeightedDirectedGraph.from_tuples(edges, group), "A").shortest_path(
+            "A", "F"
+        )
+        assert result.path == ["A", "B", "C", "E", "F"]
+        assert group.sort_key(1.0) < group.sort_key(2.0)
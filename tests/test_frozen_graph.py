@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+from pywgraph import (
+    WeightedDirectedGraph,
+    FrozenWeightedDirectedGraph,
+    WeightedDirectedEdge,
+    CommonGroups,
+    Group,
+    Dijkstra,
+    NodeNotFound,
+)
+
+
+def graph() -> WeightedDirectedGraph:
+    dictionary: dict[str, dict[str, float]] = {
+        "A": {"B": 1.0, "C": 2.5},
+        "B": {"C": 2.5},
+        "C": {"A": 1 / 2.5, "D": 1.3},
+        "D": {"E": 3.4},
+        "E": {"C": 1 / (1.3 * 3.4), "A": 13.0},
+        "Z": {},
+    }
+    return WeightedDirectedGraph.from_dict(dictionary)
+
+
+def additive_graph() -> WeightedDirectedGraph:
+    return WeightedDirectedGraph.from_dict(
+        {
+            "A": {"B": 2, "D": 8},
+            "B": {"D": 5, "E": 6},
+            "D": {"E": 3, "F": 2},
+            "E": {"F": 1, "C": 9},
+            "F": {"C": 3},
+            "C": {},
+        },
+        CommonGroups.RealAdditive,
+    )
+
+
+def vector_graph() -> WeightedDirectedGraph:
+    return WeightedDirectedGraph.from_dict(
+        {
+            "A": {"B": np.array([1.0, 2.0])},
+            "B": {"C": np.array([-5.0, 1.3])},
+            "C": {},
+        },
+        Group(
+            name="Vectors of dimension 2 with addition",
+            identity=np.zeros(2),
+            operation=lambda x, y: x + y,
+            inverse_function=lambda x: -x,
+            hash_function=lambda x: hash(tuple(x)),
+        ),
+    )
+
+
+class TestFrozenWeightedDirectedGraph:
+
+    def test_freeze_type(self):
+        assert isinstance(graph().freeze(), FrozenWeightedDirectedGraph)
+
+    def test_csr_arrays(self):
+        frozen = graph().freeze()
+        assert frozen.indptr.tolist() == [0, 2, 3, 5, 6, 8, 8]
+        assert frozen.indices.dtype == np.int32
+        assert frozen.weights.dtype == np.float64
+
+    def test_read_only_arrays(self):
+        with pytest.raises(ValueError):
+            graph().freeze().indices[0] = 3
+
+    def test_node_ids(self):
+        frozen = graph().freeze()
+        assert frozen.node_name(frozen.node_id("D")) == "D"
+
+    def test_nodes(self):
+        assert graph().freeze().nodes == graph().nodes
+
+    def test_edges(self):
+        assert graph().freeze().edges == graph().edges
+
+    def test_children(self):
+        assert graph().freeze().children("C") == {"A", "D"}
+
+    def test_parents(self):
+        assert graph().freeze().parents("C") == {"A", "B", "E"}
+
+    def test_children_unknown_node(self):
+        with pytest.raises(NodeNotFound):
+            graph().freeze().children("Y")
+
+    def test_path_weight(self):
+        path = ["A", "C", "D", "E"]
+        assert graph().freeze().path_weight(path) == pytest.approx(2.5 * 1.3 * 3.4)
+
+    def test_path_weight_invalid_path(self):
+        with pytest.raises(ValueError):
+            graph().freeze().path_weight(["A", "E"])
+
+    def test_find_paths(self):
+        frozen = graph().freeze()
+        for start in ["A", "B", "C", "D", "E"]:
+            for end in ["A", "B", "C", "D", "E", "Z"]:
+                assert set(map(tuple, frozen.find_paths(start, end))) == set(
+                    map(tuple, graph().find_paths(start, end))
+                )
+
+    def test_node_cycles(self):
+        assert set(graph().freeze().get_node_cycles("C")) == set(
+            graph().get_node_cycles("C")
+        )
+
+    def test_dijkstra(self):
+        result = Dijkstra(additive_graph().freeze(), "A").shortest_path("A", "C")
+        assert result.path == ["A", "B", "D", "F", "C"]
+        assert result.weight == 12
+
+    def test_vector_weights(self):
+        frozen = vector_graph().freeze()
+        assert frozen.weights.shape == (2, 2)
+        assert np.allclose(frozen.path_weight(["A", "B", "C"]), [-4.0, 3.3])
+
+    def test_thaw(self):
+        assert graph().freeze().thaw() == graph()
+
+    def test_freeze_bad_defined_graph(self):
+        with pytest.raises(ValueError):
+            WeightedDirectedGraph({"A"}, {WeightedDirectedEdge("A", "B", 7)}).freeze()
+
+    def test_edge_lookup(self):
+        frozen = graph().freeze()
+        assert frozen.has_edge("D", "E")
+        assert not frozen.has_edge("E", "D")
+        assert frozen.weight("D", "E") == 3.4
+        assert frozen.get_edge("D", "E") == WeightedDirectedEdge("D", "E", 3.4)
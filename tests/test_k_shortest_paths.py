@@ -0,0 +1,109 @@
+import random
+import pytest
+from pywgraph import (
+    WeightedDirectedGraph,
+    CommonGroups,
+    KShortestPaths,
+    k_shortest_paths,
+    NodeNotFound,
+)
+
+
+def additive_graph() -> WeightedDirectedGraph:
+    dictionary: dict[str, dict[str, float]] = {
+        "A": {"B": 1, "C": 4, "D": 2},
+        "B": {"C": 2, "E": 5},
+        "C": {"E": 1, "A": 3},
+        "D": {"C": 1, "E": 6},
+        "E": {"B": 1},
+        "Z": {},
+    }
+    return WeightedDirectedGraph.from_dict(dictionary, CommonGroups.RealAdditive)
+
+
+def random_graph(seed: int) -> WeightedDirectedGraph:
+    rng = random.Random(seed)
+    tuples = [
+        (f"n{i}", f"n{j}", rng.randint(1, 9))
+        for i in range(8)
+        for j in range(8)
+        if i != j and rng.random() < 0.35
+    ]
+    return WeightedDirectedGraph.from_tuples(tuples, CommonGroups.RealAdditive)
+
+
+def all_simple_path_weights(graph: WeightedDirectedGraph, start: str, end: str) -> list[float]:
+    return sorted(graph.path_weight(path) for path in graph.find_paths(start, end))
+
+
+class TestKShortestPaths:
+
+    def test_paths_in_order(self):
+        results = list(k_shortest_paths(additive_graph(), "A", "E", 10))
+        assert [result.weight for result in results] == [4, 4, 5, 6, 8]
+        assert results[0].path in (["A", "B", "C", "E"], ["A", "D", "C", "E"])
+        assert {tuple(result.path) for result in results[:2]} == {
+            ("A", "B", "C", "E"),
+            ("A", "D", "C", "E"),
+        }
+
+    def test_weights_match_paths(self):
+        graph = additive_graph()
+        for result in k_shortest_paths(graph, "A", "E", 10):
+            assert graph.path_weight(result.path) == result.weight
+            assert len(set(result.path)) == len(result.path)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_same_as_sorted_find_paths(self, seed):
+        graph = random_graph(seed)
+        expected = all_simple_path_weights(graph, "n0", "n1")
+        results = list(k_shortest_paths(graph, "n0", "n1", len(expected) + 5))
+        assert [result.weight for result in results] == expected
+        assert len({tuple(result.path) for result in results}) == len(results)
+
+    def test_is_lazy(self):
+        results = k_shortest_paths(additive_graph(), "A", "E", 3)
+        assert not isinstance(results, list)
+        assert len(list(results)) == 3
+
+    def test_incremental(self):
+        finder = KShortestPaths(additive_graph(), "A", "E")
+        first_two = finder.paths(2)
+        spur_searches = len(finder._spur_cache)
+        assert finder.paths(2) == first_two
+        assert len(finder._spur_cache) == spur_searches
+        assert finder.paths(3)[:2] == first_two
+
+    def test_finder_kept_until_the_graph_changes(self):
+        graph = additive_graph()
+        first = list(k_shortest_paths(graph, "A", "E", 2))
+        assert list(k_shortest_paths(graph, "A", "E", 3))[:2] == first
+        graph.add_edge("A", "E", 0.5, inplace=True)
+        assert next(k_shortest_paths(graph, "A", "E", 1)).path == ["A", "E"]
+
+    def test_finders_kept_are_bounded(self):
+        graph = random_graph(0)
+        nodes = sorted(graph.nodes)
+        for start in nodes:
+            for end in nodes:
+                list(k_shortest_paths(graph, start, end, 2))
+        finders = graph._cache()[("k_shortest_paths",)]
+        assert len(finders) < len(nodes) ** 2
+        assert list(finders)[-1] == (nodes[-1], nodes[-1])
+
+    def test_unreachable(self):
+        assert list(k_shortest_paths(additive_graph(), "A", "Z", 3)) == []
+
+    def test_frozen_graph(self):
+        graph = additive_graph()
+        frozen_results = list(k_shortest_paths(graph.freeze(), "A", "E", 10))
+        results = list(k_shortest_paths(graph, "A", "E", 10))
+        assert [result.weight for result in frozen_results] == [
+            result.weight for result in results
+        ]
+
+    def test_node_not_found(self):
+        with pytest.raises(NodeNotFound):
+            k_shortest_paths(additive_graph(), "A", "Y", 3)
+        with pytest.raises(NodeNotFound):
+            KShortestPaths(additive_graph(), "Y", "A")
@@ -0,0 +1,93 @@
+import pytest
+from pywgraph import WeightedDirectedGraph, NodeIndex, NodeNotFound
+
+
+def graph() -> WeightedDirectedGraph:
+    dictionary: dict[str, dict[str, float]] = {
+        "A": {"B": 1.0, "C": 2.5},
+        "B": {"C": 2.5},
+        "C": {"A": 1 / 2.5, "D": 1.3},
+        "D": {"E": 3.4},
+        "E": {"C": 1 / (1.3 * 3.4), "A": 13.0},
+        "Z": {},
+    }
+    return WeightedDirectedGraph.from_dict(dictionary)
+
+
+class TestNodeIndex:
+
+    def test_ids_in_insertion_order(self):
+        index = NodeIndex(["A", "B", "C"])
+        assert [index.id(node) for node in "ABC"] == [0, 1, 2]
+        assert index.names([2, 0]) == ["C", "A"]
+        assert list(index) == ["A", "B", "C"]
+        assert len(index) == 3
+
+    def test_add_existing_node(self):
+        index = NodeIndex(["A", "B"])
+        assert index.add("A") == 0
+        assert index.add("C") == 2
+        assert len(index) == 3
+
+    def test_unknown_nodes(self):
+        index = NodeIndex(["A"])
+        assert "A" in index
+        assert "B" not in index
+        with pytest.raises(NodeNotFound):
+            index.id("B")
+        with pytest.raises(NodeNotFound):
+            index.ids(["A", "B", "C"])
+
+
+class TestGraphNodeIndex:
+
+    def test_adjacency_keyed_by_ids(self):
+        g = graph()
+        index = g._index
+        assert set(index) == g.nodes
+        assert {index.name(node) for node in g._children[index.id("A")]} == {"B", "C"}
+
+    def test_variants_share_index(self):
+        g = graph()
+        new_graph = g.add_node("Y", inplace=False)
+        assert new_graph._index is g._index
+        assert "Y" in g._index
+        assert "Y" not in g.nodes
+
+    def test_deleted_nodes_keep_their_id(self):
+        g = graph()
+        a_id = g._index.id("A")
+        g.delete_node("A", inplace=True)
+        g.add_node("A", inplace=True)
+        assert g._index.id("A") == a_id
+        assert g.children("A") == set()
+
+    def test_deleted_nodes_not_in_results(self):
+        g = graph()
+        new_graph = g.delete_node("D", inplace=False)
+        assert new_graph.is_well_defined
+        assert new_graph.parents("E") == set()
+        assert new_graph.find_paths("A", "E") == []
+        assert g.find_paths("A", "E") == [["A", "C", "D", "E"], ["A", "B", "C", "D", "E"]]
+
+    def test_equality_with_different_indexes(self):
+        g = graph()
+        other = WeightedDirectedGraph(set(reversed(sorted(g.nodes))), set(g.edges), g.group)
+        assert g == other
+        other.delete_edge("A", "B", inplace=True)
+        other.add_edge("A", "B", 2.0, inplace=True)
+        assert g != other
+
+    def test_cycles_unique(self):
+        cycles = graph().cycles
+        assert len(cycles) == len({tuple(cycle.canonic_representation) for cycle in cycles})
+
+    def test_node_cycles_unknown_node(self):
+        with pytest.raises(NodeNotFound):
+            graph().get_node_cycles("X")
+
+    def test_frozen_index(self):
+        frozen = graph().delete_node("Z", inplace=False).freeze()
+        assert frozen.node_names == ["A", "B", "C", "D", "E"]
+        assert frozen.node_index.id("C") == 2
+        assert frozen.thaw() == graph().delete_node("Z", inplace=False)
@@ -0,0 +1,92 @@
+import pytest
+import pywgraph
+from pywgraph import WeightedDirectedGraph, ParallelPathFinder, NodeNotFound
+
+
+def graph() -> WeightedDirectedGraph:
+    dictionary: dict[str, dict[str, float]] = {
+        "A": {"B": 1.0, "C": 2.5},
+        "B": {"C": 2.5},
+        "C": {"A": 1 / 2.5, "D": 1.3},
+        "D": {"E": 3.4},
+        "E": {"C": 1 / (1.3 * 3.4), "A": 13.0},
+        "Z": {},
+    }
+    return WeightedDirectedGraph.from_dict(dictionary)
+
+
+@pytest.fixture(scope="module")
+def finder():
+    with ParallelPathFinder(graph(), workers=2) as path_finder:
+        yield path_finder
+
+
+class TestParallelPathFinder:
+
+    @pytest.mark.parametrize(
+        "start, end, kwargs",
+        [
+            ("A", "E", {}),
+            ("A", "E", {"general_max_visitations": 2}),
+            ("C", "C", {"specific_max_visitations": {"C": 2}}),
+            ("A", "A", {"general_max_visitations": 2}),
+            ("A", "Z", {}),
+            ("A", "D", {"general_max_visitations": 2, "max_weight": 5.0}),
+        ],
+    )
+    def test_same_as_find_paths(self, finder, start, end, kwargs):
+        parallel_paths = finder.find_paths(start, end, **kwargs)
+        serial_paths = graph().find_paths(start, end, **kwargs)
+        assert sorted(map(tuple, parallel_paths)) == sorted(map(tuple, serial_paths))
+        assert [len(path) for path in parallel_paths] == sorted(len(path) for path in parallel_paths)
+
+    def test_prefix_depth(self):
+        with ParallelPathFinder(graph(), workers=2, prefix_depth=3) as path_finder:
+            parallel_paths = path_finder.find_paths("A", "E", general_max_visitations=2)
+        serial_paths = graph().find_paths("A", "E", general_max_visitations=2)
+        assert sorted(map(tuple, parallel_paths)) == sorted(map(tuple, serial_paths))
+
+    def test_max_paths(self, finder):
+        paths = finder.find_paths("A", "E", general_max_visitations=2, max_paths=3)
+        assert len(paths) == 3
+        assert all(path[0] == "A" and path[-1] == "E" for path in paths)
+
+    def test_max_iter(self, finder):
+        with pytest.warns(Warning):
+            paths = finder.find_paths("A", "E", general_max_visitations=3, max_iter=20)
+        assert len(paths) < len(graph().find_paths("A", "E", general_max_visitations=3))
+
+    @pytest.mark.parametrize("max_iter", [5, 20, 40])
+    def test_max_iter_bounds_the_work(self, max_iter):
+        with ParallelPathFinder(graph(), workers=2, prefix_depth=2) as path_finder:
+            with pytest.warns(Warning):
+                path_finder.find_paths("A", "E", general_max_visitations=3, max_iter=max_iter)
+            assert path_finder.last_search_stats.expanded <= max_iter - 1
+
+    def test_max_iter_independent_of_workers(self):
+        kwargs = {"general_max_visitations": 3, "max_iter": 40}
+        with pytest.warns(Warning):
+            with ParallelPathFinder(graph(), workers=1) as path_finder:
+                one_worker_paths = path_finder.find_paths("A", "E", **kwargs)
+        with pytest.warns(Warning):
+            with ParallelPathFinder(graph(), workers=3) as path_finder:
+                three_workers_paths = path_finder.find_paths("A", "E", **kwargs)
+        assert one_worker_paths == three_workers_paths
+
+    def test_frozen_graph(self):
+        with ParallelPathFinder(graph().freeze(), workers=2) as path_finder:
+            parallel_paths = path_finder.find_paths("A", "E", general_max_visitations=2)
+        serial_paths = graph().find_paths("A", "E", general_max_visitations=2)
+        assert sorted(map(tuple, parallel_paths)) == sorted(map(tuple, serial_paths))
+
+    def test_unknown_node(self, finder):
+        with pytest.raises(NodeNotFound):
+            finder.find_paths("A", "X")
+
+    def test_bad_prefix_depth(self):
+        with pytest.raises(ValueError):
+            ParallelPathFinder(graph(), prefix_depth=0)
+
+    def test_exports(self):
+        for name in ["multiprocessing", "warnings", "ProcessPoolExecutor"]:
+            assert not hasattr(pywgraph, name)
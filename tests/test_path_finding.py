@@ -1,5 +1,5 @@
 import pytest
-from pywgraph import WeightedDirectedGraph, NodeNotFound
+from pywgraph import WeightedDirectedGraph, CommonGroups, NodeNotFound
 
 
 def graph() -> WeightedDirectedGraph:
@@ -84,6 +84,128 @@ class TestPathFinding:
         for node in graph().nodes:
             assert graph().find_paths(node, node, max_paths=1)[0] == [node]
 
+    # region Lazy path finding tests
+    @pytest.mark.parametrize(
+        "start, end, kwargs",
+        [
+            ("A", "E", {}),
+            ("A", "E", {"general_max_visitations": 2}),
+            ("C", "C", {"specific_max_visitations": {"C": 2}}),
+            ("A", "A", {"general_max_visitations": 2}),
+            ("B", "A", {"specific_max_visitations": {"C": 2}}),
+            ("A", "Z", {}),
+        ],
+    )
+    def test_iter_paths_same_as_find_paths(self, start, end, kwargs):
+        found_paths = graph().find_paths(start, end, **kwargs)
+        iterated_paths = [path for path, _ in graph().iter_paths(start, end, **kwargs)]
+        assert len(iterated_paths) == len(found_paths)
+        assert set(map(tuple, iterated_paths)) == set(map(tuple, found_paths))
+
+    def test_iter_paths_weights(self):
+        for path, weight in graph().iter_paths("A", "E", general_max_visitations=2):
+            assert weight == pytest.approx(graph().path_weight(path))
+
+    def test_iter_paths_max_weight(self):
+        kwargs = {"general_max_visitations": 2, "max_weight": 5.0}
+        found_paths = graph().find_paths("A", "D", **kwargs)
+        iterated = list(graph().iter_paths("A", "D", **kwargs))
+        assert {tuple(path) for path, _ in iterated} == set(map(tuple, found_paths))
+        assert all(weight <= 5.0 for _, weight in iterated)
+        assert list(graph().iter_paths("A", "D", max_weight=3.0)) == []
+        assert graph().find_paths("A", "D", max_weight=3.0) == []
+
+    def test_iter_paths_is_lazy(self):
+        paths = graph().iter_paths("A", "A", general_max_visitations=3)
+        assert next(paths) == (["A"], 1.0)
+        assert len(next(paths)[0]) > 1
+
+    def test_iter_paths_self_node(self):
+        assert list(graph().iter_paths("Z", "Z")) == [(["Z"], 1.0)]
+
+    def test_iter_paths_unknown_node(self):
+        with pytest.raises(NodeNotFound):
+            graph().iter_paths("A", "F")
+
+    # region Pruning tests
+    def test_pruned_branches(self):
+        pruning_graph = graph().add_edge("A", "Z", 1.0)
+        paths = pruning_graph.find_paths("A", "E", general_max_visitations=2)
+        assert set(map(tuple, paths)) == set(map(tuple, graph().find_paths("A", "E", general_max_visitations=2)))
+        assert all("Z" not in path for path in paths)
+        assert pruning_graph.last_search_stats.pruned > 0
+        assert pruning_graph.last_search_stats.expanded > 0
+
+    def test_no_expansion_after_target(self):
+        g = graph()
+        assert g.find_paths("D", "E") == [["D", "E"]]
+        assert g.last_search_stats == (2, 2)
+
+    def test_node_cycles_stats(self):
+        g = graph()
+        g.get_node_cycles("A")
+        assert g.last_search_stats.pruned > 0
+
+    def test_reachability_cache_follows_changes(self):
+        g = graph()
+        assert g.find_paths("A", "Z") == []
+        g.add_edge("E", "Z", 1.0, inplace=True)
+        assert g.find_paths("A", "Z") == [["A", "C", "D", "E", "Z"], ["A", "B", "C", "D", "E", "Z"]]
+        g.delete_edge("E", "Z", inplace=True)
+        assert g.find_paths("A", "Z") == []
+        assert list(g.iter_paths("A", "Z")) == []
+
+    def test_reachability_cache_of_views(self):
+        g = graph()
+        view = g.bidirectional_view()
+        assert view.find_paths("A", "Z") == []
+        g.add_edge("Z", "E", 1.0, inplace=True)
+        assert ["A", "E", "Z"] in view.find_paths("A", "Z")
+
+    # region Branch and bound tests
+    def test_bound_pruning_additive(self):
+        g = WeightedDirectedGraph.from_dict(
+            {"A": {"B": 1, "C": 5}, "B": {"T": 100}, "C": {"T": 5}, "T": {}},
+            CommonGroups.RealAdditive,
+        )
+        assert g.find_paths("A", "T", max_weight=20) == [["A", "C", "T"]]
+        assert g.last_search_stats == (3, 1)
+        assert [path for path, _ in g.iter_paths("A", "T", max_weight=20)] == [["A", "C", "T"]]
+        assert g.find_paths("A", "T", max_weight=10) == [["A", "C", "T"]]
+        assert g.find_paths("A", "T", max_weight=9.9) == []
+
+    def test_bound_pruning_multiplicative(self):
+        g = WeightedDirectedGraph.from_dict(
+            {"A": {"B": 1.5, "C": 2.0}, "B": {"T": 10.0}, "C": {"T": 2.5}, "T": {}}
+        )
+        assert g.find_paths("A", "T", max_weight=5.0) == [["A", "C", "T"]]
+        assert g.last_search_stats.pruned == 1
+        assert g._completion_bounds(g._index.id("T"))[g._index.id("A")] == pytest.approx(5.0)
+
+    def test_bound_pruning_same_paths(self):
+        g = WeightedDirectedGraph.from_dict(
+            {
+                "A": {"B": 2, "D": 8},
+                "B": {"D": 5, "E": 6, "A": 1},
+                "D": {"E": 3, "F": 2},
+                "E": {"F": 1, "C": 9, "B": 2},
+                "F": {"C": 3},
+                "C": {"A": 4},
+            },
+            CommonGroups.RealAdditive,
+        )
+        all_paths = g.find_paths("A", "C", general_max_visitations=2)
+        for max_weight in [5, 10, 13, 20, 30]:
+            expected = {tuple(path) for path in all_paths if g.path_weight(path) <= max_weight}
+            kwargs = {"general_max_visitations": 2, "max_weight": max_weight}
+            assert set(map(tuple, g.find_paths("A", "C", **kwargs))) == expected
+            assert {tuple(path) for path, _ in g.iter_paths("A", "C", **kwargs)} == expected
+
+    def test_no_bounds_below_identity(self):
+        g = graph()
+        assert g._completion_bounds(g._index.id("E")) is None
+        assert g.find_paths("A", "E", max_weight=100.0) == graph().find_paths("A", "E")
+
     # region Path weights tests
     def test_path_weight_ab(self):
         path = ["A", "B"]
@@ -105,6 +227,25 @@ class TestPathFinding:
         path = ["Z"]
         assert graph().path_weight(path) == 1.0
 
+    def test_path_weights(self):
+        paths = [["A", "C", "D", "E"], [], ["Z"], ["A", "B"], ["A", "B", "C", "D", "E", "C", "A"]]
+        weights = graph().path_weights(paths, 0.0)
+        assert weights == pytest.approx([2.5 * 1.3 * 3.4, 0.0, 1.0, 1.0, 1.0])
+
+    def test_path_weights_match_path_weight(self):
+        paths = graph().find_paths("A", "E", general_max_visitations=2)
+        assert graph().path_weights(paths) == pytest.approx(
+            [graph().path_weight(path) for path in paths]
+        )
+
+    def test_path_weights_invalid_path(self):
+        with pytest.raises(ValueError):
+            graph().path_weights([["A", "B"], ["A", "E"]])
+
+    def test_path_weights_unknown_node(self):
+        with pytest.raises(NodeNotFound):
+            graph().path_weights([["A", "B"], ["A", "F"]])
+
     @pytest.mark.deprecated
     def test_weight_between_ab(self):
         assert graph().weight_between("A", "B") == 1.0
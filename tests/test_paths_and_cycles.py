@@ -41,4 +41,13 @@ class TestPathsAndCycles:
 
     def test_path_is_not_cycle(self):
         assert not Path(list_path()).is_cycle
-    
\ No newline at end of file
+    
+    def test_cycle_hash(self):
+        assert hash(Cycle(list_cycle())) == hash(Cycle(list_equivalent_cycle()))
+
+    def test_cycle_canonic_representation(self):
+        assert Cycle(list_equivalent_cycle()).canonic_representation == ["A", "B", "C"]
+
+    def test_slots(self):
+        assert not hasattr(Path(list_path()), "__dict__")
+        assert not hasattr(Cycle(list_cycle()), "__dict__")
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+from pywgraph import (
+    WeightedDirectedGraph,
+    FrozenWeightedDirectedGraph,
+    CommonGroups,
+    Group,
+)
+
+
+def graph() -> WeightedDirectedGraph:
+    dictionary: dict[str, dict[str, float]] = {
+        "A": {"B": 1.0, "C": 2.5},
+        "B": {"C": 2.5},
+        "C": {"A": 1 / 2.5, "D": 1.3},
+        "D": {"E": 3.4},
+        "E": {"C": 1 / (1.3 * 3.4), "A": 13.0},
+        "Z": {},
+    }
+    return WeightedDirectedGraph.from_dict(dictionary)
+
+
+def string_group() -> Group:
+    return Group(
+        name="Strings with concatenation",
+        identity="",
+        operation=lambda x, y: x + y,
+        inverse_function=lambda x: x,
+    )
+
+
+class TestStorage:
+
+    def test_save_load(self, tmp_path):
+        path = str(tmp_path / "graph.pwg")
+        graph().save(path)
+        loaded_graph = WeightedDirectedGraph.load(path)
+        assert loaded_graph == graph()
+        assert loaded_graph.group is CommonGroups.RealMultiplicative
+        assert isinstance(loaded_graph.weight("A", "C"), float)
+
+    def test_load_without_mmap(self, tmp_path):
+        path = str(tmp_path / "graph.pwg")
+        graph().save(path)
+        assert WeightedDirectedGraph.load(path, mmap=False) == graph()
+
+    def test_loaded_graph_is_mutable(self, tmp_path):
+        path = str(tmp_path / "graph.pwg")
+        graph().save(path)
+        loaded_graph = WeightedDirectedGraph.load(path)
+        loaded_graph.add_edge("Z", "A", 3.0, inplace=True)
+        assert loaded_graph.parents("A") == {"C", "E", "Z"}
+
+    def test_frozen_load_is_memory_mapped(self, tmp_path):
+        path = str(tmp_path / "graph.pwg")
+        frozen = graph().freeze()
+        frozen.save(path)
+        loaded_graph = FrozenWeightedDirectedGraph.load(path)
+        assert isinstance(loaded_graph.indices, np.memmap)
+        assert not loaded_graph.weights.flags.writeable
+        assert loaded_graph == frozen
+        assert loaded_graph.parents("C") == {"A", "B", "E"}
+        assert loaded_graph.find_paths("A", "E") == frozen.find_paths("A", "E")
+
+    def test_vector_group(self, tmp_path):
+        path = str(tmp_path / "graph.pwg")
+        group = CommonGroups.RealsNAdditive(2)
+        vector_graph = WeightedDirectedGraph.from_arrays(
+            np.array(["A", "B"]), np.array(["B", "C"]), np.array([[1.0, 2.0], [3.0, 4.0]]), group
+        )
+        vector_graph.save(path)
+        loaded_graph = WeightedDirectedGraph.load(path)
+        assert loaded_graph.group.name == group.name
+        assert np.array_equal(loaded_graph.path_weight(["A", "B", "C"]), np.array([4.0, 6.0]))
+
+    def test_object_weights_are_pickled(self, tmp_path):
+        path = str(tmp_path / "graph.pwg")
+        string_graph = WeightedDirectedGraph.from_dict(
+            {"A": {"B": "x"}, "B": {"C": "yz"}, "C": {}}, string_group()
+        )
+        string_graph.save(path)
+        loaded_graph = WeightedDirectedGraph.load(path, group=string_group())
+        assert loaded_graph.path_weight(["A", "B", "C"]) == "xyz"
+
+    def test_unknown_group(self, tmp_path):
+        path = str(tmp_path / "graph.pwg")
+        WeightedDirectedGraph.from_dict({"A": {"B": "x"}, "B": {}}, string_group()).save(path)
+        with pytest.raises(ValueError):
+            WeightedDirectedGraph.load(path)
+        with pytest.raises(ValueError):
+            WeightedDirectedGraph.load(path, group=CommonGroups.RealAdditive)
+
+    def test_not_a_graph_file(self, tmp_path):
+        path = tmp_path / "graph.pwg"
+        path.write_bytes(b"not a graph")
+        with pytest.raises(ValueError):
+            WeightedDirectedGraph.load(str(path))
+
+    def test_newer_version(self, tmp_path):
+        path = tmp_path / "graph.pwg"
+        graph().save(str(path))
+        data = path.read_bytes().replace(b'"version": 1', b'"version": 9', 1)
+        path.write_bytes(data)
+        with pytest.raises(ValueError):
+            WeightedDirectedGraph.load(str(path))
@@ -20,4 +20,14 @@ class TestWeightedDirectedEdge:
         assert wedge().inverse == WeightedDirectedEdge("B", "A", 1/3.1415)
 
     def test_equal(self):
-        assert wedge() == WeightedDirectedEdge("A", "B", 3.1415)
\ No newline at end of file
+        assert wedge() == WeightedDirectedEdge("A", "B", 3.1415)
+
+    def test_not_equal_weight(self):
+        assert wedge() != WeightedDirectedEdge("A", "B", 2.0)
+
+    def test_hash(self):
+        edge = wedge()
+        assert hash(edge) == hash(edge) == hash(WeightedDirectedEdge("A", "B", 3.1415))
+
+    def test_slots(self):
+        assert not hasattr(wedge(), "__dict__")
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from pywgraph import (
     WeightedDirectedGraph, 
@@ -5,7 +6,9 @@ from pywgraph import (
     NodeAlreadyExists, 
     NodeNotFound,
     EdgeAlreadyExists,
-    EdgeNotFound
+    EdgeNotFound,
+    EdgesAlreadyExist,
+    EdgesNotFound,
 )
 
 
@@ -292,4 +295,269 @@ class TestWeightedDirectedGraph:
     def test_delete_edge_bad_edges(self):
         graph_copy = graph()
         with pytest.raises(EdgeNotFound):
-            graph_copy.delete_edge(start="C", end="B")
\ No newline at end of file
+            graph_copy.delete_edge(start="C", end="B")
+
+    # region Testing adjacency
+    def test_children_with_weight(self):
+        assert graph().children_with_weight("A") == {("B", 7), ("C", 9)}
+
+    def test_adjacency_add_edge(self):
+        new_graph = graph().add_edge("C", "A", 10)
+        assert new_graph.children("C") == {"A"}
+        assert new_graph.parents("A") == {"C"}
+
+    def test_adjacency_add_edge_keeps_original(self):
+        graph_copy = graph()
+        graph_copy.add_edge("C", "A", 10)
+        assert graph_copy.children("C") == set()
+        assert graph_copy.parents("A") == set()
+
+    def test_adjacency_delete_node_inplace(self):
+        graph_copy = graph()
+        graph_copy.delete_node("B", inplace=True)
+        assert graph_copy.children("A") == {"C"}
+        assert graph_copy.parents("C") == {"A"}
+
+    def test_adjacency_delete_edge(self):
+        new_graph = graph().delete_edge("A", "C")
+        assert new_graph.children("A") == {"B"}
+        assert new_graph.parents("C") == {"B"}
+
+    def test_adjacency_reverse_edges(self):
+        new_graph = graph().add_reverse_edges()
+        assert new_graph.children("C") == {"A", "B"}
+        assert new_graph.parents("A") == {"B", "C"}
+
+    # region Testing structural sharing
+    def test_variant_does_not_modify_base(self):
+        base = graph()
+        variant = base.add_edge("C", "A", 10).delete_edge("A", "B").delete_node("B")
+        assert base == graph()
+        assert variant == WeightedDirectedGraph.from_dict({"A": {"C": 9}, "C": {"A": 10}})
+
+    def test_base_inplace_does_not_modify_variant(self):
+        base = graph()
+        variant = base.add_node("D")
+        base.add_edge("C", "A", 10, inplace=True)
+        base.delete_edge("A", "B", inplace=True)
+        assert variant.children("C") == set()
+        assert variant.children("A") == {"B", "C"}
+
+    def test_sibling_variants(self):
+        base = graph()
+        first = base.delete_edge("A", "B")
+        second = base.add_edge("B", "A", 3)
+        assert first.children("A") == {"C"}
+        assert second.children("A") == {"B", "C"}
+        assert second.parents("A") == {"B"}
+        assert base.parents("A") == set()
+
+    def test_variant_edges(self):
+        variant = graph().delete_edge("B", "C")
+        assert variant.edges == {
+            WeightedDirectedEdge("A", "B", 7),
+            WeightedDirectedEdge("A", "C", 9),
+        }
+
+    # region Testing bulk methods
+    def test_add_nodes_from(self):
+        new_graph = graph().add_nodes_from(["D", "E", "D"])
+        assert new_graph.nodes == {"A", "B", "C", "D", "E"}
+        assert new_graph.children("D") == set()
+
+    def test_add_nodes_from_existing(self):
+        graph_copy = graph()
+        with pytest.raises(NodeAlreadyExists):
+            graph_copy.add_nodes_from(["D", "A", "B"], inplace=True)
+        assert graph_copy == graph()
+
+    def test_delete_nodes_from(self):
+        new_graph = graph().delete_nodes_from(["A", "B"])
+        assert new_graph == WeightedDirectedGraph.from_dict({"C": {}})
+
+    def test_delete_nodes_from_inplace(self):
+        graph_copy = graph()
+        graph_copy.delete_nodes_from(["B"], inplace=True)
+        assert graph_copy == WeightedDirectedGraph.from_dict({"A": {"C": 9}, "C": {}})
+
+    def test_delete_nodes_from_missing(self):
+        with pytest.raises(NodeNotFound):
+            graph().delete_nodes_from(["A", "S"])
+
+    def test_add_edges_from(self):
+        new_graph = graph().add_edges_from(
+            [("C", "A", 10), WeightedDirectedEdge("C", "B", 2), ("C", "A", 10)]
+        )
+        update_dict = _dict_graph.copy()
+        update_dict["C"] = {"A": 10, "B": 2}
+        assert new_graph == WeightedDirectedGraph.from_dict(update_dict)
+        assert new_graph.parents("A") == {"C"}
+
+    def test_add_edges_from_inplace(self):
+        graph_copy = graph()
+        graph_copy.add_edges_from([("C", "A", 10), ("B", "A", 1)], inplace=True)
+        assert graph_copy.children("C") == {"A"}
+        assert graph_copy.parents("A") == {"B", "C"}
+        assert WeightedDirectedEdge("C", "A", 10) in graph_copy.edges
+
+    def test_add_edges_from_conflicts(self):
+        graph_copy = graph()
+        with pytest.raises(EdgesAlreadyExist) as error:
+            graph_copy.add_edges_from(
+                [("A", "B", 1), ("C", "A", 1), ("C", "A", 2), ("C", "B", 1)],
+                inplace=True,
+            )
+        assert error.value.edges == {("A", "B"), ("C", "A")}
+        assert graph_copy == graph()
+
+    def test_add_edges_from_missing_nodes(self):
+        with pytest.raises(NodeNotFound):
+            graph().add_edges_from([("C", "S", 1), ("T", "A", 1)])
+
+    def test_delete_edges_from(self):
+        new_graph = graph().delete_edges_from(
+            [("A", "B"), WeightedDirectedEdge("B", "C", 10)]
+        )
+        assert new_graph == WeightedDirectedGraph.from_dict(
+            {"A": {"C": 9}, "B": {}, "C": {}}
+        )
+
+    def test_delete_edges_from_missing(self):
+        graph_copy = graph()
+        with pytest.raises(EdgesNotFound) as error:
+            graph_copy.delete_edges_from([("A", "B"), ("C", "A"), ("B", "A")], inplace=True)
+        assert error.value.edges == {("C", "A"), ("B", "A")}
+        assert graph_copy == graph()
+
+    # region Testing edge lookup
+    def test_has_edge(self):
+        assert graph().has_edge("A", "B")
+        assert not graph().has_edge("B", "A")
+        assert not graph().has_edge("S", "A")
+
+    def test_get_edge(self):
+        assert graph().get_edge("B", "C") == WeightedDirectedEdge("B", "C", 10)
+
+    def test_get_edge_is_indexed(self):
+        graph_copy = graph()
+        assert graph_copy.get_edge("A", "C") is graph_copy.get_edge("A", "C")
+
+    def test_get_edge_not_found(self):
+        with pytest.raises(EdgeNotFound):
+            graph().get_edge("C", "A")
+
+    def test_get_edge_bad_nodes(self):
+        with pytest.raises(NodeNotFound):
+            graph().get_edge("S", "A")
+
+    def test_weight(self):
+        assert graph().weight("A", "C") == 9
+
+    def test_weight_after_delete(self):
+        graph_copy = graph()
+        graph_copy.get_edge("A", "C")
+        graph_copy.delete_edge("A", "C", inplace=True)
+        graph_copy.add_edge("A", "C", 3, inplace=True)
+        assert graph_copy.get_edge("A", "C") == WeightedDirectedEdge("A", "C", 3)
+        assert graph_copy.weight("A", "C") == 3
+
+    def test_path_weight_repeated_edge(self):
+        new_graph = graph().add_edge("C", "A", 2)
+        assert new_graph.path_weight(["A", "C", "A", "C"]) == 9 * 2 * 9
+
+    # region from_arrays
+    def test_from_arrays(self):
+        new_graph = WeightedDirectedGraph.from_arrays(
+            np.array(["A", "A", "B"]), np.array(["B", "C", "C"]), np.array([7.0, 9.0, 10.0])
+        )
+        assert new_graph == graph()
+        assert new_graph.edges == graph().edges
+        assert new_graph.parents("C") == {"A", "B"}
+
+    def test_from_arrays_builds_edges_lazily(self):
+        new_graph = WeightedDirectedGraph.from_arrays(
+            np.array(["A", "A", "B"]), np.array(["B", "C", "C"]), np.array([7.0, 9.0, 10.0])
+        )
+        assert new_graph._edges is None
+        assert new_graph._edge_index == {}
+        assert new_graph.weight("B", "C") == 10
+        assert isinstance(new_graph.weight("B", "C"), float)
+
+    def test_from_arrays_extra_nodes(self):
+        new_graph = WeightedDirectedGraph.from_arrays(
+            np.array(["A"]), np.array(["B"]), np.array([7.0]), nodes=["Z"]
+        )
+        assert new_graph.nodes == {"A", "B", "Z"}
+        assert new_graph.children("Z") == set()
+        assert new_graph.is_well_defined
+
+    def test_from_arrays_vector_weights(self):
+        new_graph = WeightedDirectedGraph.from_arrays(
+            np.array(["A", "B"]), np.array(["B", "C"]), np.array([[1.0, 2.0], [3.0, 4.0]])
+        )
+        assert np.array_equal(new_graph.weight("A", "B"), np.array([1.0, 2.0]))
+        assert np.array_equal(new_graph.path_weight(["A", "B", "C"]), np.array([3.0, 8.0]))
+
+    def test_from_arrays_repeated_edges(self):
+        new_graph = WeightedDirectedGraph.from_arrays(
+            np.array(["A", "A", "B"]), np.array(["B", "B", "C"]), np.array([7.0, 7.0, 10.0])
+        )
+        assert len(new_graph.edges) == 2
+
+    def test_from_arrays_conflicting_edges(self):
+        with pytest.raises(EdgesAlreadyExist) as error:
+            WeightedDirectedGraph.from_arrays(
+                np.array(["A", "A", "B"]), np.array(["B", "B", "C"]), np.array([7.0, 8.0, 10.0])
+            )
+        assert error.value.edges == {("A", "B")}
+
+    def test_from_arrays_self_loop(self):
+        with pytest.raises(ValueError):
+            WeightedDirectedGraph.from_arrays(np.array(["A"]), np.array(["A"]), np.array([1.0]))
+
+    def test_from_arrays_bad_lengths(self):
+        with pytest.raises(ValueError):
+            WeightedDirectedGraph.from_arrays(np.array(["A"]), np.array(["B", "C"]), np.array([1.0]))
+
+    # region read_edgelist
+    def test_read_edgelist(self, tmp_path):
+        path = tmp_path / "edges.csv"
+        path.write_text("A,B,7\nA,C,9\n\n# comment\nB,C,10\n")
+        new_graph = WeightedDirectedGraph.read_edgelist(str(path))
+        assert new_graph == graph()
+        assert new_graph.is_well_defined
+
+    def test_read_edgelist_in_chunks(self, tmp_path):
+        path = tmp_path / "edges.csv"
+        path.write_text("A,B,7\nA,C,9\nA,B,7\nB,C,10\n")
+        new_graph = WeightedDirectedGraph.read_edgelist(str(path), chunk_size=1)
+        assert new_graph == graph()
+        assert new_graph.parents("C") == {"A", "B"}
+
+    def test_read_edgelist_columns_and_header(self, tmp_path):
+        path = tmp_path / "edges.tsv"
+        path.write_text("weight\tto\tfrom\n7\tB\tA\n9\tC\tA\n10\tC\tB\n")
+        new_graph = WeightedDirectedGraph.read_edgelist(
+            str(path), delimiter="\t", columns=(2, 1, 0), weight_parser=int, header=True
+        )
+        assert new_graph == graph()
+        assert isinstance(new_graph.weight("A", "B"), int)
+
+    def test_read_edgelist_vector_weights(self, tmp_path):
+        path = tmp_path / "edges.csv"
+        path.write_text("A,B,1,2\nB,C,3,4\n")
+        new_graph = WeightedDirectedGraph.read_edgelist(str(path), columns=(0, 1, (2, 3)))
+        assert np.array_equal(new_graph.weight("B", "C"), np.array([3.0, 4.0]))
+
+    def test_read_edgelist_conflicting_edges(self, tmp_path):
+        path = tmp_path / "edges.csv"
+        path.write_text("A,B,7\nB,C,10\nA,B,8\n")
+        with pytest.raises(EdgesAlreadyExist):
+            WeightedDirectedGraph.read_edgelist(str(path), chunk_size=2)
+
+    # region Exports
+    def test_exports(self):
+        import pywgraph.graphs
+
+        for name in ["csv", "islice", "exp", "log", "heappush", "heappop"]:
+            assert not hasattr(pywgraph.graphs, name)
@@ -117,3 +117,28 @@ class TestWeightedDirectedGraphArrays:
             complete_dict, vector_group_addition()
         )
         assert filled_graph == addition_graph().add_reverse_edges()
+
+    # region Batch path weights
+    def test_path_weights_addition(self):
+        weights = addition_graph().path_weights([["A", "B", "C", "D"], ["A", "C"], ["D"]])
+        assert np.allclose(weights[0], [-5, 4.3])
+        assert np.allclose(weights[1], [3, 4])
+        assert np.allclose(weights[2], [0, 0])
+
+    def test_path_weights_ufunc(self):
+        group = vector_group_addition()
+        ufunc_group = Group(
+            name=group.name,
+            identity=group.identity,
+            operation=group.operation,
+            inverse_function=group.inverse_function,
+            hash_function=group.hash_function,
+            ufunc=np.add,
+        )
+        graph = WeightedDirectedGraph.from_dict(_array_dict_graph, ufunc_group)
+        paths = [["A", "B", "C", "D"], ["A", "C"], ["B", "D"]]
+        weights = graph.path_weights(paths)
+        assert all(
+            np.allclose(weight, addition_graph().path_weight(path))
+            for weight, path in zip(weights, paths)
+        )